@@ -14,6 +14,9 @@ from mcp_sdk.exceptions import (
     MCPResourceNotFoundError,
     MCPPermissionError,
     MCPConfigurationError,
+    MCPCircuitOpenError,
+    MCPUploadError,
+    MCPPayloadTooLargeError,
 )
 from mcp_sdk.server import MCPServer
 from mcp_sdk.server_config import ServerConfig
@@ -37,6 +40,9 @@ __all__ = [
     "MCPResourceNotFoundError",
     "MCPPermissionError",
     "MCPConfigurationError",
+    "MCPCircuitOpenError",
+    "MCPUploadError",
+    "MCPPayloadTooLargeError",
     "text",
     "image",
     "audio",
@@ -0,0 +1,207 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Dict, List, Optional
+
+
+@dataclass
+class EndpointStats:
+    """Load and health of one endpoint"""
+
+    endpoint: str
+    ewma_latency: Optional[float] = None
+    in_flight: int = 0
+    failures: int = 0
+    ejected_until: float = 0.0
+    requests: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stats to a dictionary."""
+        return {
+            "endpoint": self.endpoint,
+            "ewma_latency": self.ewma_latency,
+            "in_flight": self.in_flight,
+            "failures": self.failures,
+            "ejected": self.ejected_until > time.monotonic(),
+            "requests": self.requests,
+            "errors": self.errors,
+        }
+
+
+class EndpointBalancer:
+    """
+    Latency-aware load balancer over several endpoints.
+
+    Each request goes to the better of two endpoints picked at random
+    ("power of two choices"), scored by their exponentially weighted moving
+    average latency times the number of requests in flight. This avoids the
+    herding of always picking the single best endpoint while still steering
+    load away from slow or busy replicas.
+
+    Endpoints that fail ``failure_threshold`` times in a row, or fail a health
+    check, are ejected for ``ejection_time`` seconds and then reintroduced. If
+    every endpoint is ejected, all of them are used again rather than failing.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[str],
+        decay: float = 0.3,
+        initial_latency: float = 0.1,
+        failure_threshold: int = 5,
+        ejection_time: float = 30.0,
+    ):
+        """
+        Initialize the balancer.
+
+        Args:
+            endpoints: Base URLs of the replicas
+            decay: Weight of the newest latency sample in the moving average
+            initial_latency: Latency assumed for endpoints without samples
+            failure_threshold: Consecutive failures that eject an endpoint
+            ejection_time: Seconds an ejected endpoint is left out
+        """
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        if not 0 < decay <= 1:
+            raise ValueError("decay must be in (0, 1]")
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.decay = decay
+        self.initial_latency = initial_latency
+        self.failure_threshold = failure_threshold
+        self.ejection_time = ejection_time
+        self._stats: Dict[str, EndpointStats] = {}
+        for endpoint in endpoints:
+            endpoint = endpoint.rstrip("/")
+            self._stats.setdefault(endpoint, EndpointStats(endpoint))
+        self._lock = threading.Lock()
+
+    @property
+    def endpoints(self) -> List[str]:
+        """Get all endpoints, healthy or not"""
+        return list(self._stats)
+
+    def choose(
+        self,
+        exclude: Collection[str] = (),
+        available: Optional[Callable[[str], bool]] = None,
+    ) -> str:
+        """
+        Pick the endpoint for the next request.
+
+        Args:
+            exclude: Endpoints to avoid if others are available, e.g. those
+                already tried for this request
+            available: Optional check that rules an endpoint out for now,
+                e.g. because its circuit is open; ruled-out endpoints are only
+                picked if nothing else is left
+
+        Returns:
+            str: The chosen endpoint
+        """
+        unavailable = (
+            set()
+            if available is None
+            else {endpoint for endpoint in self._stats if not available(endpoint)}
+        )
+        with self._lock:
+            now = time.monotonic()
+            usable = [
+                stats
+                for stats in self._stats.values()
+                if stats.ejected_until <= now and stats.endpoint not in unavailable
+            ]
+            candidates = [stats for stats in usable if stats.endpoint not in exclude]
+            if not candidates:
+                candidates = usable
+            if not candidates:
+                candidates = [
+                    stats
+                    for stats in self._stats.values()
+                    if stats.ejected_until <= now
+                ]
+            if not candidates:
+                # Everything is ejected; spreading load beats refusing it
+                candidates = list(self._stats.values())
+
+            if len(candidates) == 1:
+                return candidates[0].endpoint
+            first, second = random.sample(candidates, 2)
+            return min(first, second, key=self._score).endpoint
+
+    def _score(self, stats: EndpointStats) -> float:
+        """Expected cost of sending one more request to an endpoint"""
+        latency = (
+            stats.ewma_latency
+            if stats.ewma_latency is not None
+            else self.initial_latency
+        )
+        return latency * (stats.in_flight + 1)
+
+    def start(self, endpoint: str) -> None:
+        """Record that a request to the endpoint was sent"""
+        with self._lock:
+            stats = self._stats[endpoint]
+            stats.in_flight += 1
+            stats.requests += 1
+
+    def finish(
+        self, endpoint: str, latency: float, success: Optional[bool] = True
+    ) -> None:
+        """
+        Record the outcome of a request to the endpoint.
+
+        Args:
+            endpoint: The endpoint
+            latency: Seconds the request took
+            success: False for transport errors and server errors, None for
+                requests that ended without an outcome, such as cancelled ones
+        """
+        with self._lock:
+            stats = self._stats[endpoint]
+            stats.in_flight = max(0, stats.in_flight - 1)
+            if success is None:
+                return
+
+            if stats.ewma_latency is None:
+                stats.ewma_latency = latency
+            else:
+                stats.ewma_latency += self.decay * (latency - stats.ewma_latency)
+
+            if success:
+                stats.failures = 0
+                return
+            stats.errors += 1
+            stats.failures += 1
+            if stats.failures >= self.failure_threshold:
+                self._eject(stats)
+
+    def mark_health(self, endpoint: str, healthy: bool) -> None:
+        """
+        Apply the result of a health check.
+
+        An unhealthy endpoint is ejected; a healthy one is reintroduced right
+        away.
+        """
+        with self._lock:
+            stats = self._stats[endpoint]
+            if healthy:
+                stats.failures = 0
+                stats.ejected_until = 0.0
+            else:
+                self._eject(stats)
+
+    def _eject(self, stats: EndpointStats) -> None:
+        stats.failures = 0
+        stats.ejected_until = time.monotonic() + self.ejection_time
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the load and health of every endpoint"""
+        with self._lock:
+            return {
+                endpoint: stats.to_dict() for endpoint, stats in self._stats.items()
+            }
@@ -0,0 +1,139 @@
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+# Type variables for batched items and their results
+I = TypeVar("I")
+O = TypeVar("O")
+
+
+class RequestBatcher(Generic[I, O]):
+    """
+    Coalesces individual submissions into batched calls.
+
+    Items submitted within ``max_delay`` seconds of the first pending item, or
+    until ``max_batch_size`` items are pending, are dispatched together through
+    a single call to ``dispatch``. Each submission gets its own future, so
+    results resolve independently.
+
+    The ``dispatch`` callable receives the items in submission order and must
+    return one result per item in the same order. A result that is an
+    exception instance is raised to that item's caller only; an exception
+    raised by ``dispatch`` itself fails every item in the batch.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[List[I]], Awaitable[List[Any]]],
+        max_batch_size: int = 32,
+        max_delay: float = 0.005,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            dispatch: Coroutine function that processes a batch of items
+            max_batch_size: Maximum number of items per batch
+            max_delay: Maximum seconds to hold an item before dispatching
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_delay < 0:
+            raise ValueError("max_delay cannot be negative")
+
+        self._dispatch = dispatch
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending: List[Tuple[I, "asyncio.Future[O]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of items waiting for the next batch"""
+        return len(self._pending)
+
+    async def submit(self, item: I) -> O:
+        """
+        Submit an item and wait for its individual result.
+
+        Args:
+            item: The item to add to the next batch
+
+        Returns:
+            The result for this item
+        """
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[O]" = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self.flush)
+
+        return await future
+
+    def flush(self) -> None:
+        """Dispatch all pending items now, without waiting for the window"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._pending:
+            batch = self._pending[: self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size :]
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[I, "asyncio.Future[O]"]]) -> None:
+        """Dispatch a batch and resolve the futures of its items"""
+        # Callers that were cancelled while waiting are dropped from the batch
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+
+        try:
+            results = await self._dispatch([item for item, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if len(results) != len(batch):
+            error = RuntimeError(
+                f"Batch dispatch returned {len(results)} results for {len(batch)} items"
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def aclose(self) -> None:
+        """Flush pending items and wait for in-flight batches to finish"""
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
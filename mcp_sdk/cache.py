@@ -0,0 +1,413 @@
+import copy
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import anyio
+
+from .models import Commit, ServerOptions
+from .projection import resolve_model
+from .resources import ResourceResponse
+from .shared._pydantic_utils import (
+    model_copy,
+    model_dump,
+    model_dump_json,
+    model_validate_json,
+)
+
+# Full SHA-1 or SHA-256 object names; anything shorter may be ambiguous or a ref
+_FULL_SHA = re.compile(r"^(?:[0-9a-f]{40}|[0-9a-f]{64})$")
+
+
+@dataclass
+class CacheStats:
+    """Counters for a commit cache"""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes_used: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stats to a dictionary."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": self.entries,
+            "bytes_used": self.bytes_used,
+            "hit_ratio": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+
+class CommitCache:
+    """
+    Two-tier content-addressed cache for commit responses.
+
+    Commits are immutable by SHA, so a response fetched once for a given
+    ``(sha, ServerOptions)`` pair can be served forever. The first tier is an
+    in-memory LRU bounded by an approximate byte budget that holds parsed
+    models, so hits skip both the network and validation. The optional second
+    tier is a SQLite file that survives restarts; disk hits are validated once
+    and promoted to memory.
+
+    The cache keeps its own copy of every stored response and hands out deep
+    copies, so callers may modify what they get. ``aget`` and ``aput`` run
+    the on-disk tier in a worker thread and are meant for async code; ``get``
+    and ``put`` block on it.
+
+    Only full hexadecimal SHAs are cached, since short SHAs and refs can
+    resolve to different commits over time.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        path: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Byte budget of the in-memory tier
+            path: Optional SQLite database file for the on-disk tier
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes cannot be negative")
+
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[ResourceResponse[Commit], int]]" = (
+            OrderedDict()
+        )
+        # Guards the memory tier and counters; the database has its own lock
+        # so memory hits never wait for disk I/O
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._stats = CacheStats()
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS commits "
+                "(key TEXT PRIMARY KEY, body BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get a dictionary of current cache counters."""
+        with self._lock:
+            return self._stats.to_dict()
+
+    @staticmethod
+    def is_cacheable(sha: str) -> bool:
+        """Return True if the SHA names exactly one immutable commit"""
+        return bool(_FULL_SHA.match(sha.lower()))
+
+    @staticmethod
+    def make_key(sha: str, options: Optional[ServerOptions] = None) -> str:
+        """Build the cache key for a commit fetched with the given options"""
+        if options is None:
+            return sha.lower()
+        encoded = json.dumps(model_dump(options), sort_keys=True, default=str)
+        return f"{sha.lower()}:{encoded}"
+
+    def get(
+        self, sha: str, options: Optional[ServerOptions] = None
+    ) -> Optional[ResourceResponse[Commit]]:
+        """
+        Look up a cached commit.
+
+        Args:
+            sha: The commit SHA
+            options: The server options the commit was fetched with
+
+        Returns:
+            Optional[ResourceResponse[Commit]]: A copy of the cached response,
+            or None
+        """
+        if not self.is_cacheable(sha):
+            return None
+
+        key = self.make_key(sha, options)
+        value = self._get_memory(key)
+        if value is None:
+            value = self._get_disk(key, options)
+        return model_copy(value) if value is not None else None
+
+    async def aget(
+        self, sha: str, options: Optional[ServerOptions] = None
+    ) -> Optional[ResourceResponse[Commit]]:
+        """Look up a cached commit, reading the on-disk tier in a worker thread; see ``get``"""
+        if not self.is_cacheable(sha):
+            return None
+
+        key = self.make_key(sha, options)
+        value = self._get_memory(key)
+        if value is None:
+            value = await anyio.to_thread.run_sync(self._get_disk, key, options)
+        return model_copy(value) if value is not None else None
+
+    def put(
+        self,
+        sha: str,
+        options: Optional[ServerOptions],
+        value: ResourceResponse[Commit],
+        size: Optional[int] = None,
+    ) -> None:
+        """
+        Store a commit response.
+
+        Args:
+            sha: The commit SHA
+            options: The server options the commit was fetched with
+            value: The parsed commit response; the cache stores a copy
+            size: Approximate size in bytes, e.g. of the response body. Computed
+                from the serialized value if omitted.
+        """
+        stored = self._put_memory(sha, options, value, size)
+        if stored is not None and self._db is not None:
+            self._put_disk(*stored)
+
+    async def aput(
+        self,
+        sha: str,
+        options: Optional[ServerOptions],
+        value: ResourceResponse[Commit],
+        size: Optional[int] = None,
+    ) -> None:
+        """Store a commit response, writing the on-disk tier in a worker thread; see ``put``"""
+        stored = self._put_memory(sha, options, value, size)
+        if stored is not None and self._db is not None:
+            await anyio.to_thread.run_sync(self._put_disk, *stored)
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers"""
+        with self._lock:
+            self._entries.clear()
+            self._stats.entries = 0
+            self._stats.bytes_used = 0
+        with self._db_lock:
+            if self._db is not None:
+                self._db.execute("DELETE FROM commits")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the on-disk tier"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _get_memory(self, key: str) -> Optional[ResourceResponse[Commit]]:
+        """Look up an entry in the memory tier"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry[0]
+
+    def _get_disk(
+        self, key: str, options: Optional[ServerOptions]
+    ) -> Optional[ResourceResponse[Commit]]:
+        """Look up an entry in the on-disk tier and promote it to memory"""
+        body = None
+        with self._db_lock:
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT body FROM commits WHERE key = ?", (key,)
+                ).fetchone()
+                body = bytes(row[0]) if row else None
+
+        if body is None:
+            with self._lock:
+                self._stats.misses += 1
+            return None
+
+        commit_model = resolve_model(Commit, options.fields if options else None)
+        value = model_validate_json(ResourceResponse[commit_model], body)
+        with self._lock:
+            self._stats.disk_hits += 1
+            self._store_memory(key, value, len(body))
+        return value
+
+    def _put_memory(
+        self,
+        sha: str,
+        options: Optional[ServerOptions],
+        value: ResourceResponse[Commit],
+        size: Optional[int],
+    ) -> Optional[Tuple[str, Optional[bytes]]]:
+        """
+        Store a copy of a response in the memory tier.
+
+        Returns:
+            The key and the serialized body to write to disk, or None if the
+            commit is not cacheable
+        """
+        if not self.is_cacheable(sha):
+            return None
+
+        key = self.make_key(sha, options)
+        body: Optional[bytes] = None
+        if self._db is not None or size is None:
+            body = model_dump_json(value)
+            if size is None:
+                size = len(body)
+        with self._lock:
+            self._store_memory(key, model_copy(value), size)
+        return key, body
+
+    def _put_disk(self, key: str, body: Optional[bytes]) -> None:
+        """Write an entry body to the on-disk tier"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO commits (key, body, created_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, body, time.time()),
+                )
+                self._db.commit()
+
+    def _store_memory(
+        self, key: str, value: ResourceResponse[Commit], size: int
+    ) -> None:
+        """Insert an entry in the memory tier, evicting the least recently used"""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._stats.bytes_used -= previous[1]
+
+        if size > self.max_bytes:
+            self._stats.entries = len(self._entries)
+            return
+
+        self._entries[key] = (value, size)
+        self._stats.bytes_used += size
+        while self._stats.bytes_used > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._stats.bytes_used -= evicted_size
+            self._stats.evictions += 1
+        self._stats.entries = len(self._entries)
+
+
+@dataclass
+class CachedResponse:
+    """A parsed response with the validators needed to revalidate it"""
+
+    value: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Get the headers that make a request conditional on this response"""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Revalidating cache for parsed resource responses.
+
+    Responses that carry an ``ETag`` or ``Last-Modified`` header are stored
+    with those validators. Later requests for the same resource are sent as
+    conditional requests, and a ``304 Not Modified`` answer is served from the
+    cached model, skipping both the download and validation of the body.
+    Like ``CommitCache``, the cache keeps its own copy of every stored
+    response and hands out deep copies. Entries are evicted least recently
+    used first.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get a dictionary of current cache counters."""
+        with self._lock:
+            return self._stats.to_dict()
+
+    @staticmethod
+    def make_key(method: str, path: str, body: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a request"""
+        encoded = json.dumps(body, sort_keys=True, default=str)
+        return f"{method.upper()} {path} {encoded}"
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """Get the cached response to revalidate for a request, if any"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def revalidated(self, key: str, entry: CachedResponse) -> Any:
+        """
+        Record that the server confirmed a cached response is current.
+
+        Returns:
+            A copy of the cached response
+        """
+        with self._lock:
+            self._stats.hits += 1
+        return copy.deepcopy(entry.value)
+
+    def store(self, key: str, value: Any, headers: Any) -> None:
+        """
+        Store a fresh response if it carries validators.
+
+        Args:
+            key: The request key
+            value: The parsed response; the cache stores a copy
+            headers: The response headers
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        entry = None
+        if etag is not None or last_modified is not None:
+            entry = CachedResponse(copy.deepcopy(value), etag, last_modified)
+        with self._lock:
+            self._stats.misses += 1
+            self._entries.pop(key, None)
+            if entry is None:
+                self._stats.entries = len(self._entries)
+                return
+
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+            self._stats.entries = len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._stats.entries = 0
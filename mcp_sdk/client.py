@@ -1,22 +1,56 @@
-from typing import Optional, Dict, Any, List, TypeVar, Generic, Type, Union
-import json
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    Callable,
+    Collection,
+    List,
+    Mapping,
+    Set,
+    Tuple,
+    TypeVar,
+    Generic,
+    Type,
+    Union,
+)
+import asyncio
+import math
+from collections import deque
+from types import MappingProxyType
+import random
+import time
+import httpx
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from datetime import datetime
+from urllib.parse import quote
 from pydantic import BaseModel, Field, validator
 
 from .models import (
     MCPRequest,
     MCPResponse,
+    MCPBatchResponse,
+    MCPStreamChunk,
     ClientInfo,
     ClientConfig,
     Commit,
+    CommitFile,
+    CommitPatches,
+    CommitPatchRequest,
     CommitResponse,
     ServerOptions,
     CommitRequest,
+    CommitBatchRequest,
+    MediaHandle,
+    UploadCompleteRequest,
+    UploadCreateRequest,
+    UploadSession,
 )
 from .resources import (
+    ResourceMetadata,
+    ResourceLinks,
     ResourceResponse,
     PaginatedResponse,
     ResourceErrorResponse,
@@ -35,7 +69,41 @@ from .exceptions import (
     MCPResourceNotFoundError,
     MCPPermissionError,
     MCPConfigurationError,
+    MCPCircuitOpenError,
+    MCPUploadError,
+)
+from .batching import RequestBatcher
+from .codec import JSONCodec, get_codec
+from .compression import accept_encoding, available_encodings, compress
+from .media import (
+    DEFAULT_PART_SIZE,
+    MEDIA_FILENAME_HEADER,
+    MEDIA_PARAMS_HEADER,
+    MediaBody,
+    MediaSource,
 )
+from .cache import CachedResponse, CommitCache, ResponseCache
+from .projection import resolve_model
+from .rate_limit import AdaptiveRateLimiter, parse_retry_after
+from .resilience import CircuitBreaker, HedgingPolicy
+from .balancing import EndpointBalancer
+from .shared._httpx_utils import create_mcp_http_client
+from .shared._pydantic_utils import model_copy
+
+# Accept headers for the supported streaming formats
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+# Path that accepts raw media uploads
+MEDIA_PATH = "/api/v1/process:media"
+
+# Path of the chunked upload resource
+UPLOADS_PATH = "/api/v1/uploads"
+
+# Request bodies are either encoded JSON or streamed media
+RequestBody = Union[bytes, MediaBody]
 
 # Type variables for generic request/response handling
 T = TypeVar("T", bound=BaseModel)
@@ -64,6 +132,29 @@ class RequestOptions(BaseModel):
     )
     headers: Dict[str, str] = Field(default_factory=dict)
     verify_ssl: bool = Field(default=True)
+    max_connections: int = Field(default=100, gt=0)
+    max_keepalive_connections: int = Field(default=20, ge=0)
+    keepalive_expiry: float = Field(default=5.0, ge=0.0)
+    http2: bool = Field(default=False)
+    # Content coding for request bodies ("gzip" or "zstd"); None sends them as is
+    compression: Optional[str] = Field(default=None)
+    compression_min_size: int = Field(default=1024, ge=0)
+
+
+class BatchOptions(BaseModel):
+    """Options for client-side request batching"""
+
+    max_batch_size: int = Field(default=32, gt=0)
+    max_delay: float = Field(default=0.005, ge=0.0)
+
+
+class BalancerOptions(BaseModel):
+    """Options for balancing requests over several endpoints"""
+
+    decay: float = Field(default=0.3, gt=0.0, le=1.0)
+    initial_latency: float = Field(default=0.1, ge=0.0)
+    failure_threshold: int = Field(default=5, gt=0)
+    ejection_time: float = Field(default=30.0, ge=0.0)
 
 
 class ResponseMetadata(BaseModel):
@@ -84,25 +175,61 @@ class TypedResponse(BaseModel, Generic[R]):
 
 
 class MCPClient:
-    """Client for interacting with the MCP API"""
+    """Client for interacting with the MCP API
+
+    The coroutine methods (``send``, ``get_commit``) run on a pooled
+    ``httpx.AsyncClient`` so concurrent calls overlap on the wire. The
+    ``*_sync`` methods are a blocking facade over a ``requests`` session for
+    callers without an event loop.
+    """
 
     def __init__(
         self,
         api_key: str,
-        endpoint: str,
+        endpoint: Union[str, List[str]],
         client_info: Optional[Union[ClientInfo, Dict[str, Any]]] = None,
         config: Optional[ClientConfig] = None,
         options: Optional[RequestOptions] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        batch_options: Optional[BatchOptions] = None,
+        commit_cache: Optional[CommitCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        balancer_options: Optional[BalancerOptions] = None,
+        codec: Optional[JSONCodec] = None,
     ):
         """
         Initialize the MCP client.
 
         Args:
             api_key: Your MCP API key
-            endpoint: The MCP API endpoint
+            endpoint: The MCP API endpoint, or a list of replica endpoints to
+                balance requests over
             client_info: Client information as either a ClientInfo object or dict
             config: Client configuration
             options: Request options
+            http_client: Optional pre-configured httpx.AsyncClient to use for the
+                async transport. If omitted, a pooled client is created from
+                ``options`` on first use and owned by this client.
+            batch_options: Enables batching mode. When set, concurrent
+                ``send`` calls made within the batching window are shipped
+                together through the batch endpoint.
+            commit_cache: Optional cache for commits fetched by full SHA
+            response_cache: Optional cache that revalidates GET responses with
+                conditional requests
+            rate_limiter: Optional limiter, possibly shared between clients, that
+                paces requests to this endpoint and queues them on 429 instead
+                of failing
+            circuit_breaker: Optional breaker that fails calls fast while this
+                endpoint keeps failing
+            hedging: Optional policy for sending duplicates of slow idempotent
+                requests on the async transport
+            balancer_options: Tuning for load balancing when several endpoints
+                are given
+            codec: JSON codec for request and response bodies. Defaults to the
+                fastest installed backend.
 
         Raises:
             MCPConfigurationError: If the configuration is invalid
@@ -112,13 +239,47 @@ class MCPClient:
         if not endpoint:
             raise MCPConfigurationError("Endpoint is required", setting="endpoint")
 
+        endpoints = [endpoint] if isinstance(endpoint, str) else list(endpoint)
         self.api_key = api_key
-        self.endpoint = endpoint.rstrip("/")
+        # The first endpoint is the primary one, e.g. for links and config
+        self.endpoint = endpoints[0].rstrip("/")
+        self.balancer: Optional[EndpointBalancer] = None
+        if len(endpoints) > 1:
+            balancer_options = balancer_options or BalancerOptions()
+            self.balancer = EndpointBalancer(endpoints, **balancer_options.dict())
         self._client_info = self._validate_client_info(client_info)
-        self.config = config or ClientConfig(api_key=api_key, endpoint=endpoint)
+        self.codec = codec or get_codec()
+        # Derived from client info once and reused by every request
+        self._headers: Optional[Mapping[str, str]] = None
+        self._client_info_data: Optional[Dict[str, Any]] = None
+        self._client_info_json: Optional[bytes] = None
+        self.config = config or ClientConfig(api_key=api_key, endpoint=self.endpoint)
         self.options = options or RequestOptions()
+        if (
+            self.options.compression is not None
+            and self.options.compression not in available_encodings()
+        ):
+            raise MCPConfigurationError(
+                f"Unsupported request compression: {self.options.compression}",
+                setting="compression",
+            )
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
 
         self.session = self._create_session()
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self.commit_cache = commit_cache
+        self.response_cache = response_cache
+        self._multi_get_supported: Optional[bool] = None
+        self._batcher: Optional[RequestBatcher] = None
+        if batch_options is not None:
+            self._batcher = RequestBatcher(
+                self._send_batch_items,
+                max_batch_size=batch_options.max_batch_size,
+                max_delay=batch_options.max_delay,
+            )
 
     def _validate_client_info(
         self, client_info: Optional[Union[ClientInfo, Dict[str, Any]]] = None
@@ -180,12 +341,17 @@ class MCPClient:
         try:
             session = requests.Session()
 
+            status_forcelist = [
+                code
+                for code in self.options.retry_status_codes
+                if self._retryable_status(code)
+            ]
             retry_strategy = Retry(
                 total=self.options.retry_count,
                 backoff_factor=self.options.retry_backoff_factor,
-                status_forcelist=self.options.retry_status_codes,
+                status_forcelist=status_forcelist,
                 allowed_methods=self.options.retry_methods,
-                jitter=0.1,
+                backoff_jitter=0.1,
                 respect_retry_after_header=True,
                 raise_on_status=True,
             )
@@ -197,6 +363,37 @@ class MCPClient:
         except Exception as e:
             raise MCPConfigurationError(f"Failed to create session: {str(e)}") from e
 
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Create a pooled httpx client for the async transport"""
+        try:
+            return create_mcp_http_client(
+                timeout=httpx.Timeout(self.options.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.options.max_connections,
+                    max_keepalive_connections=self.options.max_keepalive_connections,
+                    keepalive_expiry=self.options.keepalive_expiry,
+                ),
+                http2=self.options.http2,
+                verify=self.options.verify_ssl,
+            )
+        except ImportError as e:
+            raise MCPConfigurationError(
+                "HTTP/2 support requires the 'h2' package (pip install httpx[http2])",
+                setting="http2",
+            ) from e
+        except Exception as e:
+            raise MCPConfigurationError(
+                f"Failed to create HTTP client: {str(e)}"
+            ) from e
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Get the pooled async HTTP client, creating it on first use"""
+        if self._http_client is None:
+            self._http_client = self._create_http_client()
+            self._owns_http_client = True
+        return self._http_client
+
     @property
     def client_info(self) -> ClientInfo:
         """Get the current client info"""
@@ -212,9 +409,24 @@ class MCPClient:
         current_info = self._client_info.dict()
         current_info.update({k: v for k, v in kwargs.items() if v is not None})
         self._client_info = ClientInfo(**current_info)
+        self._headers = None
+        self._client_info_data = None
+        self._client_info_json = None
 
     def _prepare_headers(self) -> Dict[str, str]:
         """Prepare headers for API requests"""
+        return dict(self._default_headers())
+
+    def _default_headers(self) -> Mapping[str, str]:
+        """
+        Get the headers sent with every request.
+
+        They are built once and kept as a read-only mapping until
+        ``update_client_info`` changes the client info they are derived from.
+        """
+        if self._headers is not None:
+            return self._headers
+
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -231,100 +443,676 @@ class MCPClient:
         if self._client_info.client_id:
             headers["X-Client-ID"] = self._client_info.client_id
 
+        # Responses may come back in any coding the transports can decode
+        headers["Accept-Encoding"] = accept_encoding()
+
         # Add custom headers from options
         headers.update(self.options.headers)
-        return headers
+        self._headers = MappingProxyType(headers)
+        return self._headers
 
-    def _handle_response(
-        self, response: requests.Response, response_type: Type[R]
-    ) -> Union[ResourceResponse[R], PaginatedResponse[R], ResourceErrorResponse]:
-        """Handle API response and return standardized resource response"""
+    def _request_headers(
+        self,
+        headers: Optional[Mapping[str, str]] = None,
+        content_encoding: Optional[str] = None,
+    ) -> Mapping[str, str]:
+        """Merge per-request headers into the default ones"""
+        if not headers and content_encoding is None:
+            return self._default_headers()
+        merged = dict(self._default_headers())
+        if headers:
+            merged.update(headers)
+        if content_encoding is not None:
+            merged["Content-Encoding"] = content_encoding
+        return merged
+
+    def _client_info_payload(self) -> Tuple[Dict[str, Any], bytes]:
+        """Get the client info as JSON data and as an encoded JSON fragment"""
+        if self._client_info_data is None or self._client_info_json is None:
+            encoded = self.codec.dump_model(self._client_info)
+            self._client_info_data = self.codec.loads(encoded)
+            self._client_info_json = encoded
+        return self._client_info_data, self._client_info_json
+
+    @staticmethod
+    def _needs_client_info(request: Union[MCPRequest, Dict[str, Any]]) -> bool:
+        """Return True if the request does not carry its own client info"""
+        if isinstance(request, dict):
+            return "client_info" not in request
+        return getattr(request, "client_info", None) is None
+
+    def _prepare_request_data(
+        self, request: Union[MCPRequest, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Serialize a request, filling in client info if it is missing"""
+        if isinstance(request, dict):
+            request_data = request.copy()
+        else:
+            request_data = self.codec.loads(self.codec.dump_model(request))
+        if self._needs_client_info(request):
+            request_data["client_info"] = dict(self._client_info_payload()[0])
+        return request_data
+
+    def _encode_request(self, request: Union[MCPRequest, Dict[str, Any]]) -> bytes:
+        """
+        Encode a request body, filling in client info if it is missing.
+
+        The client info is spliced in as a pre-encoded fragment instead of
+        being serialized again for every request.
+        """
+        if isinstance(request, dict):
+            body = self.codec.dumps(request)
+        else:
+            body = self.codec.dump_model(request)
+        if not self._needs_client_info(request):
+            return body
+
+        # Both encoders emit compact objects, so the body ends with its brace
+        separator = b"," if body != b"{}" else b""
+        return b"".join(
+            (
+                body[:-1],
+                separator,
+                b'"client_info":',
+                self._client_info_payload()[1],
+                b"}",
+            )
+        )
+
+    def _encode_body(
+        self, json_data: Union[Dict[str, Any], RequestBody, None]
+    ) -> Optional[RequestBody]:
+        """Encode a JSON body once so retries and hedges can resend it as is"""
+        if json_data is None or isinstance(json_data, (bytes, MediaBody)):
+            return json_data
+        return self.codec.dumps(json_data)
+
+    def _compress_body(
+        self, body: Optional[RequestBody]
+    ) -> Tuple[Optional[RequestBody], Optional[str]]:
+        """
+        Compress a request body that reaches the configured minimum size.
+
+        Returns:
+            The body to send and its content coding, or None if it is sent as is
+        """
+        encoding = self.options.compression
+        # Media is sent as is; it is usually compressed already
+        if (
+            not isinstance(body, bytes)
+            or encoding is None
+            or len(body) < self.options.compression_min_size
+        ):
+            return body, None
+        return compress(body, encoding), encoding
+
+    def _decode_json(self, response: Union[requests.Response, httpx.Response]) -> Any:
+        """Decode a JSON response body with the client's codec"""
+        return self.codec.loads(response.content)
+
+    def _get_retry_delay(
+        self, attempt: int, retry_after: Optional[str] = None
+    ) -> float:
+        """Compute the delay before the next retry, honoring Retry-After"""
+        delay = parse_retry_after(retry_after)
+        if delay is not None:
+            return delay
+        return self.options.retry_backoff_factor * (2**attempt) + random.uniform(0, 0.1)
+
+    def _map_transport_error(self, error: Exception) -> MCPError:
+        """Map a transport-level exception to the matching MCP exception"""
+        if isinstance(error, (httpx.TimeoutException, requests.exceptions.Timeout)):
+            return MCPTimeoutError("Request timed out", timeout=self.options.timeout)
+        if isinstance(
+            error, (httpx.TransportError, requests.exceptions.ConnectionError)
+        ):
+            return MCPConnectionError("Failed to connect to MCP API")
+        return MCPError(f"API request failed: {str(error)}")
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json_data: Union[Dict[str, Any], RequestBody, None] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Send a request over the async transport.
+
+        Transport errors and responses with a retryable status code are retried
+        with exponential backoff, following the same ``RequestOptions`` as the
+        sync session.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the endpoint
+            json_data: Optional body, either as JSON data, already encoded, or
+                as media to stream
+            headers: Optional headers to send in addition to the default ones
+
+        Returns:
+            httpx.Response: The final response
+
+        Raises:
+            MCPConnectionError: If the API cannot be reached
+            MCPTimeoutError: If the request times out
+        """
+        body, content_encoding = self._compress_body(self._encode_body(json_data))
+        request_headers = self._request_headers(headers, content_encoding)
+        # A media stream that cannot be rewound is sent exactly once
+        replayable = not isinstance(body, MediaBody) or body.replayable
+        retryable = replayable and method.upper() in self.options.retry_methods
+        attempt = 0
+        throttled = 0
+        tried: List[str] = []
+        rejected: Set[str] = set()
+        while True:
+            exhausted = not retryable or attempt >= self.options.retry_count
+            # Retries go to a replica that was not tried yet, if there is one
+            endpoint = self._choose_endpoint(tried)
+            tried.append(endpoint)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(endpoint)
+            try:
+                response = await self._send_attempt(
+                    method, endpoint, path, body, request_headers
+                )
+            except MCPCircuitOpenError:
+                # Nothing was sent, so move on to another replica right away
+                # without using up a retry
+                if not self._failover(endpoint, rejected):
+                    raise
+                continue
+            except httpx.TransportError as e:
+                if exhausted:
+                    raise self._map_transport_error(e) from e
+                retry_after = None
+            else:
+                if (
+                    self._record_rate_limit(endpoint, response, throttled)
+                    and replayable
+                ):
+                    # Queue the request again behind the limiter's back-off
+                    throttled += 1
+                    await response.aclose()
+                    continue
+                if exhausted or not self._retryable_status(response.status_code):
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                await response.aclose()
+
+            await asyncio.sleep(self._get_retry_delay(attempt, retry_after))
+            attempt += 1
+
+    def _retryable_status(self, status_code: int) -> bool:
+        """Return True if a response status is retried with back-off"""
+        # With a rate limiter, 429s are paced by the limiter alone
+        if status_code == 429 and self.rate_limiter is not None:
+            return False
+        return status_code in self.options.retry_status_codes
+
+    def _choose_endpoint(self, exclude: Collection[str] = ()) -> str:
+        """Pick the endpoint for the next request, avoiding open circuits"""
+        if self.balancer is None:
+            return self.endpoint
+        return self.balancer.choose(
+            exclude,
+            self.circuit_breaker.allows if self.circuit_breaker is not None else None,
+        )
+
+    def _failover(self, endpoint: str, rejected: Set[str]) -> bool:
+        """
+        Note that an endpoint's circuit rejected a request.
+
+        Returns:
+            bool: True if another endpoint is left to try
+        """
+        rejected.add(endpoint)
+        endpoints = self.balancer.endpoints if self.balancer else [self.endpoint]
+        return any(other not in rejected for other in endpoints)
+
+    async def _send_attempt(
+        self,
+        method: str,
+        endpoint: str,
+        path: str,
+        content: Optional[RequestBody],
+        headers: Mapping[str, str],
+    ) -> httpx.Response:
+        """
+        Send one attempt, guarded by the circuit breaker and hedged if enabled.
+
+        Raises:
+            MCPCircuitOpenError: If the circuit breaker rejects the call
+        """
+        if self.hedging is not None and self.hedging.applies(method):
+            return await self._send_hedged(
+                self.hedging, method, endpoint, path, content, headers
+            )
+        return await self._send_guarded(method, endpoint, path, content, headers)
+
+    async def _send_guarded(
+        self,
+        method: str,
+        endpoint: str,
+        path: str,
+        content: Optional[RequestBody],
+        headers: Mapping[str, str],
+    ) -> httpx.Response:
+        """
+        Send one request through the circuit breaker, recording its outcome.
+
+        Raises:
+            MCPCircuitOpenError: If the circuit breaker rejects the call
+        """
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.before_call(endpoint)
         try:
-            response.raise_for_status()
-            response_data = response.json()
-
-            # Check if it's a paginated response
-            if isinstance(response_data, dict) and "pagination" in response_data:
-                return PaginatedResponse[R](**response_data)
-
-            # Check if it's a single resource response
-            if isinstance(response_data, dict) and "data" in response_data:
-                return ResourceResponse[R](**response_data)
-
-            # Handle error response
-            if isinstance(response_data, dict) and "errors" in response_data:
-                return ResourceErrorResponse(**response_data)
-
-            # Handle raw response
-            return ResourceResponse[R](
-                data=response_type(**response_data),
-                metadata=ResourceMetadata(
-                    id=str(response.headers.get("X-Request-ID", "")),
-                    version="1.0",
-                    status="success",
+            response = await self._send_timed(method, endpoint, path, content, headers)
+        except httpx.TransportError:
+            if breaker is not None:
+                breaker.record_failure(endpoint)
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.release(endpoint)
+            raise
+
+        if breaker is not None:
+            self._record_circuit(breaker, endpoint, response.status_code)
+        return response
+
+    @staticmethod
+    def _record_circuit(
+        breaker: CircuitBreaker, endpoint: str, status_code: int
+    ) -> None:
+        """Report a response to the circuit breaker; server errors count as failures"""
+        if status_code >= 500:
+            breaker.record_failure(endpoint)
+        else:
+            breaker.record_success(endpoint)
+
+    async def _send_timed(
+        self,
+        method: str,
+        endpoint: str,
+        path: str,
+        content: Optional[RequestBody],
+        headers: Mapping[str, str],
+    ) -> httpx.Response:
+        """Send a request, recording its latency for balancing and hedging"""
+        start = time.monotonic()
+        success: Optional[bool] = None
+        if self.balancer is not None:
+            self.balancer.start(endpoint)
+        try:
+            response = await self.http_client.request(
+                method,
+                f"{endpoint}{path}",
+                content=(
+                    content.async_stream()
+                    if isinstance(content, MediaBody)
+                    else content
                 ),
-                links=ResourceLinks(self=response.url),
+                headers=headers,
             )
+            success = response.status_code < 500
+            return response
+        except httpx.TransportError:
+            success = False
+            raise
+        finally:
+            self._record_latency(endpoint, time.monotonic() - start, success)
 
-        except requests.exceptions.RequestException as e:
-            error_response = None
+    def _record_latency(
+        self, endpoint: str, latency: float, success: Optional[bool]
+    ) -> None:
+        """Feed the outcome of a request to the balancer and hedging policy"""
+        if self.balancer is not None:
+            self.balancer.finish(endpoint, latency, success)
+        if self.hedging is not None and success:
+            self.hedging.record(endpoint, latency)
+
+    async def _send_hedged(
+        self,
+        hedging: HedgingPolicy,
+        method: str,
+        endpoint: str,
+        path: str,
+        content: Optional[RequestBody],
+        headers: Mapping[str, str],
+    ) -> httpx.Response:
+        """
+        Send a request, adding duplicates while it is slower than usual.
+
+        Every attempt, duplicates included, goes through the circuit breaker
+        and reports its outcome to it. Duplicates are only sent to endpoints
+        whose circuit admits them.
+
+        Raises:
+            MCPCircuitOpenError: If the circuit breaker rejects the first attempt
+        """
+        delay = hedging.delay(endpoint)
+        breaker = self.circuit_breaker
+        attempts = [
+            asyncio.ensure_future(
+                self._send_guarded(method, endpoint, path, content, headers)
+            )
+        ]
+        used = [endpoint]
+        can_hedge = True
+        try:
+            while True:
+                can_hedge = can_hedge and len(used) <= hedging.max_hedges
+                done, _ = await asyncio.wait(
+                    attempts,
+                    timeout=delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    # Duplicates prefer another replica when balancing, and
+                    # are not sent where the circuit would reject them
+                    hedge_endpoint = self._choose_endpoint(used)
+                    if breaker is not None and not breaker.allows(hedge_endpoint):
+                        can_hedge = False
+                        continue
+                    used.append(hedge_endpoint)
+                    attempts.append(
+                        asyncio.ensure_future(
+                            self._send_guarded(
+                                method, hedge_endpoint, path, content, headers
+                            )
+                        )
+                    )
+                    hedging.hedged += 1
+                    continue
+
+                error: Optional[BaseException] = None
+                for task in done:
+                    attempts.remove(task)
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                if not attempts:
+                    assert error is not None
+                    raise error
+        finally:
+            for task in attempts:
+                task.cancel()
+
+    async def _get_resource(
+        self, path: str, json_data: Dict[str, Any], response_type: Type[R]
+    ) -> Tuple[Any, Optional[int]]:
+        """
+        GET a resource, revalidating a cached copy with a conditional request.
+
+        Returns:
+            The parsed response, and the size of the downloaded body or None if
+            the cached copy was still current
+        """
+        key, cached = self._lookup_response(path, json_data)
+        response = await self._request(
+            "GET",
+            path,
+            json_data,
+            headers=cached.conditional_headers() if cached else None,
+        )
+        return self._resolve_response(key, cached, response, response_type)
+
+    def _get_resource_sync(
+        self, path: str, json_data: Dict[str, Any], response_type: Type[R]
+    ) -> Tuple[Any, Optional[int]]:
+        """Blocking variant of ``_get_resource`` over the sync session"""
+        key, cached = self._lookup_response(path, json_data)
+        response = self._session_request(
+            "GET",
+            path,
+            json_data,
+            headers=cached.conditional_headers() if cached else None,
+        )
+        return self._resolve_response(key, cached, response, response_type)
+
+    def _session_request(
+        self,
+        method: str,
+        path: str,
+        json_data: Union[Dict[str, Any], RequestBody, None] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Send a request over the sync session, paced by the rate limiter"""
+        body, content_encoding = self._compress_body(self._encode_body(json_data))
+        request_headers = self._request_headers(headers, content_encoding)
+        replayable = not isinstance(body, MediaBody) or body.replayable
+        throttled = 0
+        rejected: Set[str] = set()
+        while True:
+            endpoint = self._choose_endpoint(rejected)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire_sync(endpoint)
             try:
-                error_response = response.json()
-            except:
-                pass
-
-            if isinstance(e, requests.exceptions.ConnectionError):
-                raise MCPConnectionError(
-                    "Failed to connect to MCP API",
-                    status_code=response.status_code,
-                    response=error_response,
-                ) from e
-            elif isinstance(e, requests.exceptions.Timeout):
-                raise MCPTimeoutError(
-                    "Request timed out",
-                    timeout=self.options.timeout,
-                    status_code=response.status_code,
-                    response=error_response,
-                ) from e
-            elif response.status_code == 401:
-                raise MCPAuthenticationError(
-                    "Invalid API key",
-                    status_code=response.status_code,
-                    response=error_response,
-                ) from e
-            elif response.status_code == 403:
-                raise MCPPermissionError(
-                    "Permission denied",
-                    status_code=response.status_code,
-                    response=error_response,
-                ) from e
-            elif response.status_code == 404:
-                raise MCPResourceNotFoundError(
-                    "Resource not found",
-                    status_code=response.status_code,
-                    response=error_response,
-                ) from e
-            elif response.status_code == 422:
-                raise MCPValidationError(
-                    "Invalid request parameters",
-                    validation_errors=error_response,
-                    status_code=response.status_code,
-                    response=error_response,
-                ) from e
-            elif response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                raise MCPRateLimitError(
-                    "Rate limit exceeded",
-                    retry_after=int(retry_after) if retry_after else None,
-                    status_code=response.status_code,
-                    response=error_response,
-                ) from e
-            else:
-                raise MCPError(
-                    f"API request failed: {str(e)}",
-                    status_code=response.status_code,
-                    response=error_response,
-                ) from e
+                response = self._session_attempt(
+                    method, endpoint, path, body, request_headers
+                )
+            except MCPCircuitOpenError:
+                if not self._failover(endpoint, rejected):
+                    raise
+                continue
+            if (
+                not self._record_rate_limit(endpoint, response, throttled)
+                or not replayable
+            ):
+                return response
+            throttled += 1
+            response.close()
+
+    def _session_attempt(
+        self,
+        method: str,
+        endpoint: str,
+        path: str,
+        content: Optional[RequestBody],
+        headers: Mapping[str, str],
+    ) -> requests.Response:
+        """Send one request over the sync session, guarded by the circuit breaker"""
+        breaker = self.circuit_breaker
+        if breaker is not None:
+            breaker.before_call(endpoint)
+        start = time.monotonic()
+        success: Optional[bool] = None
+        if self.balancer is not None:
+            self.balancer.start(endpoint)
+        try:
+            response = self.session.request(
+                method,
+                f"{endpoint}{path}",
+                data=(
+                    content.sync_stream() if isinstance(content, MediaBody) else content
+                ),
+                headers=headers,
+                timeout=self.options.timeout,
+                verify=self.options.verify_ssl,
+            )
+            success = response.status_code < 500
+        except requests.exceptions.RequestException:
+            success = False
+            if breaker is not None:
+                breaker.record_failure(endpoint)
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.release(endpoint)
+            raise
+        finally:
+            self._record_latency(endpoint, time.monotonic() - start, success)
+
+        if breaker is not None:
+            self._record_circuit(breaker, endpoint, response.status_code)
+        return response
+
+    def _record_rate_limit(
+        self,
+        endpoint: str,
+        response: Union[requests.Response, httpx.Response],
+        throttled: int,
+    ) -> bool:
+        """
+        Feed a response back to the rate limiter.
+
+        Returns:
+            bool: True if the request was throttled and should be queued again
+        """
+        if self.rate_limiter is None:
+            return False
+        if response.status_code != 429:
+            if response.status_code < 400:
+                self.rate_limiter.record_success(endpoint)
+            return False
+
+        self.rate_limiter.record_throttle(
+            endpoint, parse_retry_after(response.headers.get("Retry-After"))
+        )
+        return throttled < self.rate_limiter.max_throttled_attempts
+
+    def _lookup_response(
+        self, path: str, json_data: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[CachedResponse]]:
+        """Find the cached response to revalidate for a GET request"""
+        if self.response_cache is None:
+            return None, None
+        key = self.response_cache.make_key("GET", path, json_data)
+        return key, self.response_cache.lookup(key)
+
+    def _resolve_response(
+        self,
+        key: Optional[str],
+        cached: Optional[CachedResponse],
+        response: Union[requests.Response, httpx.Response],
+        response_type: Type[R],
+    ) -> Tuple[Any, Optional[int]]:
+        """Serve a 304 from the cache, or parse and cache a fresh response"""
+        cache = self.response_cache
+        if cached is not None and response.status_code == 304:
+            # A cached copy is only looked up when the cache is configured
+            assert cache is not None and key is not None
+            return cache.revalidated(key, cached), None
+
+        result = self._handle_response(response, response_type)
+        if cache is not None and key is not None:
+            cache.store(key, result, response.headers)
+        return result, len(response.content)
+
+    def _error_for_status(
+        self,
+        status_code: int,
+        error_response: Optional[Dict[str, Any]] = None,
+        retry_after: Optional[str] = None,
+    ) -> MCPError:
+        """Build the MCP exception matching an error status code"""
+        if status_code == 401:
+            return MCPAuthenticationError(
+                "Invalid API key",
+                status_code=status_code,
+                response=error_response,
+            )
+        elif status_code == 403:
+            return MCPPermissionError(
+                "Permission denied",
+                status_code=status_code,
+                response=error_response,
+            )
+        elif status_code == 404:
+            return MCPResourceNotFoundError(
+                "Resource not found",
+                status_code=status_code,
+                response=error_response,
+            )
+        elif status_code == 422:
+            return MCPValidationError(
+                "Invalid request parameters",
+                validation_errors=error_response,
+                status_code=status_code,
+                response=error_response,
+            )
+        elif status_code == 429:
+            # Retry-After may be fractional or an HTTP date; round the wait up
+            delay = parse_retry_after(retry_after)
+            return MCPRateLimitError(
+                "Rate limit exceeded",
+                retry_after=math.ceil(delay) if delay is not None else None,
+                status_code=status_code,
+                response=error_response,
+            )
+        else:
+            return MCPError(
+                f"API request failed with status {status_code}",
+                status_code=status_code,
+                response=error_response,
+            )
+
+    def _raise_for_status(self, response: Union[requests.Response, httpx.Response]):
+        """Raise the MCP exception matching an error status code"""
+        error_response = None
+        try:
+            error_response = self._decode_json(response)
+        except Exception:
+            pass
+
+        raise self._error_for_status(
+            response.status_code,
+            error_response,
+            retry_after=response.headers.get("Retry-After"),
+        )
+
+    def _wrap_raw_response(
+        self, data: Dict[str, Any], response_type: Type[R], request_id: str, url: str
+    ) -> ResourceResponse[R]:
+        """Wrap a bare response body in a standardized resource response"""
+        return ResourceResponse[response_type](
+            data=response_type(**data),
+            metadata=ResourceMetadata(
+                id=request_id,
+                version="1.0",
+                status="success",
+            ),
+            links=ResourceLinks(self=url),
+        )
+
+    def _handle_response(
+        self,
+        response: Union[requests.Response, httpx.Response],
+        response_type: Type[R],
+    ) -> Union[ResourceResponse[R], PaginatedResponse[R], ResourceErrorResponse]:
+        """
+        Handle API response and return standardized resource response.
+
+        Accepts responses from both the async (httpx) and sync (requests)
+        transports.
+        """
+        if response.status_code >= 400:
+            self._raise_for_status(response)
+
+        response_data = self._decode_json(response)
+
+        # Check if it's a paginated response
+        if isinstance(response_data, dict) and "pagination" in response_data:
+            return PaginatedResponse[response_type](**response_data)
+
+        # Check if it's a single resource response
+        if isinstance(response_data, dict) and "data" in response_data:
+            return ResourceResponse[response_type](**response_data)
+
+        # Handle error response
+        if isinstance(response_data, dict) and "errors" in response_data:
+            return ResourceErrorResponse(**response_data)
+
+        # Handle raw response
+        return self._wrap_raw_response(
+            response_data,
+            response_type,
+            request_id=str(response.headers.get("X-Request-ID", "")),
+            url=str(response.url),
+        )
 
     async def send(
         self, request: MCPRequest, response_type: Type[R] = MCPResponse
@@ -344,26 +1132,13 @@ class MCPClient:
             MCPValidationError: If the request data is invalid
         """
         try:
-            # Prepare request data
-            if isinstance(request, dict):
-                request_data = request.copy()
-                if "client_info" not in request_data:
-                    request_data["client_info"] = self._client_info.dict()
-            else:
-                request_data = request.dict()
-                if not hasattr(request, "client_info") or request.client_info is None:
-                    request_data["client_info"] = self._client_info.dict()
-
-            # Make the request
-            response = self.session.post(
-                f"{self.endpoint}/api/v1/process",
-                json=request_data,
-                headers=self._prepare_headers(),
-                timeout=self.options.timeout,
-                verify=self.options.verify_ssl,
-            )
+            if self._batcher is not None:
+                request_data = self._prepare_request_data(request)
+                return await self._batcher.submit((request_data, response_type))
 
-            # Handle response
+            response = await self._request(
+                "POST", "/api/v1/process", self._encode_request(request)
+            )
             return self._handle_response(response, response_type)
 
         except Exception as e:
@@ -371,52 +1146,1027 @@ class MCPClient:
                 raise MCPError(f"Unexpected error: {str(e)}") from e
             raise
 
-    def close(self):
-        """Close the client session"""
+    async def stream(
+        self, request: MCPRequest, stream_format: str = "ndjson"
+    ) -> AsyncIterator[MCPStreamChunk]:
+        """
+        Send a request to the MCP API and iterate over its partial results.
+
+        Chunks are yielded as soon as the server produces them, so the first
+        chunk arrives without waiting for the complete response.
+
+        Args:
+            request: The MCP request
+            stream_format: Wire format to request, either "ndjson" or "sse"
+
+        Yields:
+            MCPStreamChunk: Incremental response chunks; the last one has
+            ``done`` set
+
+        Raises:
+            MCPError: If the request fails or the server reports a stream error
+            MCPConfigurationError: If the stream format is not supported
+        """
+        accept = STREAM_MEDIA_TYPES.get(stream_format)
+        if accept is None:
+            raise MCPConfigurationError(
+                f"Unsupported stream format: {stream_format}", setting="stream_format"
+            )
+
+        body, content_encoding = self._compress_body(self._encode_request(request))
+        headers = self._request_headers({"Accept": accept}, content_encoding)
         try:
-            self.session.close()
+            async with self.http_client.stream(
+                "POST",
+                f"{self._choose_endpoint()}/api/v1/process:stream",
+                content=body,
+                headers=headers,
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._raise_for_status(response)
+
+                async for line in response.aiter_lines():
+                    payload = self._parse_stream_line(line)
+                    if payload is None:
+                        continue
+
+                    chunk = MCPStreamChunk(**self.codec.loads(payload))
+                    if chunk.error is not None:
+                        raise MCPError(f"Stream failed: {chunk.error}")
+                    yield chunk
+                    if chunk.done:
+                        return
+
+        except httpx.TransportError as e:
+            raise self._map_transport_error(e) from e
+        except MCPError:
+            raise
         except Exception as e:
-            raise MCPError(f"Failed to close session: {str(e)}") from e
+            raise MCPError(f"Unexpected error: {str(e)}") from e
 
-    async def get_commit(
+    @staticmethod
+    def _parse_stream_line(line: str) -> Optional[str]:
+        """Extract the JSON payload from an NDJSON or Server-Sent Events line"""
+        line = line.strip()
+        if not line or line.startswith(":"):
+            return None
+        if line.startswith("data:"):
+            return line[len("data:") :].strip()
+        if line.startswith(("event:", "id:", "retry:")):
+            return None
+        return line
+
+    async def send_batch(
         self,
-        sha: str,
-        options: Optional[ServerOptions] = None,
-        metadata: Optional[Dict[str, Any]] = None,
-    ) -> ResourceResponse[Commit]:
+        requests: List[Union[MCPRequest, Dict[str, Any]]],
+        response_type: Type[R] = MCPResponse,
+    ) -> List[Union[ResourceResponse[R], MCPError]]:
         """
-        Get a single commit with configurable options.
+        Send several requests to the MCP API in a single round trip.
 
         Args:
-            sha: The commit SHA
-            options: Server options to control what data is included in the response
-            metadata: Additional metadata to include with the request
+            requests: The MCP requests
+            response_type: Expected response type
 
         Returns:
-            ResourceResponse[Commit]: The commit data with metadata
+            List[Union[ResourceResponse[R], MCPError]]: One entry per request, in
+            order: either its response or the error it failed with
 
         Raises:
-            MCPError: If the request fails
-            MCPResourceNotFoundError: If the commit is not found
+            MCPError: If the batch call itself fails
         """
-        try:
-            # Prepare request data
-            request = CommitRequest(sha=sha, options=options, metadata=metadata)
+        return await self._send_batch_items(
+            [
+                (self._prepare_request_data(request), response_type)
+                for request in requests
+            ]
+        )
 
-            # Make the request
-            response = self.session.get(
-                f"{self.endpoint}/api/v1/commits/{sha}",
-                json=request.dict(),
-                headers=self._prepare_headers(),
-                timeout=self.options.timeout,
-                verify=self.options.verify_ssl,
+    async def _send_batch_items(
+        self, items: List[Tuple[Dict[str, Any], Type[BaseModel]]]
+    ) -> List[Union[ResourceResponse[Any], MCPError]]:
+        """Ship prepared requests to the batch endpoint and split the results"""
+        path = "/api/v1/process:batch"
+        try:
+            response = await self._request(
+                "POST", path, {"requests": [data for data, _ in items]}
             )
+            if response.status_code >= 400:
+                self._raise_for_status(response)
+            batch = MCPBatchResponse(**self._decode_json(response))
+        except MCPError:
+            raise
+        except Exception as e:
+            raise MCPError(f"Unexpected error: {str(e)}") from e
 
-            # Handle response
-            return self._handle_response(response, Commit)
+        results: List[Union[ResourceResponse[Any], MCPError]] = [
+            MCPError("No response returned for batch item") for _ in items
+        ]
+        for item in batch.responses:
+            if not 0 <= item.index < len(items):
+                continue
+            if item.error is not None or item.response is None:
+                results[item.index] = self._error_for_status(
+                    item.status_code, {"detail": item.error}
+                )
+                continue
+            try:
+                results[item.index] = self._wrap_raw_response(
+                    item.response.dict(),
+                    items[item.index][1],
+                    request_id=item.response.id,
+                    url=f"{self.endpoint}{path}",
+                )
+            except Exception as e:
+                results[item.index] = MCPError(f"Invalid batch item: {str(e)}")
+        return results
 
-        except MCPResourceNotFoundError:
-            raise MCPResourceNotFoundError(f"Commit {sha} not found")
+    def send_sync(
+        self, request: MCPRequest, response_type: Type[R] = MCPResponse
+    ) -> Union[ResourceResponse[R], PaginatedResponse[R], ResourceErrorResponse]:
+        """
+        Send a request to the MCP API, blocking until the response arrives.
+
+        This is the synchronous facade over the ``requests`` session; prefer
+        ``send`` from async code.
+
+        Args:
+            request: The MCP request
+            response_type: Expected response type
+
+        Returns:
+            Union[ResourceResponse[R], PaginatedResponse[R], ResourceErrorResponse]: The standardized API response
+
+        Raises:
+            MCPError: If the request fails
+            MCPValidationError: If the request data is invalid
+        """
+        try:
+            response = self._session_request(
+                "POST", "/api/v1/process", self._encode_request(request)
+            )
+            return self._handle_response(response, response_type)
+
+        except requests.exceptions.RequestException as e:
+            raise self._map_transport_error(e) from e
+        except Exception as e:
+            if not isinstance(e, MCPError):
+                raise MCPError(f"Unexpected error: {str(e)}") from e
+            raise
+
+    async def send_media(
+        self,
+        media: Union[MediaSource, MediaBody],
+        params: Optional[Dict[str, Any]] = None,
+        response_type: Type[R] = MCPResponse,
+        content_type: Optional[str] = None,
+        path: str = MEDIA_PATH,
+    ) -> Union[ResourceResponse[R], PaginatedResponse[R], ResourceErrorResponse]:
+        """
+        Send media as a raw request body instead of base64 encoded JSON.
+
+        Files are memory-mapped and bytes are sliced without copying, so the
+        payload is streamed in bounded chunks whatever its size. The request
+        parameters travel in a header next to it.
+
+        Args:
+            media: Bytes, a file path, a binary file object, or a MediaBody
+            params: Request parameters, e.g. the operation and its options
+            response_type: Expected response type
+            content_type: Media type of the payload; guessed from the file
+                name if omitted
+            path: Upload path relative to the endpoint
+
+        Returns:
+            Union[ResourceResponse[R], PaginatedResponse[R], ResourceErrorResponse]: The standardized API response
+
+        Raises:
+            MCPError: If the request fails
+        """
+        body = self._media_body(media, content_type)
+        try:
+            response = await self._request(
+                "POST", path, body, headers=self._media_headers(body, params)
+            )
+            return self._handle_response(response, response_type)
+        except Exception as e:
+            if not isinstance(e, MCPError):
+                raise MCPError(f"Unexpected error: {str(e)}") from e
+            raise
+        finally:
+            if body is not media:
+                body.close()
+
+    def send_media_sync(
+        self,
+        media: Union[MediaSource, MediaBody],
+        params: Optional[Dict[str, Any]] = None,
+        response_type: Type[R] = MCPResponse,
+        content_type: Optional[str] = None,
+        path: str = MEDIA_PATH,
+    ) -> Union[ResourceResponse[R], PaginatedResponse[R], ResourceErrorResponse]:
+        """Blocking variant of ``send_media`` over the sync session"""
+        body = self._media_body(media, content_type)
+        try:
+            response = self._session_request(
+                "POST", path, body, headers=self._media_headers(body, params)
+            )
+            return self._handle_response(response, response_type)
+        except requests.exceptions.RequestException as e:
+            raise self._map_transport_error(e) from e
+        except Exception as e:
+            if not isinstance(e, MCPError):
+                raise MCPError(f"Unexpected error: {str(e)}") from e
+            raise
+        finally:
+            if body is not media:
+                body.close()
+
+    async def upload_media(
+        self,
+        media: Union[MediaSource, MediaBody],
+        content_type: Optional[str] = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        concurrency: int = 4,
+        upload_id: Optional[str] = None,
+    ) -> MediaHandle:
+        """
+        Upload large media in parts, several at a time, and get a handle to it.
+
+        The media is split into ``part_size`` parts that are sent in parallel
+        and assembled by the server. Parts are retried like any request; if
+        one still fails, the upload is kept and can be resumed by passing the
+        ``upload_id`` of the raised error, which sends only the missing parts.
+        Later requests reference the media by ``MediaHandle.id`` as the
+        ``media_id`` parameter instead of sending the bytes again.
+
+        Args:
+            media: Bytes, a file path, a binary file object, or a MediaBody
+            content_type: Media type of the payload; guessed from the file
+                name if omitted
+            part_size: Size of every part but the last; ignored when resuming
+            concurrency: Number of parts sent at once
+            upload_id: ID of an interrupted upload to resume
+
+        Returns:
+            MediaHandle: The uploaded media
+
+        Raises:
+            MCPValidationError: If the media or the settings are invalid
+            MCPUploadError: If a part or the assembly fails
+            MCPError: If the upload cannot be started or found
+        """
+        if concurrency <= 0:
+            raise MCPValidationError("concurrency must be positive")
+        body = self._media_body(media, content_type)
+        try:
+            if upload_id is None:
+                request = UploadCreateRequest(
+                    filename=body.filename,
+                    content_type=body.content_type,
+                    size=body.size,
+                    part_size=part_size,
+                )
+                session = await self._upload_call(
+                    "POST",
+                    UPLOADS_PATH,
+                    UploadSession,
+                    self.codec.dump_model(request),
+                )
+            else:
+                session = await self._upload_call(
+                    "GET", f"{UPLOADS_PATH}/{upload_id}", UploadSession
+                )
+
+            try:
+                parts, size = await self._upload_parts(body, session, concurrency)
+                return await self._upload_call(
+                    "POST",
+                    f"{UPLOADS_PATH}/{session.id}/complete",
+                    MediaHandle,
+                    self.codec.dump_model(
+                        UploadCompleteRequest(parts=parts, size=size)
+                    ),
+                )
+            except (MCPError, httpx.HTTPError, OSError) as e:
+                raise MCPUploadError(
+                    f"Upload failed: {str(e)}",
+                    upload_id=session.id,
+                    status_code=getattr(e, "status_code", None),
+                ) from e
+        finally:
+            if body is not media:
+                body.close()
+
+    async def _upload_parts(
+        self, body: MediaBody, session: UploadSession, concurrency: int
+    ) -> Tuple[int, int]:
+        """
+        Send the parts the server does not have yet.
+
+        Workers take parts from one shared iterator, so streams are read
+        sequentially and at most ``concurrency`` parts are in flight.
+
+        Returns:
+            Tuple[int, int]: The number of parts and the total size
+        """
+        received = set(session.received_parts)
+        parts = body.parts(session.part_size)
+        totals = [0, 0]
+
+        async def worker() -> None:
+            for index, data in parts:
+                totals[0] = max(totals[0], index + 1)
+                totals[1] += len(data)
+                if index in received:
+                    continue
+                headers = {
+                    "Content-Type": "application/octet-stream",
+                    "Content-Length": str(len(data)),
+                }
+                response = await self._request(
+                    "PUT",
+                    f"{UPLOADS_PATH}/{session.id}/parts/{index}",
+                    MediaBody(data),
+                    headers=headers,
+                )
+                if response.status_code >= 400:
+                    self._raise_for_status(response)
+
+        if body.size is not None:
+            concurrency = min(concurrency, max(-(-body.size // session.part_size), 1))
+        tasks = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return totals[0], totals[1]
+
+    async def _upload_call(
+        self,
+        method: str,
+        path: str,
+        response_type: Type[T],
+        body: Optional[bytes] = None,
+    ) -> T:
+        """Make a request to the upload resource and parse its JSON response"""
+        response = await self._request(method, path, body)
+        if response.status_code >= 400:
+            self._raise_for_status(response)
+        return response_type(**self._decode_json(response))
+
+    @staticmethod
+    def _media_body(
+        media: Union[MediaSource, MediaBody], content_type: Optional[str]
+    ) -> MediaBody:
+        """Wrap a media source for streaming"""
+        if isinstance(media, MediaBody):
+            return media
+        try:
+            return MediaBody(media, content_type=content_type)
+        except (TypeError, OSError) as e:
+            raise MCPValidationError(f"Invalid media: {str(e)}") from e
+
+    def _media_headers(
+        self, body: MediaBody, params: Optional[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """Build the headers describing a media upload"""
+        headers = {
+            "Content-Type": body.content_type,
+            MEDIA_PARAMS_HEADER: quote(self.codec.dumps(params or {})),
+        }
+        if body.size is not None:
+            headers["Content-Length"] = str(body.size)
+        if body.filename:
+            headers[MEDIA_FILENAME_HEADER] = quote(body.filename)
+        return headers
+
+    async def check_endpoints(
+        self, path: str = "/health", timeout: float = 2.0
+    ) -> Dict[str, bool]:
+        """
+        Run a health check against every endpoint.
+
+        Endpoints that fail the check are ejected from load balancing until
+        their ejection time passes or a later check succeeds.
+
+        Args:
+            path: Health check path relative to each endpoint
+            timeout: Seconds to wait for each endpoint
+
+        Returns:
+            Dict[str, bool]: Whether each endpoint is healthy
+        """
+        endpoints = self.balancer.endpoints if self.balancer else [self.endpoint]
+
+        async def check(endpoint: str) -> bool:
+            try:
+                response = await self.http_client.get(
+                    f"{endpoint}{path}",
+                    headers=self._default_headers(),
+                    timeout=timeout,
+                )
+            except httpx.HTTPError:
+                return False
+            return response.status_code < 500
+
+        results = await asyncio.gather(*(check(endpoint) for endpoint in endpoints))
+        health = dict(zip(endpoints, results))
+        if self.balancer is not None:
+            for endpoint, healthy in health.items():
+                self.balancer.mark_health(endpoint, healthy)
+        return health
+
+    def close(self):
+        """Close the sync client session"""
+        try:
+            self.session.close()
+        except Exception as e:
+            raise MCPError(f"Failed to close session: {str(e)}") from e
+
+    async def aclose(self):
+        """Close the pooled async HTTP client and the sync session"""
+        if self._batcher is not None:
+            await self._batcher.aclose()
+        try:
+            if self._http_client is not None and self._owns_http_client:
+                await self._http_client.aclose()
+                self._http_client = None
+        except Exception as e:
+            raise MCPError(f"Failed to close HTTP client: {str(e)}") from e
+        self.close()
+
+    async def __aenter__(self) -> "MCPClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def iterate(
+        self,
+        path: str,
+        response_type: Type[R],
+        query: Optional[ResourceQuery] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[R]:
+        """
+        Iterate over the items of a paginated resource listing.
+
+        While the items of one page are consumed, up to ``prefetch`` following
+        pages are requested concurrently, so a full scan is bounded by
+        bandwidth rather than by one round trip per page. Pages are still
+        yielded in order. Fetched but unconsumed pages are the only buffer, so
+        ``prefetch`` and ``query.per_page`` bound memory use. Leaving the loop
+        early cancels the pages still in flight.
+
+        Args:
+            path: Path of the listing relative to the endpoint
+            response_type: The model of the listed items
+            query: Filters, sorting and page size; iteration starts at
+                ``query.page`` or the first page
+            prefetch: Maximum number of pages to read ahead; 0 fetches each page
+                only after the previous one was consumed
+
+        Yields:
+            Each item of each page
+
+        Raises:
+            MCPError: If a page request fails
+            MCPConfigurationError: If prefetch is negative
+        """
+        if prefetch < 0:
+            raise MCPConfigurationError(
+                "prefetch cannot be negative", setting="prefetch"
+            )
+
+        query = query or ResourceQuery()
+        pages: "deque[asyncio.Task[PaginatedResponse[R]]]" = deque()
+        next_page = query.page or 1
+        last_page = next_page
+
+        def schedule() -> None:
+            nonlocal next_page
+            pages.append(
+                asyncio.ensure_future(
+                    self._fetch_page(path, response_type, query, next_page)
+                )
+            )
+            next_page += 1
+
+        schedule()
+        try:
+            while pages:
+                result = await pages.popleft()
+                pagination = result.pagination
+                if pagination.has_next:
+                    last_page = max(
+                        last_page, pagination.total_pages, pagination.page + 1
+                    )
+                    while len(pages) < prefetch and next_page <= last_page:
+                        schedule()
+
+                for item in result.data:
+                    yield item
+
+                if not pagination.has_next:
+                    break
+                if not pages and next_page <= last_page:
+                    schedule()
+        finally:
+            for task in pages:
+                task.cancel()
+            await asyncio.gather(*pages, return_exceptions=True)
+
+    async def _fetch_page(
+        self,
+        path: str,
+        response_type: Type[R],
+        query: ResourceQuery,
+        page: int,
+    ) -> PaginatedResponse[R]:
+        """Fetch a single page of a resource listing"""
+        request = query.copy(update={"page": page})
+        result, _ = await self._get_resource(
+            path, self.codec.loads(self.codec.dump_model(request)), response_type
+        )
+        if not isinstance(result, PaginatedResponse):
+            raise MCPError(f"Expected a paginated response from {path}")
+        return result
+
+    async def get_commit(
+        self,
+        sha: str,
+        options: Optional[ServerOptions] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> ResourceResponse[Commit]:
+        """
+        Get a single commit with configurable options.
+
+        Args:
+            sha: The commit SHA
+            options: Server options to control what data is included in the response
+            metadata: Additional metadata to include with the request
+
+        Returns:
+            ResourceResponse[Commit]: The commit data with metadata. When
+            ``options.fields`` is set, the data is a partial model holding only
+            the requested fields. When ``options.include_patches`` is False,
+            file patches are left pending; see ``load_patches``.
+
+        Raises:
+            MCPError: If the request fails
+            MCPResourceNotFoundError: If the commit is not found
+        """
+        try:
+            # Serve immutable commits from the cache when possible
+            if self.commit_cache is not None:
+                cached = await self.commit_cache.aget(sha, options)
+                if cached is not None:
+                    return self._mark_patches_pending(options, cached)
+
+            # Prepare request data
+            request = CommitRequest(sha=sha, options=options, metadata=metadata)
+
+            # Make the request, revalidating a cached response if there is one
+            result, size = await self._get_resource(
+                f"/api/v1/commits/{sha}", request.dict(), self._commit_model(options)
+            )
+            await self._cache_commit(sha, options, result, size)
+            return self._mark_patches_pending(options, result)
+
+        except MCPResourceNotFoundError:
+            raise MCPResourceNotFoundError(f"Commit {sha} not found")
+        except Exception as e:
+            if not isinstance(e, MCPError):
+                raise MCPError(f"Failed to get commit: {str(e)}") from e
+            raise
+
+    async def get_commits(
+        self,
+        shas: List[str],
+        options: Optional[ServerOptions] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        ordered: bool = True,
+        concurrency: int = 10,
+        chunk_size: int = 100,
+    ) -> AsyncIterator[Commit]:
+        """
+        Get many commits, yielding each one as soon as it is available.
+
+        Commits are requested through the server's multi-get endpoint in chunks
+        of ``chunk_size``. If the server does not provide that endpoint, each
+        commit is fetched individually instead. Either way, at most
+        ``concurrency`` requests are in flight. Commits already in the commit
+        cache are served from it.
+
+        Args:
+            shas: The commit SHAs; duplicates are fetched and yielded once
+            options: Server options to control what data is included in the response
+            metadata: Additional metadata to include with the requests
+            ordered: If True, yield commits in the order of ``shas``; otherwise
+                yield them in completion order
+            concurrency: Maximum number of concurrent requests
+            chunk_size: Maximum number of SHAs per multi-get request
+
+        Yields:
+            Commit: Each commit found; SHAs unknown to the server are skipped
+
+        Raises:
+            MCPError: If a request fails
+            MCPConfigurationError: If concurrency or chunk_size is not positive
+        """
+        if concurrency < 1:
+            raise MCPConfigurationError(
+                "concurrency must be at least 1", setting="concurrency"
+            )
+        if chunk_size < 1:
+            raise MCPConfigurationError(
+                "chunk_size must be at least 1", setting="chunk_size"
+            )
+
+        # Results are matched back to the requested SHAs by their sha field
+        if options is not None and options.fields and "sha" not in options.fields:
+            options = model_copy(options, update={"fields": [*options.fields, "sha"]})
+
+        unique = list(dict.fromkeys(shas))
+        found: Dict[str, Optional[Commit]] = {}
+        missing: List[str] = []
+        for sha in unique:
+            cached = (
+                await self.commit_cache.aget(sha, options)
+                if self.commit_cache is not None
+                else None
+            )
+            if cached is not None:
+                found[sha] = self._mark_patches_pending(options, cached).data
+            else:
+                missing.append(sha)
+
+        queue: "asyncio.Queue[Tuple[str, Optional[Commit], Optional[Exception]]]" = (
+            asyncio.Queue()
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        def emit(sha: str, commit: Optional[Commit]) -> None:
+            queue.put_nowait((sha, commit, None))
+
+        async def run(chunk: List[str]) -> None:
+            try:
+                await self._fetch_commit_chunk(
+                    chunk, options, metadata, semaphore, emit
+                )
+            except Exception as e:
+                queue.put_nowait(("", None, e))
+
+        tasks = [
+            asyncio.ensure_future(run(missing[i : i + chunk_size]))
+            for i in range(0, len(missing), chunk_size)
+        ]
+        try:
+            if not ordered:
+                for commit in list(found.values()):
+                    if commit is not None:
+                        yield commit
+
+            next_index = 0
+            remaining = len(missing)
+            while True:
+                if ordered:
+                    while next_index < len(unique) and unique[next_index] in found:
+                        commit = found.pop(unique[next_index])
+                        next_index += 1
+                        if commit is not None:
+                            yield commit
+                if remaining == 0:
+                    break
+
+                sha, commit, error = await queue.get()
+                if error is not None:
+                    raise error
+                remaining -= 1
+                if ordered:
+                    found[sha] = commit
+                elif commit is not None:
+                    yield commit
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled fetches unwind before the generator is closed
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_commit_chunk(
+        self,
+        shas: List[str],
+        options: Optional[ServerOptions],
+        metadata: Optional[Dict[str, Any]],
+        semaphore: asyncio.Semaphore,
+        emit: Callable[[str, Optional[Commit]], None],
+    ) -> None:
+        """Fetch a chunk of commits, falling back to single gets if needed"""
+        if self._multi_get_supported is not False:
+            commits = await self._multi_get_commits(shas, options, metadata, semaphore)
+            if commits is not None:
+                self._multi_get_supported = True
+                for sha in shas:
+                    emit(sha, self._match_commit(sha, commits))
+                return
+            self._multi_get_supported = False
+
+        async def fetch_one(sha: str) -> None:
+            async with semaphore:
+                try:
+                    response = await self.get_commit(sha, options, metadata)
+                except MCPResourceNotFoundError:
+                    emit(sha, None)
+                    return
+            emit(sha, response.data)
+
+        await asyncio.gather(*(fetch_one(sha) for sha in shas))
+
+    async def _multi_get_commits(
+        self,
+        shas: List[str],
+        options: Optional[ServerOptions],
+        metadata: Optional[Dict[str, Any]],
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[Dict[str, Commit]]:
+        """Fetch commits through the multi-get endpoint; None if it is missing"""
+        commits: Dict[str, Commit] = {}
+        page = 1
+        while True:
+            request = CommitBatchRequest(
+                shas=shas,
+                options=options,
+                metadata=metadata,
+                page=page,
+                per_page=len(shas),
+            )
+            async with semaphore:
+                response = await self._request(
+                    "POST", "/api/v1/commits:batchGet", request.dict()
+                )
+            if response.status_code in (404, 405, 501):
+                return None
+
+            commit_model = self._commit_model(options)
+            result = self._handle_response(response, commit_model)
+            if not isinstance(result, PaginatedResponse):
+                raise MCPError("Unexpected response from commit multi-get endpoint")
+
+            for index, commit in enumerate(result.data):
+                self._mark_patches_pending(options, commit)
+                commits[commit.sha] = commit
+                if self.commit_cache is not None and index < len(result.metadata):
+                    await self.commit_cache.aput(
+                        commit.sha,
+                        options,
+                        ResourceResponse[commit_model](
+                            data=commit,
+                            metadata=result.metadata[index],
+                            links=ResourceLinks(self=commit.url),
+                        ),
+                    )
+
+            if not result.pagination.has_next:
+                return commits
+            page += 1
+
+    @staticmethod
+    def _match_commit(sha: str, commits: Dict[str, Commit]) -> Optional[Commit]:
+        """Find the commit for a requested, possibly abbreviated, SHA"""
+        commit = commits.get(sha)
+        if commit is not None:
+            return commit
+        prefix = sha.lower()
+        for full_sha, commit in commits.items():
+            if full_sha.lower().startswith(prefix):
+                return commit
+        return None
+
+    @staticmethod
+    def _commit_model(options: Optional[ServerOptions]) -> Type[BaseModel]:
+        """Get the commit model to parse, honoring field projection"""
+        return resolve_model(Commit, options.fields if options else None)
+
+    @classmethod
+    def _mark_patches_pending(
+        cls, options: Optional[ServerOptions], result: Any
+    ) -> Any:
+        """Mark the file patches of a commit fetched without patches as pending"""
+        if options is None or options.include_patches:
+            return result
+
+        commit = result.data if isinstance(result, ResourceResponse) else result
+        for commit_file in cls._commit_files(commit):
+            commit_file.mark_patch_pending()
+        return result
+
+    @staticmethod
+    def _commit_files(commit: Any) -> List[CommitFile]:
+        """Collect the file models of a commit, including those in its stats"""
+        files = list(getattr(commit, "files", None) or [])
+        stats = getattr(commit, "stats", None)
+        files.extend(getattr(stats, "files", None) or [])
+        return [f for f in files if isinstance(f, CommitFile)]
+
+    async def get_commit_patches(
+        self,
+        sha: str,
+        filenames: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get the patch bodies of a commit's files.
+
+        Args:
+            sha: The commit SHA
+            filenames: Files to get patches for; all files if omitted
+            metadata: Additional metadata to include with the request
+
+        Returns:
+            Dict[str, Optional[str]]: Patch bodies keyed by filename
+
+        Raises:
+            MCPError: If the request fails
+            MCPResourceNotFoundError: If the commit is not found
+        """
+        try:
+            request = CommitPatchRequest(
+                sha=sha, filenames=filenames, metadata=metadata
+            )
+            result, _ = await self._get_resource(
+                f"/api/v1/commits/{sha}/patches", request.dict(), CommitPatches
+            )
+            return result.data.patches
+
+        except MCPResourceNotFoundError:
+            raise MCPResourceNotFoundError(f"Commit {sha} not found")
+        except Exception as e:
+            if not isinstance(e, MCPError):
+                raise MCPError(f"Failed to get commit patches: {str(e)}") from e
+            raise
+
+    def get_commit_patches_sync(
+        self,
+        sha: str,
+        filenames: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get the patch bodies of a commit's files, blocking until they arrive.
+
+        Args:
+            sha: The commit SHA
+            filenames: Files to get patches for; all files if omitted
+            metadata: Additional metadata to include with the request
+
+        Returns:
+            Dict[str, Optional[str]]: Patch bodies keyed by filename
+
+        Raises:
+            MCPError: If the request fails
+            MCPResourceNotFoundError: If the commit is not found
+        """
+        try:
+            request = CommitPatchRequest(
+                sha=sha, filenames=filenames, metadata=metadata
+            )
+            result, _ = self._get_resource_sync(
+                f"/api/v1/commits/{sha}/patches", request.dict(), CommitPatches
+            )
+            return result.data.patches
+
+        except MCPResourceNotFoundError:
+            raise MCPResourceNotFoundError(f"Commit {sha} not found")
+        except requests.exceptions.RequestException as e:
+            raise self._map_transport_error(e) from e
+        except Exception as e:
+            if not isinstance(e, MCPError):
+                raise MCPError(f"Failed to get commit patches: {str(e)}") from e
+            raise
+
+    async def load_patches(
+        self, commit: Commit, filenames: Optional[List[str]] = None
+    ) -> None:
+        """
+        Load the pending patches of a commit in a single request.
+
+        Patches that are already loaded are not fetched again, so this can be
+        called for just the files about to be read.
+
+        Args:
+            commit: A commit fetched with ``include_patches=False``
+            filenames: Files to load; all pending files if omitted
+        """
+        pending = self._pending_patches(commit, filenames)
+        if not pending:
+            return
+
+        patches = await self.get_commit_patches(commit.sha, list(pending))
+        self._fill_patches(pending, patches)
+
+    def load_patches_sync(
+        self, commit: Commit, filenames: Optional[List[str]] = None
+    ) -> None:
+        """
+        Load the pending patches of a commit, blocking until they arrive.
+
+        This is the synchronous counterpart of ``load_patches``.
+
+        Args:
+            commit: A commit fetched with ``include_patches=False``
+            filenames: Files to load; all pending files if omitted
+        """
+        pending = self._pending_patches(commit, filenames)
+        if not pending:
+            return
+
+        patches = self.get_commit_patches_sync(commit.sha, list(pending))
+        self._fill_patches(pending, patches)
+
+    @classmethod
+    def _pending_patches(
+        cls, commit: Commit, filenames: Optional[List[str]]
+    ) -> Dict[str, List[CommitFile]]:
+        """Group a commit's files with pending patches by filename"""
+        pending: Dict[str, List[CommitFile]] = {}
+        for commit_file in cls._commit_files(commit):
+            if commit_file.patch_pending and (
+                filenames is None or commit_file.filename in filenames
+            ):
+                pending.setdefault(commit_file.filename, []).append(commit_file)
+        return pending
+
+    @staticmethod
+    def _fill_patches(
+        pending: Dict[str, List[CommitFile]], patches: Dict[str, Optional[str]]
+    ) -> None:
+        """Store loaded patch bodies on the files waiting for them"""
+        for filename, files in pending.items():
+            for commit_file in files:
+                commit_file.set_patch(patches.get(filename))
+
+    async def _cache_commit(
+        self,
+        sha: str,
+        options: Optional[ServerOptions],
+        result: Any,
+        size: Optional[int] = None,
+    ) -> None:
+        """Store a successfully fetched commit in the commit cache"""
+        if self.commit_cache is not None and isinstance(result, ResourceResponse):
+            await self.commit_cache.aput(sha, options, result, size=size)
+
+    def get_commit_sync(
+        self,
+        sha: str,
+        options: Optional[ServerOptions] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> ResourceResponse[Commit]:
+        """
+        Get a single commit, blocking until the response arrives.
+
+        This is the synchronous facade over the ``requests`` session; prefer
+        ``get_commit`` from async code.
+
+        Args:
+            sha: The commit SHA
+            options: Server options to control what data is included in the response
+            metadata: Additional metadata to include with the request
+
+        Returns:
+            ResourceResponse[Commit]: The commit data with metadata. When
+            ``options.fields`` is set, the data is a partial model holding only
+            the requested fields. When ``options.include_patches`` is False,
+            file patches are left pending; see ``load_patches``.
+
+        Raises:
+            MCPError: If the request fails
+            MCPResourceNotFoundError: If the commit is not found
+        """
+        try:
+            if self.commit_cache is not None:
+                cached = self.commit_cache.get(sha, options)
+                if cached is not None:
+                    return self._mark_patches_pending(options, cached)
+
+            request = CommitRequest(sha=sha, options=options, metadata=metadata)
+
+            result, size = self._get_resource_sync(
+                f"/api/v1/commits/{sha}", request.dict(), self._commit_model(options)
+            )
+            if self.commit_cache is not None and isinstance(result, ResourceResponse):
+                self.commit_cache.put(sha, options, result, size=size)
+            return self._mark_patches_pending(options, result)
+
+        except MCPResourceNotFoundError:
+            raise MCPResourceNotFoundError(f"Commit {sha} not found")
+        except requests.exceptions.RequestException as e:
+            raise self._map_transport_error(e) from e
         except Exception as e:
             if not isinstance(e, MCPError):
                 raise MCPError(f"Failed to get commit: {str(e)}") from e
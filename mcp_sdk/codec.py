@@ -0,0 +1,159 @@
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Union
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from .exceptions import MCPConfigurationError
+
+
+def _default(value: Any) -> Any:
+    """Convert values the JSON backends do not handle natively"""
+    if isinstance(value, BaseModel):
+        if hasattr(value, "model_dump"):
+            return value.model_dump(mode="json")
+        return json.loads(value.json())
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """
+    Encodes and decodes JSON documents as bytes.
+
+    This base class uses the standard library. Subclasses plug in faster
+    backends; ``get_codec`` picks the best one that is installed.
+    """
+
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as compact UTF-8 JSON"""
+        return json.dumps(
+            value, separators=(",", ":"), ensure_ascii=False, default=_default
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode a JSON document"""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dump_model(self, model: BaseModel, **kwargs: Any) -> bytes:
+        """
+        Encode a pydantic model straight to JSON bytes.
+
+        On pydantic 2 the model's own serializer writes the JSON without
+        building an intermediate dict, whatever the backend.
+
+        Args:
+            model: The model to encode
+            **kwargs: Serialization options such as ``by_alias``,
+                ``exclude_none`` or ``exclude``
+        """
+        serializer = getattr(model, "__pydantic_serializer__", None)
+        if serializer is not None:
+            return serializer.to_json(model, **kwargs)
+        return model.json(**kwargs).encode("utf-8")
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, value: Any) -> bytes:
+        return self._dumps(value, default=_default, option=self._options)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec backed by msgspec"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder(enc_hook=_default)
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            # Match the ValueError raised by the other backends
+            raise ValueError(str(e)) from e
+
+
+# Backends in order of preference
+CODECS: Dict[str, Callable[[], JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JSONCodec,
+}
+
+_default_codec: Optional[JSONCodec] = None
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Get a JSON codec.
+
+    Args:
+        name: Backend to use ("orjson", "msgspec" or "json"). If omitted, the
+            fastest installed backend is used, falling back to the standard
+            library.
+
+    Returns:
+        JSONCodec: The codec
+
+    Raises:
+        MCPConfigurationError: If the backend is unknown or not installed
+    """
+    global _default_codec
+
+    if name is None:
+        if _default_codec is None:
+            for factory in CODECS.values():
+                try:
+                    _default_codec = factory()
+                    break
+                except ImportError:
+                    continue
+        return _default_codec
+
+    factory = CODECS.get(name)
+    if factory is None:
+        raise MCPConfigurationError(f"Unknown JSON codec: {name}", setting="codec")
+    try:
+        return factory()
+    except ImportError as e:
+        raise MCPConfigurationError(
+            f"JSON codec '{name}' requires the '{name}' package", setting="codec"
+        ) from e
@@ -0,0 +1,255 @@
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+from .exceptions import MCPConfigurationError, MCPPayloadTooLargeError
+
+# Default compression levels; both favour speed over ratio
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Media types that are already compressed and not worth compressing again
+_INCOMPRESSIBLE_PREFIXES = ("image/", "video/", "audio/")
+_COMPRESSIBLE_EXCEPTIONS = ("image/svg+xml",)
+
+# A zstd block decodes to at most 128 KiB and takes at least 4 input bytes
+# (3-byte header plus one byte of content), which bounds the output of a slice
+_ZSTD_BLOCK_SIZE = 128 * 1024
+_ZSTD_MIN_BLOCK_INPUT = 4
+
+
+def available_encodings() -> List[str]:
+    """Get the supported content codings, best first"""
+    if zstandard is not None:
+        return ["zstd", "gzip"]
+    return ["gzip"]
+
+
+def decodable_encodings() -> List[str]:
+    """
+    Get the codings the client's HTTP transports can decode, best first.
+
+    zstd is only offered when both httpx and urllib3 decode it, which needs
+    httpx 0.27.1 or later and urllib3 2 built with zstd support.
+    """
+    if _transports_decode_zstd():
+        return ["zstd", "gzip"]
+    return ["gzip"]
+
+
+def accept_encoding() -> str:
+    """Build an ``Accept-Encoding`` header value for the decodable codings"""
+    return ", ".join(decodable_encodings())
+
+
+@lru_cache(maxsize=None)
+def _transports_decode_zstd() -> bool:
+    """Return True if both httpx and urllib3 decode zstd responses"""
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+        from urllib3.util.request import ACCEPT_ENCODING
+    except ImportError:
+        return False
+    return "zstd" in SUPPORTED_DECODERS and "zstd" in ACCEPT_ENCODING.split(",")
+
+
+def negotiate(
+    accept: Optional[str], supported: Optional[Sequence[str]] = None
+) -> Optional[str]:
+    """
+    Pick a content coding from an ``Accept-Encoding`` header.
+
+    Args:
+        accept: The header value
+        supported: Codings the caller can produce, best first
+
+    Returns:
+        Optional[str]: The chosen coding, or None to send the body as is
+    """
+    if not accept:
+        return None
+    supported = list(supported or available_encodings())
+    weights: Dict[str, float] = {}
+    for item in accept.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            weights[name] = quality
+
+    wildcard = weights.get("*", 0.0)
+    best = None
+    best_quality = 0.0
+    for coding in supported:
+        quality = weights.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class Compressor:
+    """Incremental compressor for one content coding"""
+
+    def __init__(self, encoding: str, level: Optional[int] = None):
+        """
+        Initialize the compressor.
+
+        Args:
+            encoding: "gzip" or "zstd"
+            level: Compression level; defaults to a fast level for the coding
+
+        Raises:
+            MCPConfigurationError: If the coding is not supported
+        """
+        self.encoding = encoding
+        self._compressor: Any
+        if encoding == "gzip":
+            self._compressor = zlib.compressobj(
+                GZIP_LEVEL if level is None else level,
+                zlib.DEFLATED,
+                16 + zlib.MAX_WBITS,
+            )
+            self._sync_flush = zlib.Z_SYNC_FLUSH
+            self._finish = zlib.Z_FINISH
+        elif encoding == "zstd" and zstandard is not None:
+            self._compressor = zstandard.ZstdCompressor(
+                level=ZSTD_LEVEL if level is None else level
+            ).compressobj()
+            self._sync_flush = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            self._finish = zstandard.COMPRESSOBJ_FLUSH_FINISH
+        else:
+            raise MCPConfigurationError(
+                f"Unsupported content encoding: {encoding}", setting="compression"
+            )
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk; output may be held back until a flush"""
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Emit everything compressed so far, keeping the stream open"""
+        return self._compressor.flush(self._sync_flush)
+
+    def finish(self) -> bytes:
+        """End the stream"""
+        return self._compressor.flush(self._finish)
+
+
+class Decompressor:
+    """
+    Incremental decompressor for one content coding.
+
+    With ``max_size`` set, output stops shortly past the limit (one byte for
+    gzip, two blocks for zstd), so a small, highly compressed body cannot
+    expand without bound.
+    """
+
+    def __init__(self, encoding: str, max_size: Optional[int] = None):
+        """
+        Initialize the decompressor.
+
+        Args:
+            encoding: "gzip" or "zstd"
+            max_size: Largest total output in bytes; unlimited if omitted
+
+        Raises:
+            MCPConfigurationError: If the coding is not supported
+        """
+        self.encoding = encoding
+        self.max_size = max_size
+        self._size = 0
+        self._decompressor: Any
+        if encoding == "gzip":
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "zstd" and zstandard is not None:
+            self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+        else:
+            raise MCPConfigurationError(
+                f"Unsupported content encoding: {encoding}", setting="compression"
+            )
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Decompress a chunk.
+
+        Raises:
+            MCPPayloadTooLargeError: If the output exceeds ``max_size``
+        """
+        if self.max_size is not None and self.encoding == "gzip":
+            # Stop zlib one byte past the limit instead of inflating the chunk
+            return self._count(
+                self._decompressor.decompress(data, self.max_size - self._size + 1)
+            )
+        if self.max_size is not None:
+            return self._decompress_zstd_bounded(data, self.max_size)
+        return self._count(self._decompressor.decompress(data))
+
+    def _decompress_zstd_bounded(self, data: bytes, max_size: int) -> bytes:
+        """
+        Decompress a zstd chunk in slices sized to the remaining budget.
+
+        zstd has no output limit per call, so the input is fed a few blocks at
+        a time; output stops at most two blocks past ``max_size``.
+        """
+        output = []
+        position = 0
+        while position < len(data):
+            blocks = max(1, (max_size - self._size) // _ZSTD_BLOCK_SIZE)
+            end = position + blocks * _ZSTD_MIN_BLOCK_INPUT
+            chunk = self._decompressor.decompress(data[position:end])
+            output.append(self._count(chunk))
+            position = end
+        return b"".join(output)
+
+    def flush(self) -> bytes:
+        """
+        Return any remaining output.
+
+        Raises:
+            MCPPayloadTooLargeError: If the output exceeds ``max_size``
+        """
+        if self.max_size is not None and self.encoding == "gzip":
+            return self._count(self._decompressor.flush(self.max_size - self._size + 1))
+        return self._count(self._decompressor.flush())
+
+    def _count(self, output: bytes) -> bytes:
+        """Add output to the running total, enforcing the limit"""
+        self._size += len(output)
+        if self.max_size is not None and self._size > self.max_size:
+            raise MCPPayloadTooLargeError(
+                "Decompressed body is too large", limit=self.max_size
+            )
+        return output
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """Compress a complete body"""
+    compressor = Compressor(encoding, level)
+    return compressor.compress(data) + compressor.finish()
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """Decompress a complete body"""
+    decompressor = Decompressor(encoding)
+    return decompressor.decompress(data) + decompressor.flush()
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    """Return True if a body of this media type benefits from compression"""
+    if not content_type:
+        return True
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type in _COMPRESSIBLE_EXCEPTIONS:
+        return True
+    return not media_type.startswith(_INCOMPRESSIBLE_PREFIXES)
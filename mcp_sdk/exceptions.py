@@ -131,6 +131,54 @@ class MCPConfigurationError(MCPError):
         super().__init__(message, **kwargs)
 
 
+class MCPCircuitOpenError(MCPError):
+    """Raised when calls to an endpoint are short-circuited by a circuit breaker"""
+
+    def __init__(
+        self,
+        message: str = "Circuit breaker is open",
+        endpoint: Optional[str] = None,
+        retry_after: Optional[float] = None,
+        **kwargs,
+    ):
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        if endpoint:
+            message = f"{message} for endpoint: {endpoint}"
+        super().__init__(message, **kwargs)
+
+
+class MCPUploadError(MCPError):
+    """Raised when a chunked upload fails; it can be resumed by its ID"""
+
+    def __init__(
+        self,
+        message: str = "Upload failed",
+        upload_id: Optional[str] = None,
+        **kwargs,
+    ):
+        self.upload_id = upload_id
+        if upload_id:
+            message = f"{message} for upload: {upload_id}"
+        super().__init__(message, **kwargs)
+
+
+class MCPPayloadTooLargeError(MCPError):
+    """Raised when a body grows past its size limit, e.g. while being decompressed"""
+
+    def __init__(
+        self,
+        message: str = "Payload too large",
+        limit: Optional[int] = None,
+        **kwargs,
+    ):
+        self.limit = limit
+        if limit is not None:
+            message = f"{message} (limit: {limit} bytes)"
+        kwargs.setdefault("status_code", 413)
+        super().__init__(message, **kwargs)
+
+
 class MCPSessionExpiredError(MCPAuthenticationError):
     """Raised when a session has expired and cannot be refreshed"""
 
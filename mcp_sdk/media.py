@@ -0,0 +1,257 @@
+import io
+import mimetypes
+import mmap
+import os
+from typing import Any, AsyncIterator, BinaryIO, Iterator, Optional, Tuple, Union
+
+MediaSource = Union[bytes, bytearray, memoryview, str, "os.PathLike[str]", BinaryIO]
+
+# Size of the slices a body is sent in
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+# Size of the parts a chunked upload is split into
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+# Headers carrying the request parameters and file name of a raw media upload,
+# as percent-encoded JSON and text
+MEDIA_PARAMS_HEADER = "X-MCP-Params"
+MEDIA_FILENAME_HEADER = "X-MCP-Filename"
+
+
+class MediaBody:
+    """
+    A media payload that is streamed as a raw request body.
+
+    The payload is never base64 encoded or copied as a whole: bytes are
+    sliced through a ``memoryview``, files are memory-mapped, and in-memory
+    buffers such as ``io.BytesIO`` are read through their buffer. Only plain
+    streams that offer none of these are read chunk by chunk, so memory use
+    per request stays bounded by ``chunk_size``.
+
+    Bodies backed by memory, files or seekable streams can be sent again, e.g.
+    on a retry; other streams can be sent once.
+    """
+
+    def __init__(
+        self,
+        source: MediaSource,
+        content_type: Optional[str] = None,
+        filename: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Wrap a media source.
+
+        Args:
+            source: Bytes, a file path, or a binary file object
+            content_type: Media type of the payload; guessed from the file
+                name if omitted
+            filename: Name reported to the server; defaults to the file's name
+            chunk_size: Size of the slices the body is sent in
+
+        Raises:
+            ValueError: If the chunk size is not positive
+            TypeError: If the source is not a supported type
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        self.chunk_size = chunk_size
+        self._base: Optional[memoryview] = None
+        self._view: Optional[memoryview] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._stream: Optional[BinaryIO] = None
+        self._start = 0
+        self._owned_file: Optional[BinaryIO] = None
+        self.size: Optional[int] = None
+
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self._view = memoryview(source).cast("B")
+        elif isinstance(source, (str, os.PathLike)):
+            filename = filename or os.path.basename(os.fspath(source))
+            self._owned_file = open(source, "rb")
+            self._open_file(self._owned_file)
+        elif hasattr(source, "read"):
+            filename = filename or self._stream_name(source)
+            self._open_file(source)
+        else:
+            raise TypeError(f"Unsupported media source: {type(source).__name__}")
+
+        if self._view is not None:
+            self.size = self._view.nbytes
+        self.filename = filename
+        self.content_type = (
+            content_type
+            or (filename and mimetypes.guess_type(filename)[0])
+            or DEFAULT_CONTENT_TYPE
+        )
+
+    @staticmethod
+    def _stream_name(stream: Any) -> Optional[str]:
+        name = getattr(stream, "name", None)
+        return os.path.basename(name) if isinstance(name, str) else None
+
+    def _open_file(self, stream: BinaryIO) -> None:
+        """Pick the cheapest way to read a file object"""
+        if isinstance(stream, io.BytesIO):
+            self._base = stream.getbuffer()
+            self._view = self._base[stream.tell() :]
+            return
+
+        try:
+            fileno = stream.fileno()
+            start = stream.tell()
+            length = os.fstat(fileno).st_size - start
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            fileno = None
+
+        if fileno is not None and length > 0:
+            try:
+                self._mmap = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self._mmap = None
+            if self._mmap is not None:
+                self._base = memoryview(self._mmap)
+                self._view = self._base[start:]
+                return
+        if fileno is not None and length == 0:
+            self._view = memoryview(b"")
+            return
+
+        self._stream = stream
+        if self._seekable(stream):
+            self._start = stream.tell()
+            self.size = stream.seek(0, io.SEEK_END) - self._start
+            stream.seek(self._start)
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the body can be sent more than once"""
+        return self._stream is None or self._seekable(self._stream)
+
+    @staticmethod
+    def _seekable(stream: BinaryIO) -> bool:
+        seekable = getattr(stream, "seekable", None)
+        return bool(seekable and seekable())
+
+    def chunks(self) -> Iterator[Union[memoryview, bytes]]:
+        """Iterate over the body in slices of at most ``chunk_size`` bytes"""
+        if self._view is not None:
+            for offset in range(0, self._view.nbytes, self.chunk_size):
+                yield self._view[offset : offset + self.chunk_size]
+            return
+
+        if self._seekable(self._stream):
+            self._stream.seek(self._start)
+        while True:
+            chunk = self._stream.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def parts(
+        self, part_size: int = DEFAULT_PART_SIZE
+    ) -> Iterator[Tuple[int, Union[memoryview, bytes]]]:
+        """
+        Split the body into numbered parts for a chunked upload.
+
+        Memory-backed and memory-mapped bodies yield views, so no part is
+        copied; streams are read one part at a time. An empty body yields a
+        single empty part.
+
+        Args:
+            part_size: Size of every part but the last
+
+        Yields:
+            Tuple[int, Union[memoryview, bytes]]: The part index and its data
+        """
+        if part_size <= 0:
+            raise ValueError("part_size must be positive")
+
+        if self._view is not None:
+            total = self._view.nbytes
+            for index, offset in enumerate(range(0, max(total, 1), part_size)):
+                yield index, self._view[offset : offset + part_size]
+            return
+
+        if self._seekable(self._stream):
+            self._stream.seek(self._start)
+        index = 0
+        while True:
+            part = self._read_exactly(part_size)
+            if not part and index:
+                return
+            yield index, part
+            if len(part) < part_size:
+                return
+            index += 1
+
+    def _read_exactly(self, size: int) -> bytes:
+        """Read up to ``size`` bytes, stopping early only at the end of the stream"""
+        data = self._stream.read(size)
+        if not data or len(data) == size:
+            return data
+        buffer = bytearray(data)
+        while len(buffer) < size:
+            data = self._stream.read(size - len(buffer))
+            if not data:
+                break
+            buffer += data
+        return bytes(buffer)
+
+    def sync_stream(self) -> "_SyncStream":
+        """Get a fresh iterable of the body for a blocking transport"""
+        return _SyncStream(self)
+
+    def async_stream(self) -> "_AsyncStream":
+        """Get a fresh async iterable of the body for the async transport"""
+        return _AsyncStream(self)
+
+    def close(self) -> None:
+        """Release the memory map and any file opened by this body"""
+        for view in (self._view, self._base):
+            if view is not None:
+                view.release()
+        self._view = self._base = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A slice is still referenced; the map closes once it is freed
+                pass
+            self._mmap = None
+        if self._owned_file is not None:
+            self._owned_file.close()
+            self._owned_file = None
+
+    def __enter__(self) -> "MediaBody":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class _SyncStream:
+    """Iterable over a media body, sized so transports can set Content-Length"""
+
+    def __init__(self, body: MediaBody):
+        self._body = body
+
+    def __iter__(self) -> Iterator[Union[memoryview, bytes]]:
+        return self._body.chunks()
+
+    def __len__(self) -> int:
+        return self._body.size or 0
+
+
+class _AsyncStream:
+    """Async iterable over a media body"""
+
+    def __init__(self, body: MediaBody):
+        self._body = body
+
+    async def __aiter__(self) -> AsyncIterator[Union[memoryview, bytes]]:
+        for chunk in self._body.chunks():
+            yield chunk
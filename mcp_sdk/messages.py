@@ -1,5 +1,6 @@
-from typing import Optional, Dict, Any, TypeVar, Generic, Type, Union
+from typing import Optional, Dict, Any, AsyncIterator, TypeVar, Generic, Type, Union
 from pydantic import BaseModel, Field
+import re
 from datetime import datetime
 from enum import Enum
 
@@ -79,6 +80,16 @@ class MessageHandler(Generic[T, P, R]):
         """Process a message and return a typed response"""
         raise NotImplementedError("Subclasses must implement process()")
 
+    async def stream(self, message: BaseMessage[T, P]) -> AsyncIterator[R]:
+        """
+        Process a message, yielding partial results as they become available.
+
+        The default implementation yields the complete result of process()
+        once; handlers that can produce output incrementally should override it.
+        """
+        response = await self.process(message)
+        yield response.result
+
     def validate(self, message: BaseMessage[T, P]) -> None:
         """Validate a message before processing"""
         if message.type != self.message_type:
@@ -97,15 +108,26 @@ class MessageProcessor:
         """Register a message handler"""
         self._handlers[handler.message_type] = handler
 
-    async def process(self, message: BaseMessage) -> MessageResponse:
-        """Process a message using the appropriate handler"""
+    def _get_handler(self, message: BaseMessage) -> MessageHandler:
+        """Get the validated handler for a message"""
         handler = self._handlers.get(message.type)
         if not handler:
             raise ValueError(f"No handler registered for message type: {message.type}")
 
         handler.validate(message)
+        return handler
+
+    async def process(self, message: BaseMessage) -> MessageResponse:
+        """Process a message using the appropriate handler"""
+        handler = self._get_handler(message)
         return await handler.process(message)
 
+    async def stream(self, message: BaseMessage) -> AsyncIterator[Any]:
+        """Process a message, yielding partial results from the appropriate handler"""
+        handler = self._get_handler(message)
+        async for result in handler.stream(message):
+            yield result
+
 
 # Example usage:
 class TextParameters(BaseModel):
@@ -171,3 +193,13 @@ class TextHandler(MessageHandler[TextContent, TextParameters, TextResult]):
             metadata=message.metadata,
             processing_time=0.1,
         )
+
+    async def stream(self, message: TextMessage) -> AsyncIterator[TextResult]:
+        # Emit the processed text one word (with trailing whitespace) at a time
+        for piece in re.findall(r"\S+\s*|\s+", message.content.text):
+            yield TextResult(
+                processed_text=piece.upper(),
+                language=message.context.parameters.language or "en",
+                confidence=1.0,
+                parameters=message.context.parameters,
+            )
@@ -1,5 +1,5 @@
 from typing import Optional, Dict, Any, List, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 
 
@@ -33,6 +33,83 @@ class MCPResponse(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
+class MCPStreamChunk(BaseModel):
+    """A single incremental chunk of a streamed MCP API response"""
+
+    id: str
+    model: str
+    index: int
+    content: str
+    done: bool = Field(default=False)
+    usage: Optional[Dict[str, int]] = None
+    metadata: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class MCPBatchRequest(BaseModel):
+    """
+    Batch of MCP API requests processed in a single call.
+
+    Requests are validated one by one, so a malformed request fails only its
+    own item.
+    """
+
+    requests: List[Dict[str, Any]]
+
+
+class MCPBatchItem(BaseModel):
+    """Result of a single request within a batch"""
+
+    index: int
+    status_code: int = Field(default=200)
+    response: Optional[MCPResponse] = None
+    error: Optional[str] = None
+
+
+class MCPBatchResponse(BaseModel):
+    """MCP API batch response model, one item per request in order"""
+
+    responses: List[MCPBatchItem]
+
+
+class UploadCreateRequest(BaseModel):
+    """Request model for starting a chunked media upload"""
+
+    filename: Optional[str] = None
+    content_type: str = Field(default="application/octet-stream")
+    size: Optional[int] = Field(default=None, ge=0)
+    part_size: int = Field(default=8 * 1024 * 1024, gt=0)
+
+
+class UploadSession(BaseModel):
+    """State of a chunked media upload; received parts allow resuming it"""
+
+    id: str
+    filename: Optional[str] = None
+    content_type: str
+    size: Optional[int] = None
+    part_size: int
+    received_parts: List[int] = Field(default_factory=list)
+    expires_at: datetime
+
+
+class UploadCompleteRequest(BaseModel):
+    """Request model for assembling the parts of a chunked media upload"""
+
+    parts: int = Field(ge=1)
+    size: int = Field(ge=0)
+
+
+class MediaHandle(BaseModel):
+    """Reference to uploaded media that later requests use instead of the bytes"""
+
+    id: str
+    filename: Optional[str] = None
+    content_type: str
+    size: int
+    expires_at: datetime
+
+
 class ClientInfo(BaseModel):
     """Client information model"""
 
@@ -65,7 +142,12 @@ class ClientConfig(BaseModel):
 
 
 class CommitFile(BaseModel):
-    """Model for a file in a commit"""
+    """
+    Model for a file in a commit.
+
+    Commits fetched without patches mark their files' patches as pending;
+    ``patch`` stays None until they are loaded with ``MCPClient.load_patches``.
+    """
 
     filename: str
     status: str
@@ -76,6 +158,30 @@ class CommitFile(BaseModel):
     raw_url: Optional[str] = None
     blob_url: Optional[str] = None
 
+    _patch_pending: bool = PrivateAttr(default=False)
+    _patch_loaded: bool = PrivateAttr(default=False)
+
+    @property
+    def patch_pending(self) -> bool:
+        """Whether the patch body was left out and is not loaded yet"""
+        return self._patch_pending
+
+    def mark_patch_pending(self) -> None:
+        """
+        Mark the patch body as left out of the response.
+
+        Files that already hold a patch, or whose patch was loaded before, are
+        left unchanged.
+        """
+        if self.patch is None and not self._patch_loaded:
+            self._patch_pending = True
+
+    def set_patch(self, patch: Optional[str]) -> None:
+        """Store a loaded patch body"""
+        self.patch = patch
+        self._patch_pending = False
+        self._patch_loaded = True
+
 
 class CommitStats(BaseModel):
     """Model for commit statistics"""
@@ -133,6 +239,14 @@ class ServerOptions(BaseModel):
     include_parents: bool = Field(default=True, description="Include parent commits")
     include_stats: bool = Field(default=True, description="Include commit statistics")
     include_files: bool = Field(default=True, description="Include file changes")
+    include_patches: bool = Field(
+        default=True,
+        description="Include file patch bodies; left pending for load_patches if False",
+    )
+    fields: Optional[List[str]] = Field(
+        default=None,
+        description="Field paths to return, e.g. 'author.name'; all fields if omitted",
+    )
     custom_options: Optional[Dict[str, Any]] = Field(
         default=None, description="Additional custom options"
     )
@@ -144,3 +258,28 @@ class CommitRequest(BaseModel):
     sha: str
     options: Optional[ServerOptions] = None
     metadata: Optional[Dict[str, Any]] = None
+
+
+class CommitBatchRequest(BaseModel):
+    """Request model for getting several commits at once"""
+
+    shas: List[str]
+    options: Optional[ServerOptions] = None
+    metadata: Optional[Dict[str, Any]] = None
+    page: int = Field(default=1, ge=1)
+    per_page: Optional[int] = Field(default=None, gt=0)
+
+
+class CommitPatchRequest(BaseModel):
+    """Request model for getting the patch bodies of a commit's files"""
+
+    sha: str
+    filenames: Optional[List[str]] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+
+class CommitPatches(BaseModel):
+    """Model for the patch bodies of a commit's files, keyed by filename"""
+
+    sha: str
+    patches: Dict[str, Optional[str]] = Field(default_factory=dict)
@@ -0,0 +1,95 @@
+"""
+Media requests shared by the audio and video products.
+
+Media is either sent as the raw request body or, once uploaded with
+``MCPClient.upload_media``, referenced by its ``media_id`` so the bytes are
+not sent again.
+"""
+
+import os
+from typing import Any, BinaryIO, Optional, Union
+
+from ..client import MCPClient
+from ..exceptions import MCPError, MCPValidationError
+from ..media import MediaSource
+from ..models import MCPResponse, MediaHandle
+from ..resources import ResourceErrorResponse, ResourceResponse
+
+# Media given to a product entry point: the payload itself or the handle of
+# an earlier upload
+MediaInput = Union[MediaSource, MediaHandle]
+
+# Media the products can read locally
+LocalMedia = Union[str, "os.PathLike[str]", bytes, bytearray, BinaryIO]
+
+
+def is_remote(media: Any, client: Optional[MCPClient], media_id: Optional[str]) -> bool:
+    """Whether a request must go to the server rather than be handled locally"""
+    return client is not None or media_id is not None or isinstance(media, MediaHandle)
+
+
+def local_media(media: Optional[MediaInput]) -> LocalMedia:
+    """
+    Get media to process locally.
+
+    Raises:
+        MCPValidationError: If no media is given, or only the handle of an
+            upload, which needs a client
+    """
+    if media is None:
+        raise MCPValidationError("No media given")
+    if isinstance(media, MediaHandle):
+        raise MCPValidationError("A client is required to process uploaded media")
+    if isinstance(media, memoryview):
+        return media.tobytes()
+    return media
+
+
+def send_media_request(
+    client: Optional[MCPClient],
+    operation: str,
+    media: Optional[MediaInput] = None,
+    media_id: Optional[str] = None,
+    **params: Any,
+) -> MCPResponse:
+    """
+    Run a media operation on the server.
+
+    A ``MediaHandle`` or ``media_id`` is sent as the ``media_id`` parameter
+    with an empty body; anything else is uploaded as the request body.
+
+    Args:
+        client: The client to send the request with
+        operation: Name of the media operation
+        media: The media, or the handle of an earlier upload
+        media_id: ID of an earlier upload, instead of ``media``
+        **params: Further parameters of the operation
+
+    Returns:
+        MCPResponse: The operation's response
+
+    Raises:
+        MCPValidationError: If there is no client, or not exactly one of
+            ``media`` and ``media_id``
+        MCPError: If the server returns an error response
+    """
+    if client is None:
+        raise MCPValidationError("A client is required to process uploaded media")
+    if (media is None) == (media_id is None):
+        raise MCPValidationError("Pass either media or media_id")
+    handle = media if isinstance(media, MediaHandle) else None
+    body = None if isinstance(media, MediaHandle) else media
+    if handle is not None:
+        media_id = handle.id
+
+    if body is None:
+        params["media_id"] = media_id
+        body = b""
+    result = client.send_media_sync(
+        body, params={"operation": operation, **params}, response_type=MCPResponse
+    )
+    if isinstance(result, ResourceErrorResponse):
+        raise MCPError(result.errors[0].message if result.errors else "Request failed")
+    if not isinstance(result, ResourceResponse):
+        raise MCPError("Expected a single resource in the response")
+    return result.data
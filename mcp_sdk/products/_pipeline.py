@@ -0,0 +1,134 @@
+"""
+Ordered parallel map shared by the media products.
+
+Items are produced lazily, processed in a worker pool, and yielded in input
+order. At most ``prefetch`` items are in flight ahead of the consumer, so
+memory stays bounded and a slow consumer holds back production.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generator,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Marks the end of the input when it is read in a worker thread
+_END = object()
+
+
+def check_pool(max_workers: int, prefetch: Optional[int] = None) -> int:
+    """
+    Validate pool settings.
+
+    Returns:
+        int: The prefetch depth; ``max_workers`` if omitted
+
+    Raises:
+        ValueError: If either setting is not positive
+    """
+    if max_workers <= 0:
+        raise ValueError("max_workers must be positive")
+    if prefetch is None:
+        return max_workers
+    if prefetch <= 0:
+        raise ValueError("prefetch must be positive")
+    return prefetch
+
+
+def ordered_map(
+    items: Iterator[T], fn: Callable[[T], R], max_workers: int, prefetch: int
+) -> Generator[Tuple[T, R], None, None]:
+    """
+    Apply ``fn`` to each item in a thread pool, yielding results in order.
+
+    Items are drawn from ``items`` on the consumer's side.
+
+    Args:
+        items: The input, read lazily
+        fn: Function applied to each item; called from worker threads
+        max_workers: Number of worker threads
+        prefetch: Items processed ahead of the consumer at most
+
+    Yields:
+        Each item with its result, in input order
+    """
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    pending: Deque[Tuple[T, Future]] = deque()
+    try:
+        for item in items:
+            pending.append((item, pool.submit(fn, item)))
+            if len(pending) >= prefetch:
+                item, future = pending.popleft()
+                yield item, future.result()
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+async def aordered_map(
+    items: Iterator[T],
+    fn: Union[Callable[[T], R], Callable[[T], Awaitable[R]]],
+    max_workers: int,
+    prefetch: int,
+) -> AsyncGenerator[Tuple[T, R], None]:
+    """
+    Apply ``fn`` to each item without blocking the event loop; see ``ordered_map``.
+
+    Items are drawn from ``items`` in a worker thread. A coroutine function
+    runs on the event loop with at most ``max_workers`` calls in flight; a
+    plain function runs in the pool.
+
+    Yields:
+        Each item with its result, in input order
+    """
+    loop = asyncio.get_running_loop()
+    is_async = asyncio.iscoroutinefunction(fn)
+    # One extra thread reads items while the others work
+    pool = ThreadPoolExecutor(max_workers=1 if is_async else max_workers + 1)
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(item: T) -> Any:
+        async with semaphore:
+            return await fn(item)  # type: ignore[misc]
+
+    pending: Deque[Tuple[T, asyncio.Future]] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < prefetch:
+                read: object = await loop.run_in_executor(pool, next, items, _END)
+                if read is _END:
+                    exhausted = True
+                    continue
+                item = cast(T, read)
+                if is_async:
+                    pending.append((item, asyncio.ensure_future(run(item))))
+                else:
+                    pending.append((item, loop.run_in_executor(pool, fn, item)))
+            if not pending:
+                return
+            item, future = pending.popleft()
+            yield item, await future
+    finally:
+        for _, future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
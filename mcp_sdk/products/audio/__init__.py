@@ -2,6 +2,23 @@
 Audio Processing Module - Tools for audio-based operations
 """
 
+from typing import Optional
+
+from ...client import MCPClient
+from .._media import MediaInput, is_remote, local_media, send_media_request
+
+from .streaming import (
+    AudioSource,
+    AudioWindow,
+    TranscriptSegment,
+    WaveSource,
+    atranscribe_stream,
+    open_audio,
+    stitch,
+    transcribe_stream,
+    transcribe_windows,
+)
+
 
 # Placeholder for audio module implementation
 def generate(prompt: str, **kwargs) -> str:
@@ -9,14 +26,65 @@ def generate(prompt: str, **kwargs) -> str:
     return "audio_data_placeholder"
 
 
-def transcribe(audio: str, **kwargs) -> str:
-    """Transcribe audio to text"""
+def transcribe(
+    audio: Optional[MediaInput] = None,
+    transcriber=None,
+    client: Optional[MCPClient] = None,
+    media_id: Optional[str] = None,
+    **kwargs,
+) -> str:
+    """
+    Transcribe audio to text.
+
+    With a ``transcriber`` the audio is transcribed in overlapping windows and
+    the stitched text is returned; use ``transcribe_stream`` to get the text
+    as each window is done. Keyword arguments are passed on to it.
+
+    With a ``client`` the audio is transcribed by the server. Audio uploaded
+    with ``MCPClient.upload_media`` is referenced by its ``MediaHandle`` or
+    ``media_id`` and not sent again; keyword arguments become request
+    parameters.
+    """
+    if is_remote(audio, client, media_id):
+        return send_media_request(
+            client, "transcribe", audio, media_id=media_id, **kwargs
+        ).content
+    if transcriber is not None:
+        return transcribe_windows(local_media(audio), transcriber, **kwargs)
     return "Transcribed text would appear here."
 
 
-def analyze(audio: str, **kwargs) -> dict:
-    """Analyze audio content"""
+def analyze(
+    audio: Optional[MediaInput] = None,
+    client: Optional[MCPClient] = None,
+    media_id: Optional[str] = None,
+    **kwargs,
+) -> dict:
+    """
+    Analyze audio content.
+
+    With a ``client`` the analysis is the server's response metadata; uploaded
+    audio is referenced as in ``transcribe``.
+    """
+    if is_remote(audio, client, media_id):
+        response = send_media_request(
+            client, "analyze", audio, media_id=media_id, **kwargs
+        )
+        return response.metadata or {}
     return {"duration": 60, "format": "mp3", "analysis": "Placeholder analysis"}
 
 
-__all__ = ["generate", "transcribe", "analyze"]
+__all__ = [
+    "generate",
+    "transcribe",
+    "analyze",
+    "transcribe_stream",
+    "atranscribe_stream",
+    "transcribe_windows",
+    "open_audio",
+    "stitch",
+    "AudioSource",
+    "AudioWindow",
+    "TranscriptSegment",
+    "WaveSource",
+]
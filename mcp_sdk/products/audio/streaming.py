@@ -0,0 +1,317 @@
+import asyncio
+import io
+import os
+import re
+import wave
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .._pipeline import aordered_map, check_pool, ordered_map
+
+AudioInput = Union[str, "os.PathLike[str]", bytes, bytearray, BinaryIO]
+
+# Window length and overlap in seconds; the overlap lets words cut at a
+# window edge be recognised whole in one of the two windows
+DEFAULT_WINDOW = 30.0
+DEFAULT_OVERLAP = 2.0
+DEFAULT_WORKERS = 2
+
+# Words compared when removing text repeated across an overlap
+_STITCH_WORDS = 50
+_WORD = re.compile(r"\w+")
+
+
+@dataclass
+class AudioWindow:
+    """A fixed-size slice of PCM audio, overlapping the previous window"""
+
+    index: int
+    start: float
+    end: float
+    overlap: float
+    sample_rate: int
+    channels: int
+    sample_width: int
+    data: bytes
+
+    @property
+    def duration(self) -> float:
+        """Get the window's length in seconds"""
+        return self.end - self.start
+
+
+@dataclass
+class TranscriptSegment:
+    """The transcript of one window, without the text repeated from the last"""
+
+    index: int
+    start: float
+    end: float
+    text: str
+
+
+Transcriber = Callable[[AudioWindow], str]
+AsyncTranscriber = Callable[[AudioWindow], Awaitable[str]]
+
+
+class AudioSource:
+    """
+    An audio stream that can be read in overlapping windows.
+
+    Windows are read one after the other, so only the current window and
+    the overlap carried into the next one are held in memory.
+    """
+
+    sample_rate: int
+    channels: int
+    sample_width: int
+
+    def read_frames(self, count: int) -> bytes:
+        """Read up to ``count`` PCM frames; fewer only at the end"""
+        raise NotImplementedError
+
+    def windows(
+        self, window: float = DEFAULT_WINDOW, overlap: float = DEFAULT_OVERLAP
+    ) -> Iterator[AudioWindow]:
+        """
+        Split the stream into windows.
+
+        Args:
+            window: Window length in seconds
+            overlap: Seconds each window repeats from the end of the last
+
+        Raises:
+            ValueError: If the window is empty or the overlap not shorter
+        """
+        size = round(window * self.sample_rate)
+        overlap_size = round(overlap * self.sample_rate)
+        if size <= 0:
+            raise ValueError("window must be at least one sample long")
+        if not 0 <= overlap_size < size:
+            raise ValueError("overlap must be shorter than the window")
+
+        frame_bytes = self.channels * self.sample_width
+        carry = b""
+        position = 0
+        index = 0
+        while True:
+            data = self.read_frames(size - len(carry) // frame_bytes)
+            if not data:
+                # The carried overlap was already part of the last window
+                return
+            data = carry + data
+            frames = len(data) // frame_bytes
+            carried = len(carry) // frame_bytes
+            start = position - carried
+            yield AudioWindow(
+                index=index,
+                start=start / self.sample_rate,
+                end=(start + frames) / self.sample_rate,
+                overlap=carried / self.sample_rate,
+                sample_rate=self.sample_rate,
+                channels=self.channels,
+                sample_width=self.sample_width,
+                data=data,
+            )
+            if frames < size:
+                return
+            position = start + frames
+            carry = (
+                data[len(data) - overlap_size * frame_bytes :] if overlap_size else b""
+            )
+            index += 1
+
+    def close(self) -> None:
+        """Release the underlying file"""
+
+    def __enter__(self) -> "AudioSource":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class WaveSource(AudioSource):
+    """Reference source for uncompressed PCM WAV audio"""
+
+    def __init__(self, source: AudioInput):
+        """
+        Open a WAV stream.
+
+        Args:
+            source: A file path, the file's bytes, or a binary file object
+
+        Raises:
+            ValueError: If the input is not a PCM WAV stream
+        """
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        elif isinstance(source, os.PathLike):
+            source = os.fspath(source)
+        try:
+            self._wave = wave.open(source, "rb")
+        except (wave.Error, EOFError) as e:
+            raise ValueError(f"Not a PCM WAV stream: {e}") from e
+        self.sample_rate = self._wave.getframerate()
+        self.channels = self._wave.getnchannels()
+        self.sample_width = self._wave.getsampwidth()
+
+    def read_frames(self, count: int) -> bytes:
+        return self._wave.readframes(count)
+
+    def close(self) -> None:
+        self._wave.close()
+
+
+def open_audio(audio: Union[AudioInput, AudioSource]) -> AudioSource:
+    """Open audio for windowed reading; only PCM WAV is read locally"""
+    if isinstance(audio, AudioSource):
+        return audio
+    return WaveSource(audio)
+
+
+def stitch(previous: str, text: str) -> str:
+    """
+    Remove the words at the start of ``text`` that repeat the end of ``previous``.
+
+    Windows overlap, so speech in the overlap is transcribed twice. The
+    longest run of words ending ``previous`` and starting ``text`` is taken to
+    be that repeat; words are compared case- and punctuation-insensitively.
+
+    Returns:
+        str: ``text`` without the repeated words
+    """
+    tail = [word.lower() for word in _WORD.findall(previous)[-_STITCH_WORDS:]]
+    words = list(_WORD.finditer(text))
+    head = [match.group().lower() for match in words[:_STITCH_WORDS]]
+    for length in range(min(len(tail), len(head)), 0, -1):
+        if tail[-length:] == head[:length]:
+            rest = text[words[length - 1].end() :]
+            # Drop punctuation that belonged to the last repeated word
+            return re.sub(r"^[^\w\s]*", "", rest).strip()
+    return text.strip()
+
+
+def transcribe_stream(
+    audio: Union[AudioInput, AudioSource],
+    transcriber: Transcriber,
+    window: float = DEFAULT_WINDOW,
+    overlap: float = DEFAULT_OVERLAP,
+    max_workers: int = DEFAULT_WORKERS,
+    prefetch: Optional[int] = None,
+) -> Iterator[TranscriptSegment]:
+    """
+    Transcribe audio window by window, yielding text as it is recognised.
+
+    Windows are read lazily and transcribed in a thread pool, and their
+    transcripts are stitched in order. The first segment is ready after the
+    first window is transcribed, whatever the recording's length, and at
+    most ``prefetch`` windows are held at once.
+
+    Args:
+        audio: A file path, bytes, a binary file object, or an AudioSource
+        transcriber: Function transcribing one window, e.g. through a
+            speech-to-text service
+        window: Window length in seconds
+        overlap: Seconds each window repeats from the end of the last
+        max_workers: Number of windows transcribed at once
+        prefetch: Windows read ahead of the consumer at most; defaults to
+            ``max_workers``
+
+    Yields:
+        TranscriptSegment: The new text of each window, in order
+
+    Raises:
+        ValueError: If the audio or the settings are invalid
+    """
+    prefetch = check_pool(max_workers, prefetch)
+    source = open_audio(audio)
+    transcripts = ordered_map(
+        source.windows(window, overlap), transcriber, max_workers, prefetch
+    )
+    previous = ""
+    try:
+        for item, text in transcripts:
+            segment, previous = _segment(item, text, previous)
+            yield segment
+    finally:
+        transcripts.close()
+        if source is not audio:
+            source.close()
+
+
+async def atranscribe_stream(
+    audio: Union[AudioInput, AudioSource],
+    transcriber: Union[Transcriber, AsyncTranscriber],
+    window: float = DEFAULT_WINDOW,
+    overlap: float = DEFAULT_OVERLAP,
+    max_workers: int = DEFAULT_WORKERS,
+    prefetch: Optional[int] = None,
+) -> AsyncIterator[TranscriptSegment]:
+    """
+    Transcribe audio window by window without blocking the event loop.
+
+    Windows are read in a worker thread. A coroutine transcriber, e.g. one
+    calling a remote service, runs on the event loop with at most
+    ``max_workers`` windows in flight; a plain function runs in the pool.
+
+    Args:
+        audio: A file path, bytes, a binary file object, or an AudioSource
+        transcriber: Function or coroutine function transcribing one window
+        window: Window length in seconds
+        overlap: Seconds each window repeats from the end of the last
+        max_workers: Number of windows transcribed at once
+        prefetch: Windows read ahead of the consumer at most; defaults to
+            ``max_workers``
+
+    Yields:
+        TranscriptSegment: The new text of each window, in order
+
+    Raises:
+        ValueError: If the audio or the settings are invalid
+    """
+    prefetch = check_pool(max_workers, prefetch)
+    source = await asyncio.get_running_loop().run_in_executor(None, open_audio, audio)
+    transcripts = aordered_map(
+        source.windows(window, overlap), transcriber, max_workers, prefetch
+    )
+    previous = ""
+    try:
+        async for item, text in transcripts:
+            segment, previous = _segment(item, text, previous)
+            yield segment
+    finally:
+        await transcripts.aclose()
+        if source is not audio:
+            source.close()
+
+
+def transcribe_windows(
+    audio: Union[AudioInput, AudioSource], transcriber: Transcriber, **kwargs: Any
+) -> str:
+    """Transcribe audio window by window and join the stitched segments"""
+    return " ".join(
+        segment.text
+        for segment in transcribe_stream(audio, transcriber, **kwargs)
+        if segment.text
+    )
+
+
+def _segment(
+    item: AudioWindow, text: str, previous: str
+) -> Tuple[TranscriptSegment, str]:
+    """Stitch a window's transcript onto the text before it"""
+    text = stitch(previous, text)
+    # Only the tail of the transcript is needed to stitch the next window
+    previous = f"{previous} {text}"[-_STITCH_WORDS * 32 :]
+    return TranscriptSegment(item.index, item.start, item.end, text), previous
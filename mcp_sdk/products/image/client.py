@@ -1,7 +1,16 @@
-from typing import Optional, Dict, Any, List
+import base64
+import binascii
+import os
+from typing import Optional, Dict, Any, List, Union, BinaryIO
 from ...client import MCPClient
+from ...exceptions import MCPValidationError
 from .models import ImageRequest, ImageResponse
 
+# An image is a base64 encoded string, or bytes, a file path or a file object
+# that is uploaded as is. File paths must be os.PathLike, e.g. pathlib.Path,
+# since a plain string is always taken to be base64
+ImageInput = Union[str, bytes, bytearray, memoryview, "os.PathLike[str]", BinaryIO]
+
 
 class ImageClient:
     """Client for image processing operations"""
@@ -31,65 +40,86 @@ class ImageClient:
         response = self.client.send(request.dict())
         return ImageResponse(**response)
 
-    def edit(self, image: str, prompt: str, **kwargs) -> ImageResponse:
+    def edit(self, image: ImageInput, prompt: str, **kwargs) -> ImageResponse:
         """
         Edit an existing image based on a text prompt.
 
         Args:
-            image: Base64 encoded image to edit
+            image: Image to edit, base64 encoded or as bytes, Path or file
             prompt: The text description of the desired edits
             **kwargs: Additional edit parameters
 
         Returns:
             ImageResponse: The edited image response
         """
-        request = ImageRequest(prompt=prompt, operation="edit", image=image, **kwargs)
-        response = self.client.send(request.dict())
-        return ImageResponse(**response)
+        return self._send_image(image, prompt=prompt, operation="edit", **kwargs)
 
-    def resize(self, image: str, size: str, **kwargs) -> ImageResponse:
+    def resize(self, image: ImageInput, size: str, **kwargs) -> ImageResponse:
         """
         Resize an image to the specified dimensions.
 
         Args:
-            image: Base64 encoded image to resize
+            image: Image to resize, base64 encoded or as bytes, Path or file
             size: Target size (e.g., "512x512")
             **kwargs: Additional resize parameters
 
         Returns:
             ImageResponse: The resized image response
         """
-        request = ImageRequest(operation="resize", image=image, size=size, **kwargs)
-        response = self.client.send(request.dict())
-        return ImageResponse(**response)
+        return self._send_image(image, operation="resize", size=size, **kwargs)
 
-    def apply_style(self, image: str, style: str, **kwargs) -> ImageResponse:
+    def apply_style(self, image: ImageInput, style: str, **kwargs) -> ImageResponse:
         """
         Apply a specific style to an image.
 
         Args:
-            image: Base64 encoded image to style
+            image: Image to style, base64 encoded or as bytes, Path or file
             style: The style to apply (e.g., "cartoon", "oil-painting")
             **kwargs: Additional style parameters
 
         Returns:
             ImageResponse: The styled image response
         """
-        request = ImageRequest(operation="style", image=image, style=style, **kwargs)
-        response = self.client.send(request.dict())
-        return ImageResponse(**response)
+        return self._send_image(image, operation="style", style=style, **kwargs)
 
-    def analyze(self, image: str, **kwargs) -> ImageResponse:
+    def analyze(self, image: ImageInput, **kwargs) -> ImageResponse:
         """
         Analyze the content of an image.
 
         Args:
-            image: Base64 encoded image to analyze
+            image: Image to analyze, base64 encoded or as bytes, Path or file
             **kwargs: Additional analysis parameters
 
         Returns:
             ImageResponse: The analysis response
         """
-        request = ImageRequest(operation="analyze", image=image, **kwargs)
-        response = self.client.send(request.dict())
-        return ImageResponse(**response)
+        return self._send_image(image, operation="analyze", **kwargs)
+
+    def _send_image(self, image: ImageInput, **params) -> ImageResponse:
+        """
+        Send an image request as a raw upload.
+
+        Base64 strings are decoded and uploaded like bytes, so every image
+        takes the same path whatever form it is given in.
+
+        Raises:
+            MCPValidationError: If a string is not valid base64
+        """
+        if isinstance(image, str):
+            try:
+                image = base64.b64decode(image, validate=True)
+            except binascii.Error as e:
+                raise MCPValidationError(
+                    "Image strings must be base64 encoded; pass file paths "
+                    "as pathlib.Path"
+                ) from e
+
+        request = ImageRequest(**params)
+        result = self.client.send_media_sync(
+            image,
+            params=self.client.codec.loads(
+                self.client.codec.dump_model(request, exclude={"image"})
+            ),
+            response_type=ImageResponse,
+        )
+        return result.data
@@ -1,7 +1,31 @@
-from typing import Optional, Dict, Any
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    List,
+    Sequence,
+    Union,
+)
 from ...client import MCPClient
+from ...exceptions import MCPError, MCPValidationError
+from ...models import MCPRequest, MCPSettings, MCPStreamChunk
 from .models import TextRequest, TextResponse
 
+if TYPE_CHECKING:
+    from ...shared.progress import ProgressContext
+
+# Prompts for the text operations, formatted with the input text
+SUMMARIZE_PROMPT = "Summarize the following text:\n\n{text}"
+TRANSLATE_PROMPT = "Translate the following text to {target_language}:\n\n{text}"
+SENTIMENT_PROMPT = "Analyze the sentiment of the following text:\n\n{text}"
+KEYWORDS_PROMPT = "Extract keywords from the following text:\n\n{text}"
+
+# Result of one input of a *_many call: its response or the error it failed with
+TextResult = Union[TextResponse, MCPError]
+
 
 class TextClient:
     """Client for text processing operations"""
@@ -15,18 +39,25 @@ class TextClient:
         """
         self.client = base_client
 
-    def generate(self, prompt: str, **kwargs) -> TextResponse:
+    def generate(
+        self, prompt: str, stream: bool = False, **kwargs
+    ) -> Union[TextResponse, AsyncIterator[MCPStreamChunk]]:
         """
         Generate text based on a prompt.
 
         Args:
             prompt: The input prompt
+            stream: If True, return an async iterator over partial results
+                instead of waiting for the complete response
             **kwargs: Additional generation parameters
 
         Returns:
-            TextResponse: The generated text response
+            Union[TextResponse, AsyncIterator[MCPStreamChunk]]: The generated
+            text response, or an async iterator of chunks when streaming
         """
         request = TextRequest(prompt=prompt, **kwargs)
+        if stream:
+            return self.client.stream(request.dict())
         response = self.client.send(request.dict())
         return TextResponse(**response)
 
@@ -41,9 +72,7 @@ class TextClient:
         Returns:
             TextResponse: The summary response
         """
-        request = TextRequest(
-            prompt=f"Summarize the following text:\n\n{text}", **kwargs
-        )
+        request = TextRequest(prompt=SUMMARIZE_PROMPT.format(text=text), **kwargs)
         response = self.client.send(request.dict())
         return TextResponse(**response)
 
@@ -60,7 +89,7 @@ class TextClient:
             TextResponse: The translation response
         """
         request = TextRequest(
-            prompt=f"Translate the following text to {target_language}:\n\n{text}",
+            prompt=TRANSLATE_PROMPT.format(target_language=target_language, text=text),
             **kwargs,
         )
         response = self.client.send(request.dict())
@@ -77,9 +106,7 @@ class TextClient:
         Returns:
             TextResponse: The sentiment analysis response
         """
-        request = TextRequest(
-            prompt=f"Analyze the sentiment of the following text:\n\n{text}", **kwargs
-        )
+        request = TextRequest(prompt=SENTIMENT_PROMPT.format(text=text), **kwargs)
         response = self.client.send(request.dict())
         return TextResponse(**response)
 
@@ -94,8 +121,247 @@ class TextClient:
         Returns:
             TextResponse: The keywords extraction response
         """
-        request = TextRequest(
-            prompt=f"Extract keywords from the following text:\n\n{text}", **kwargs
-        )
+        request = TextRequest(prompt=KEYWORDS_PROMPT.format(text=text), **kwargs)
         response = self.client.send(request.dict())
         return TextResponse(**response)
+
+    async def generate_many(
+        self,
+        prompts: Sequence[str],
+        concurrency: int = 4,
+        batch_size: int = 20,
+        progress: Optional["ProgressContext"] = None,
+        **kwargs,
+    ) -> List[TextResult]:
+        """
+        Generate text for many prompts using batched requests.
+
+        Args:
+            prompts: The input prompts
+            concurrency: Number of batches in flight at once
+            batch_size: Number of prompts per batch request
+            progress: Optional progress context, advanced as batches complete
+            **kwargs: Additional generation parameters
+
+        Returns:
+            List[TextResult]: One entry per prompt, in order: its response or
+            the error it failed with
+        """
+        return await self._send_many(
+            [TextRequest(prompt=prompt, **kwargs) for prompt in prompts],
+            concurrency,
+            batch_size,
+            progress,
+        )
+
+    async def summarize_many(
+        self,
+        texts: Sequence[str],
+        concurrency: int = 4,
+        batch_size: int = 20,
+        progress: Optional["ProgressContext"] = None,
+        **kwargs,
+    ) -> List[TextResult]:
+        """
+        Summarize many texts using batched requests.
+
+        Args:
+            texts: The texts to summarize
+            concurrency: Number of batches in flight at once
+            batch_size: Number of texts per batch request
+            progress: Optional progress context, advanced as batches complete
+            **kwargs: Additional summarization parameters
+
+        Returns:
+            List[TextResult]: One entry per text, in order: its summary or the
+            error it failed with
+        """
+        return await self._send_many(
+            [
+                TextRequest(prompt=SUMMARIZE_PROMPT.format(text=text), **kwargs)
+                for text in texts
+            ],
+            concurrency,
+            batch_size,
+            progress,
+        )
+
+    async def translate_many(
+        self,
+        texts: Sequence[str],
+        target_language: str,
+        concurrency: int = 4,
+        batch_size: int = 20,
+        progress: Optional["ProgressContext"] = None,
+        **kwargs,
+    ) -> List[TextResult]:
+        """
+        Translate many texts to the target language using batched requests.
+
+        Args:
+            texts: The texts to translate
+            target_language: The target language code
+            concurrency: Number of batches in flight at once
+            batch_size: Number of texts per batch request
+            progress: Optional progress context, advanced as batches complete
+            **kwargs: Additional translation parameters
+
+        Returns:
+            List[TextResult]: One entry per text, in order: its translation or
+            the error it failed with
+        """
+        return await self._send_many(
+            [
+                TextRequest(
+                    prompt=TRANSLATE_PROMPT.format(
+                        target_language=target_language, text=text
+                    ),
+                    **kwargs,
+                )
+                for text in texts
+            ],
+            concurrency,
+            batch_size,
+            progress,
+        )
+
+    async def analyze_sentiment_many(
+        self,
+        texts: Sequence[str],
+        concurrency: int = 4,
+        batch_size: int = 20,
+        progress: Optional["ProgressContext"] = None,
+        **kwargs,
+    ) -> List[TextResult]:
+        """
+        Analyze the sentiment of many texts using batched requests.
+
+        Args:
+            texts: The texts to analyze
+            concurrency: Number of batches in flight at once
+            batch_size: Number of texts per batch request
+            progress: Optional progress context, advanced as batches complete
+            **kwargs: Additional analysis parameters
+
+        Returns:
+            List[TextResult]: One entry per text, in order: its analysis or the
+            error it failed with
+        """
+        return await self._send_many(
+            [
+                TextRequest(prompt=SENTIMENT_PROMPT.format(text=text), **kwargs)
+                for text in texts
+            ],
+            concurrency,
+            batch_size,
+            progress,
+        )
+
+    async def extract_keywords_many(
+        self,
+        texts: Sequence[str],
+        concurrency: int = 4,
+        batch_size: int = 20,
+        progress: Optional["ProgressContext"] = None,
+        **kwargs,
+    ) -> List[TextResult]:
+        """
+        Extract keywords from many texts using batched requests.
+
+        Args:
+            texts: The texts to extract keywords from
+            concurrency: Number of batches in flight at once
+            batch_size: Number of texts per batch request
+            progress: Optional progress context, advanced as batches complete
+            **kwargs: Additional extraction parameters
+
+        Returns:
+            List[TextResult]: One entry per text, in order: its keywords or the
+            error it failed with
+        """
+        return await self._send_many(
+            [
+                TextRequest(prompt=KEYWORDS_PROMPT.format(text=text), **kwargs)
+                for text in texts
+            ],
+            concurrency,
+            batch_size,
+            progress,
+        )
+
+    async def _send_many(
+        self,
+        requests: List[TextRequest],
+        concurrency: int,
+        batch_size: int,
+        progress: Optional["ProgressContext"],
+    ) -> List[TextResult]:
+        """
+        Send requests in batches, several batches at a time.
+
+        A batch call that fails as a whole, e.g. after its retries are used
+        up, is reported as the error of each of its items; the other batches
+        go on.
+
+        Raises:
+            MCPValidationError: If concurrency or batch size is not positive
+        """
+        if concurrency <= 0:
+            raise MCPValidationError("concurrency must be positive")
+        if batch_size <= 0:
+            raise MCPValidationError("batch_size must be positive")
+
+        results: List[Any] = [None] * len(requests)
+        if progress is not None and progress.total is None:
+            await progress.set_total(len(requests))
+        # Workers take batches from one iterator, so only `concurrency`
+        # batches exist at a time however many inputs there are
+        starts = iter(range(0, len(requests), batch_size))
+
+        async def worker() -> None:
+            for start in starts:
+                batch = requests[start : start + batch_size]
+                try:
+                    responses = await self.client.send_batch(
+                        [_mcp_request(request) for request in batch],
+                        response_type=TextResponse,
+                    )
+                except MCPError as e:
+                    responses = [e] * len(batch)
+                for offset, response in enumerate(responses):
+                    results[start + offset] = (
+                        response if isinstance(response, MCPError) else response.data
+                    )
+                if progress is not None:
+                    await progress.progress(len(batch))
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return results
+
+
+def _mcp_request(request: TextRequest) -> MCPRequest:
+    """
+    Convert a text request to the MCPRequest the process endpoints accept.
+
+    The prompt becomes the context and the generation parameters the
+    settings; stop sequences, which have no setting, travel in the metadata.
+    The model is routed to the server's text handler.
+    """
+    metadata = dict(request.metadata or {})
+    if request.stop is not None:
+        metadata["stop"] = request.stop
+    model = request.model
+    if not model.startswith("text"):
+        model = f"text:{model}"
+    return MCPRequest(
+        model=model,
+        context=request.prompt,
+        settings=MCPSettings(
+            temperature=request.temperature,
+            max_tokens=request.max_tokens,
+            top_p=request.top_p,
+            frequency_penalty=request.frequency_penalty,
+            presence_penalty=request.presence_penalty,
+        ),
+        metadata=metadata,
+    )
@@ -2,6 +2,23 @@
 Video Processing Module - Tools for video-based operations
 """
 
+from typing import Optional
+
+from ...client import MCPClient
+from .._media import MediaInput, is_remote, local_media, send_media_request
+
+from .frames import (
+    Frame,
+    FrameInfo,
+    FramePacket,
+    FrameSelector,
+    FrameSource,
+    Y4MSource,
+    aiter_frames,
+    iter_frames,
+    open_video,
+)
+
 
 # Placeholder for video module implementation
 def generate(prompt: str, **kwargs) -> str:
@@ -9,14 +26,64 @@ def generate(prompt: str, **kwargs) -> str:
     return "video_data_placeholder"
 
 
-def analyze(video: str, **kwargs) -> dict:
-    """Analyze video content"""
+def analyze(
+    video: Optional[MediaInput] = None,
+    client: Optional[MCPClient] = None,
+    media_id: Optional[str] = None,
+    **kwargs,
+) -> dict:
+    """
+    Analyze video content.
+
+    With a ``client`` the analysis is the server's response metadata. Video
+    uploaded with ``MCPClient.upload_media`` is referenced by its
+    ``MediaHandle`` or ``media_id`` and not sent again.
+    """
+    if is_remote(video, client, media_id):
+        response = send_media_request(
+            client, "analyze", video, media_id=media_id, **kwargs
+        )
+        return response.metadata or {}
     return {"duration": 120, "format": "mp4", "analysis": "Placeholder analysis"}
 
 
-def extract_frames(video: str, **kwargs) -> list:
-    """Extract frames from video"""
-    return ["frame1_data", "frame2_data", "frame3_data"]
+def extract_frames(
+    video: Optional[MediaInput] = None,
+    client: Optional[MCPClient] = None,
+    media_id: Optional[str] = None,
+    **kwargs,
+) -> list:
+    """
+    Extract frames from video into a list.
+
+    Every frame is held in memory at once; use ``iter_frames`` or
+    ``aiter_frames`` to process frames as they are decoded. Keyword arguments
+    are passed on to ``iter_frames``.
+
+    With a ``client`` the frames are extracted by the server and the list is
+    the ``frames`` entry of its response metadata; uploaded video is
+    referenced as in ``analyze`` and keyword arguments become request
+    parameters.
+    """
+    if is_remote(video, client, media_id):
+        response = send_media_request(
+            client, "extract_frames", video, media_id=media_id, **kwargs
+        )
+        return (response.metadata or {}).get("frames", [])
+    return list(iter_frames(local_media(video), **kwargs))
 
 
-__all__ = ["generate", "analyze", "extract_frames"]
+__all__ = [
+    "generate",
+    "analyze",
+    "extract_frames",
+    "iter_frames",
+    "aiter_frames",
+    "open_video",
+    "Frame",
+    "FrameInfo",
+    "FramePacket",
+    "FrameSelector",
+    "FrameSource",
+    "Y4MSource",
+]
@@ -0,0 +1,374 @@
+import asyncio
+import io
+import os
+import re
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .._pipeline import aordered_map, check_pool, ordered_map
+
+VideoSource = Union[str, "os.PathLike[str]", bytes, bytearray, BinaryIO]
+
+# Frames decoded ahead of the consumer at most, per call
+DEFAULT_PREFETCH = 4
+DEFAULT_WORKERS = 2
+
+
+class FrameInfo(NamedTuple):
+    """Position of a frame in its stream, known before it is read"""
+
+    index: int
+    timestamp: float
+    keyframe: bool
+
+
+@dataclass
+class FramePacket:
+    """The undecoded data of one frame"""
+
+    info: FrameInfo
+    data: bytes
+
+
+@dataclass
+class Frame:
+    """A decoded video frame, stored as one buffer per plane"""
+
+    index: int
+    timestamp: float
+    keyframe: bool
+    width: int
+    height: int
+    pixel_format: str
+    planes: Tuple[bytes, ...]
+
+    @property
+    def data(self) -> bytes:
+        """Get the planes as one contiguous buffer"""
+        return b"".join(self.planes)
+
+
+class FrameSelector:
+    """
+    Decides which frames to decode.
+
+    Frames are picked before their data is read, so skipped frames cost
+    neither I/O nor decoding.
+    """
+
+    def __init__(self, fps: Optional[float] = None, keyframes_only: bool = False):
+        """
+        Initialize the selector.
+
+        Args:
+            fps: Rate to subsample to; every frame is kept if omitted
+            keyframes_only: Keep keyframes only
+
+        Raises:
+            ValueError: If the rate is not positive
+        """
+        if fps is not None and fps <= 0:
+            raise ValueError("fps must be positive")
+        self.fps = fps
+        self.keyframes_only = keyframes_only
+        self._next_time = 0.0
+
+    def __call__(self, info: FrameInfo) -> bool:
+        if self.keyframes_only and not info.keyframe:
+            return False
+        if self.fps is None:
+            return True
+        # Tolerate rounding in timestamps derived from rational frame rates
+        if info.timestamp + 1e-9 < self._next_time:
+            return False
+        interval = 1.0 / self.fps
+        while self._next_time <= info.timestamp + 1e-9:
+            self._next_time += interval
+        return True
+
+
+class FrameSource:
+    """
+    A video container that yields frame packets and decodes them.
+
+    Reading packets is sequential, decoding is independent per packet, so
+    ``iter_frames`` reads on the consumer's side and decodes in a worker pool.
+    Subclasses implement both for a container format.
+    """
+
+    width: int
+    height: int
+    fps: float
+    pixel_format: str
+
+    def packets(
+        self, select: Optional[Callable[[FrameInfo], bool]] = None
+    ) -> Iterator[FramePacket]:
+        """
+        Read the packets of the frames ``select`` accepts, in stream order.
+
+        Args:
+            select: Called with each frame's info before its data is read
+        """
+        raise NotImplementedError
+
+    def decode(self, packet: FramePacket) -> Frame:
+        """Decode one packet; called from worker threads"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the underlying file"""
+
+    def __enter__(self) -> "FrameSource":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+# Chroma subsampling of YUV4MPEG2 colour spaces as (horizontal, vertical)
+# divisors, or None for a single luma plane
+_Y4M_CHROMA: Dict[str, Optional[Tuple[int, int]]] = {
+    "420": (2, 2),
+    "420jpeg": (2, 2),
+    "420mpeg2": (2, 2),
+    "420paldv": (2, 2),
+    "422": (2, 1),
+    "444": (1, 1),
+    "444alpha": (1, 1),
+    "mono": None,
+}
+
+_Y4M_DEPTH = re.compile(r"^(\w+?)p(\d+)$")
+
+
+class Y4MSource(FrameSource):
+    """
+    Reference source for uncompressed YUV4MPEG2 (``.y4m``) video.
+
+    Every frame is stored raw, so every frame is a keyframe and decoding only
+    splits the frame into its planes. Frames that are not selected are
+    skipped by seeking when the input allows it.
+    """
+
+    def __init__(self, source: VideoSource):
+        """
+        Open a YUV4MPEG2 stream and read its header.
+
+        Args:
+            source: A file path, the stream's bytes, or a binary file object
+
+        Raises:
+            ValueError: If the header is not a valid YUV4MPEG2 header
+        """
+        self._owned = False
+        if isinstance(source, (bytes, bytearray)):
+            self._stream: BinaryIO = io.BytesIO(source)
+        elif isinstance(source, (str, os.PathLike)):
+            self._stream = open(source, "rb")
+            self._owned = True
+        else:
+            self._stream = source
+
+        try:
+            self._parse_header(self._stream.readline())
+        except BaseException:
+            self.close()
+            raise
+
+    def _parse_header(self, line: bytes) -> None:
+        fields = line.rstrip(b"\n").split(b" ")
+        if fields[0] != b"YUV4MPEG2" or not line.endswith(b"\n"):
+            raise ValueError("Not a YUV4MPEG2 stream")
+
+        params = {
+            field[:1].decode("ascii"): field[1:].decode("ascii")
+            for field in fields[1:]
+            if field
+        }
+        try:
+            self.width = int(params["W"])
+            self.height = int(params["H"])
+            numerator, denominator = params.get("F", "25:1").split(":")
+            self.frame_rate = Fraction(int(numerator), int(denominator))
+        except (KeyError, ValueError, ZeroDivisionError) as e:
+            raise ValueError(f"Invalid YUV4MPEG2 header: {line!r}") from e
+        self.fps = float(self.frame_rate)
+
+        colorspace = params.get("C", "420jpeg")
+        # High bit depths are spelled e.g. "420p10" and use 16-bit samples
+        match = _Y4M_DEPTH.match(colorspace)
+        base, depth = (
+            (match.group(1), int(match.group(2))) if match else (colorspace, 8)
+        )
+        if base not in _Y4M_CHROMA:
+            raise ValueError(f"Unsupported YUV4MPEG2 colour space: {colorspace}")
+        self.pixel_format = colorspace
+        sample_size = 2 if depth > 8 else 1
+
+        luma = self.width * self.height * sample_size
+        chroma = _Y4M_CHROMA[base]
+        if chroma is None:
+            self.plane_sizes: List[int] = [luma]
+        else:
+            width = -(-self.width // chroma[0])
+            height = -(-self.height // chroma[1])
+            self.plane_sizes = [luma] + [width * height * sample_size] * 2
+            if base == "444alpha":
+                self.plane_sizes.append(luma)
+        self.frame_size = sum(self.plane_sizes)
+
+    def packets(
+        self, select: Optional[Callable[[FrameInfo], bool]] = None
+    ) -> Iterator[FramePacket]:
+        seekable = (
+            self._stream.seekable() if hasattr(self._stream, "seekable") else False
+        )
+        index = 0
+        while True:
+            header = self._stream.readline()
+            if not header:
+                return
+            if not header.startswith(b"FRAME") or not header.endswith(b"\n"):
+                raise ValueError(f"Invalid YUV4MPEG2 frame header at frame {index}")
+
+            info = FrameInfo(
+                index=index,
+                timestamp=float(index / self.frame_rate),
+                keyframe=True,
+            )
+            if select is None or select(info):
+                data = self._stream.read(self.frame_size)
+                if len(data) < self.frame_size:
+                    raise ValueError(f"Truncated YUV4MPEG2 frame {index}")
+                yield FramePacket(info=info, data=data)
+            elif seekable:
+                self._stream.seek(self.frame_size, io.SEEK_CUR)
+            else:
+                self._stream.read(self.frame_size)
+            index += 1
+
+    def decode(self, packet: FramePacket) -> Frame:
+        view = memoryview(packet.data)
+        planes = []
+        offset = 0
+        for size in self.plane_sizes:
+            planes.append(bytes(view[offset : offset + size]))
+            offset += size
+        return Frame(
+            index=packet.info.index,
+            timestamp=packet.info.timestamp,
+            keyframe=packet.info.keyframe,
+            width=self.width,
+            height=self.height,
+            pixel_format=self.pixel_format,
+            planes=tuple(planes),
+        )
+
+    def close(self) -> None:
+        if self._owned:
+            self._stream.close()
+            self._owned = False
+
+
+def open_video(video: Union[VideoSource, FrameSource]) -> FrameSource:
+    """Open a video for frame extraction; only YUV4MPEG2 is read locally"""
+    if isinstance(video, FrameSource):
+        return video
+    return Y4MSource(video)
+
+
+def iter_frames(
+    video: Union[VideoSource, FrameSource],
+    fps: Optional[float] = None,
+    keyframes_only: bool = False,
+    max_workers: int = DEFAULT_WORKERS,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> Iterator[Frame]:
+    """
+    Extract frames one at a time.
+
+    Packets are read lazily and decoded in a thread pool. At most
+    ``prefetch`` frames are decoded ahead of the consumer, so memory stays
+    bounded and a slow consumer holds back reading and decoding.
+
+    Args:
+        video: A file path, bytes, a binary file object, or a FrameSource
+        fps: Rate to subsample to; every frame is kept if omitted
+        keyframes_only: Yield keyframes only
+        max_workers: Number of decoding threads
+        prefetch: Frames decoded ahead of the consumer at most
+
+    Yields:
+        Frame: The selected frames in stream order
+
+    Raises:
+        ValueError: If the video or the settings are invalid
+    """
+    prefetch = check_pool(max_workers, prefetch)
+    selector = FrameSelector(fps, keyframes_only)
+    source = open_video(video)
+    decoded = ordered_map(
+        source.packets(selector), source.decode, max_workers, prefetch
+    )
+    try:
+        for _, frame in decoded:
+            yield frame
+    finally:
+        decoded.close()
+        if source is not video:
+            source.close()
+
+
+async def aiter_frames(
+    video: Union[VideoSource, FrameSource],
+    fps: Optional[float] = None,
+    keyframes_only: bool = False,
+    max_workers: int = DEFAULT_WORKERS,
+    prefetch: int = DEFAULT_PREFETCH,
+) -> AsyncIterator[Frame]:
+    """
+    Extract frames one at a time without blocking the event loop.
+
+    Reading and decoding both run in a thread pool; like ``iter_frames``, at
+    most ``prefetch`` frames are decoded ahead of the consumer.
+
+    Args:
+        video: A file path, bytes, a binary file object, or a FrameSource
+        fps: Rate to subsample to; every frame is kept if omitted
+        keyframes_only: Yield keyframes only
+        max_workers: Number of decoding threads
+        prefetch: Frames decoded ahead of the consumer at most
+
+    Yields:
+        Frame: The selected frames in stream order
+
+    Raises:
+        ValueError: If the video or the settings are invalid
+    """
+    prefetch = check_pool(max_workers, prefetch)
+    selector = FrameSelector(fps, keyframes_only)
+    source = await asyncio.get_running_loop().run_in_executor(None, open_video, video)
+    decoded = aordered_map(
+        source.packets(selector), source.decode, max_workers, prefetch
+    )
+    try:
+        async for _, frame in decoded:
+            yield frame
+    finally:
+        await decoded.aclose()
+        if source is not video:
+            source.close()
@@ -0,0 +1,162 @@
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+from pydantic import BaseModel, create_model
+
+from .shared._pydantic_utils import field_annotation, model_dump, model_fields
+
+# Nested selection of field names; a None leaf selects the whole field
+FieldTree = Dict[str, Optional["FieldTree"]]
+
+
+def build_field_tree(fields: Sequence[str]) -> FieldTree:
+    """
+    Parse dotted field paths into a nested selection tree.
+
+    Selecting a field also selects everything below it, so ``["author",
+    "author.name"]`` selects the whole author.
+
+    Args:
+        fields: Field paths such as ``"sha"`` or ``"files.filename"``
+
+    Returns:
+        FieldTree: The nested selection
+
+    Raises:
+        ValueError: If a field path is empty or malformed
+    """
+    tree: FieldTree = {}
+    for path in fields:
+        parts = path.split(".")
+        if not all(parts):
+            raise ValueError(f"Invalid field path: {path!r}")
+
+        node: Optional[FieldTree] = tree
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if child is None:
+                # A parent of this path is already selected as a whole
+                break
+            node = child
+        else:
+            node[parts[-1]] = None
+    return tree
+
+
+def project(value: Any, fields: Sequence[str]) -> Any:
+    """
+    Trim a payload to the given field paths.
+
+    Works on pydantic models, dicts and lists of either. Only the selected
+    parts of a model are dumped, so unselected fields are never serialized.
+    Lists are projected element-wise and unknown fields are ignored.
+
+    Args:
+        value: The payload to trim
+        fields: Field paths to keep
+
+    Returns:
+        The trimmed payload as plain Python data
+    """
+    return _project(value, build_field_tree(fields))
+
+
+def _project(value: Any, tree: Optional[FieldTree]) -> Any:
+    """Trim a payload to a selection tree"""
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    if tree is None:
+        return model_dump(value) if isinstance(value, BaseModel) else value
+    if isinstance(value, BaseModel):
+        return {
+            name: _project(getattr(value, name), subtree)
+            for name, subtree in tree.items()
+            if name in model_fields(type(value))
+        }
+    if isinstance(value, dict):
+        return {
+            name: _project(value[name], subtree)
+            for name, subtree in tree.items()
+            if name in value
+        }
+    return value
+
+
+def partial_model(model: Type[BaseModel], fields: Sequence[str]) -> Type[BaseModel]:
+    """
+    Get a model that only declares the given field paths.
+
+    All declared fields are optional, so a projected payload validates without
+    the absent fields, and fields outside the projection are neither declared
+    nor validated. Models are cached per field selection.
+
+    Args:
+        model: The full model
+        fields: Field paths to keep
+
+    Returns:
+        Type[BaseModel]: The partial model
+
+    Raises:
+        ValueError: If a field path does not exist on the model
+    """
+    return _cached_partial_model(model, tuple(sorted(set(fields))))
+
+
+def resolve_model(
+    model: Type[BaseModel], fields: Optional[Sequence[str]] = None
+) -> Type[BaseModel]:
+    """Get the full model, or its partial model if fields are selected"""
+    if not fields:
+        return model
+    return partial_model(model, fields)
+
+
+@lru_cache(maxsize=256)
+def _cached_partial_model(
+    model: Type[BaseModel], fields: Tuple[str, ...]
+) -> Type[BaseModel]:
+    return _build_partial_model(model, build_field_tree(fields))
+
+
+def _build_partial_model(model: Type[BaseModel], tree: FieldTree) -> Type[BaseModel]:
+    """Create an all-optional model for a selection tree"""
+    definitions: Dict[str, Any] = {}
+    for name, subtree in tree.items():
+        field = model_fields(model).get(name)
+        if field is None:
+            raise ValueError(f"Unknown field {name!r} for {model.__name__}")
+
+        annotation = field_annotation(field)
+        if subtree is not None:
+            annotation = _narrow_annotation(annotation, subtree, name)
+        definitions[name] = (Optional[annotation], None)
+
+    return create_model(f"Partial{model.__name__}", **definitions)
+
+
+def _narrow_annotation(annotation: Any, tree: FieldTree, name: str) -> Any:
+    """Replace the model types inside an annotation with partial models"""
+    origin = get_origin(annotation)
+    if origin is Union:
+        return Union[
+            tuple(
+                (arg if arg is type(None) else _narrow_annotation(arg, tree, name))
+                for arg in get_args(annotation)
+            )
+        ]
+    if origin in (list, List):
+        return List[_narrow_annotation(get_args(annotation)[0], tree, name)]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _build_partial_model(annotation, tree)
+    raise ValueError(f"Field {name!r} has no subfields to select")
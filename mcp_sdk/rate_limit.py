@@ -0,0 +1,246 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Either a number of seconds or an HTTP date
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the value is missing or
+        malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RateLimitMetrics:
+    """Counters and current state of one rate limit bucket"""
+
+    rate: float
+    tokens: float = 0.0
+    queue_depth: int = 0
+    acquired: int = 0
+    throttled: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert metrics to a dictionary."""
+        return {
+            "rate": self.rate,
+            "tokens": self.tokens,
+            "queue_depth": self.queue_depth,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+        }
+
+
+@dataclass
+class _Bucket:
+    """Token bucket state for one endpoint"""
+
+    rate: float
+    tokens: float
+    updated: float = field(default_factory=time.monotonic)
+    last_decrease: float = float("-inf")
+    waiting: int = 0
+    acquired: int = 0
+    throttled: int = 0
+
+
+class AdaptiveRateLimiter:
+    """
+    Token-bucket rate limiter that learns each endpoint's capacity.
+
+    Every request takes a token from its endpoint's bucket. Callers that find
+    the bucket empty are queued: each reserves the next free slot and sleeps
+    until it comes up, rather than failing. The refill rate follows AIMD: it
+    grows by roughly ``increase`` requests per second for every second of
+    successful traffic and is multiplied by ``decrease_factor`` when the
+    server answers 429. A ``Retry-After`` from the server pauses the bucket
+    until the given time.
+
+    A single limiter can be shared by several clients; buckets are keyed by
+    endpoint and are safe to use from both threads and event loops.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 10.0,
+        min_rate: float = 0.5,
+        max_rate: float = 1000.0,
+        burst: float = 10.0,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        decrease_interval: float = 1.0,
+        max_throttled_attempts: int = 10,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_rate: Requests per second allowed before anything is learned
+            min_rate: Lower bound of the learned rate
+            max_rate: Upper bound of the learned rate
+            burst: Maximum number of tokens a bucket can hold
+            increase: Additive increase, in requests per second per second
+            decrease_factor: Multiplicative decrease applied on a 429
+            decrease_interval: Minimum seconds between two decreases, so one
+                burst of 429s only backs off once
+            max_throttled_attempts: How often a request answered with 429 is
+                queued again before the 429 is returned to the caller
+        """
+        if not 0 < min_rate <= initial_rate <= max_rate:
+            raise ValueError(
+                "Rates must satisfy 0 < min_rate <= initial_rate <= max_rate"
+            )
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if max_throttled_attempts < 0:
+            raise ValueError("max_throttled_attempts cannot be negative")
+
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.decrease_interval = decrease_interval
+        self.max_throttled_attempts = max_throttled_attempts
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: str) -> _Bucket:
+        """Get the bucket for a key, creating it full"""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(
+                rate=self.initial_rate, tokens=self.burst
+            )
+        return bucket
+
+    def _refill(self, bucket: _Bucket, now: float) -> None:
+        """Add the tokens earned since the last update"""
+        if now > bucket.updated:
+            bucket.tokens = min(
+                self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate
+            )
+            bucket.updated = now
+
+    def reserve(self, key: str) -> float:
+        """
+        Take a token, going into debt if the bucket is empty.
+
+        Args:
+            key: The endpoint
+
+        Returns:
+            float: Seconds to wait before the reserved slot comes up
+        """
+        with self._lock:
+            bucket = self._bucket(key)
+            now = time.monotonic()
+            self._refill(bucket, now)
+            bucket.tokens -= 1
+            bucket.acquired += 1
+            debt = max(0.0, -bucket.tokens)
+            return max(0.0, bucket.updated - now + debt / bucket.rate)
+
+    async def acquire(self, key: str) -> None:
+        """Wait for a token for the endpoint"""
+        delay = self.reserve(key)
+        if delay <= 0:
+            return
+        self._add_waiting(key, 1)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._add_waiting(key, -1)
+
+    def acquire_sync(self, key: str) -> None:
+        """Block until a token for the endpoint is available"""
+        delay = self.reserve(key)
+        if delay <= 0:
+            return
+        self._add_waiting(key, 1)
+        try:
+            time.sleep(delay)
+        finally:
+            self._add_waiting(key, -1)
+
+    def _add_waiting(self, key: str, delta: int) -> None:
+        with self._lock:
+            self._bucket(key).waiting += delta
+
+    def record_success(self, key: str) -> None:
+        """Raise the endpoint's rate after a request that was not throttled"""
+        with self._lock:
+            bucket = self._bucket(key)
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase / bucket.rate)
+
+    def record_throttle(self, key: str, retry_after: Optional[float] = None) -> None:
+        """
+        Back off after the server throttled a request.
+
+        Args:
+            key: The endpoint
+            retry_after: Seconds the server asked to wait, if it said so
+        """
+        with self._lock:
+            bucket = self._bucket(key)
+            now = time.monotonic()
+            self._refill(bucket, now)
+            bucket.throttled += 1
+            bucket.tokens = min(bucket.tokens, 0.0)
+            if now - bucket.last_decrease >= self.decrease_interval:
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+                bucket.last_decrease = now
+            if retry_after:
+                bucket.updated = max(bucket.updated, now + retry_after)
+
+    def metrics(self, key: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current rate and queue depth of each endpoint.
+
+        Args:
+            key: Only report this endpoint
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Metrics keyed by endpoint
+        """
+        with self._lock:
+            now = time.monotonic()
+            result = {}
+            for name, bucket in self._buckets.items():
+                if key is not None and name != key:
+                    continue
+                self._refill(bucket, now)
+                result[name] = RateLimitMetrics(
+                    rate=bucket.rate,
+                    tokens=bucket.tokens,
+                    queue_depth=bucket.waiting,
+                    acquired=bucket.acquired,
+                    throttled=bucket.throttled,
+                ).to_dict()
+            return result
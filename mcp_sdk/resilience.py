@@ -0,0 +1,306 @@
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Iterable, List
+
+from .exceptions import MCPCircuitOpenError
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitTransition:
+    """A change of state of one endpoint's circuit"""
+
+    endpoint: str
+    previous: CircuitState
+    state: CircuitState
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass
+class _Circuit:
+    """Breaker state for one endpoint"""
+
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    successes: int = 0
+    probes: int = 0
+    opened_at: float = 0.0
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker with half-open probing.
+
+    After ``failure_threshold`` consecutive failures the endpoint's circuit
+    opens and calls fail fast with ``MCPCircuitOpenError`` instead of waiting
+    for the backend. Once ``reset_timeout`` seconds have passed, the circuit
+    turns half-open and lets up to ``half_open_max_calls`` probe calls
+    through. ``success_threshold`` successful probes close it again; a failed
+    probe opens it for another ``reset_timeout``.
+
+    Every state change is passed to the listeners registered with
+    ``add_listener``, e.g. to export it as a metric or log it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds an open circuit waits before probing
+            half_open_max_calls: Concurrent probe calls allowed while half-open
+            success_threshold: Successful probes needed to close the circuit
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if reset_timeout < 0:
+            raise ValueError("reset_timeout cannot be negative")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        if success_threshold < 1:
+            raise ValueError("success_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self._circuits: Dict[str, _Circuit] = {}
+        self._listeners: List[Callable[[CircuitTransition], None]] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: Callable[[CircuitTransition], None]) -> None:
+        """Register a callable that receives every state transition"""
+        self._listeners.append(listener)
+
+    def state(self, endpoint: str) -> CircuitState:
+        """Get the current state of an endpoint's circuit"""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                return CircuitState.CLOSED
+            transitions = self._advance(endpoint, circuit, time.monotonic())
+            state = circuit.state
+        self._emit(transitions)
+        return state
+
+    def states(self) -> Dict[str, str]:
+        """Get the current state of every known endpoint"""
+        return {
+            endpoint: self.state(endpoint).value for endpoint in list(self._circuits)
+        }
+
+    def allows(self, endpoint: str) -> bool:
+        """
+        Check whether a call to the endpoint would be admitted right now.
+
+        Unlike ``before_call`` this takes no probe slot, so it can be used to
+        steer calls away from endpoints whose circuit is open.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                return True
+            transitions = self._advance(endpoint, circuit, time.monotonic())
+            allowed = circuit.state is CircuitState.CLOSED or (
+                circuit.state is CircuitState.HALF_OPEN
+                and circuit.probes < self.half_open_max_calls
+            )
+        self._emit(transitions)
+        return allowed
+
+    def before_call(self, endpoint: str) -> None:
+        """
+        Admit a call to the endpoint.
+
+        Every admitted call must be followed by ``record_success``,
+        ``record_failure`` or ``release``.
+
+        Raises:
+            MCPCircuitOpenError: If the circuit is open or all probe slots of
+                a half-open circuit are taken
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            now = time.monotonic()
+            transitions = self._advance(endpoint, circuit, now)
+            error = None
+            if circuit.state is CircuitState.OPEN:
+                error = MCPCircuitOpenError(
+                    endpoint=endpoint,
+                    retry_after=circuit.opened_at + self.reset_timeout - now,
+                )
+            elif circuit.state is CircuitState.HALF_OPEN:
+                if circuit.probes >= self.half_open_max_calls:
+                    error = MCPCircuitOpenError(endpoint=endpoint)
+                else:
+                    circuit.probes += 1
+        self._emit(transitions)
+        if error is not None:
+            raise error
+
+    def record_success(self, endpoint: str) -> None:
+        """Record that an admitted call reached a healthy backend"""
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            transitions = []
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                circuit.successes += 1
+                if circuit.successes >= self.success_threshold:
+                    transitions = self._transition(
+                        endpoint, circuit, CircuitState.CLOSED
+                    )
+            else:
+                circuit.failures = 0
+        self._emit(transitions)
+
+    def record_failure(self, endpoint: str) -> None:
+        """Record that an admitted call failed or the backend was unhealthy"""
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            transitions = []
+            if circuit.state is CircuitState.HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                transitions = self._transition(endpoint, circuit, CircuitState.OPEN)
+            elif circuit.state is CircuitState.CLOSED:
+                circuit.failures += 1
+                if circuit.failures >= self.failure_threshold:
+                    transitions = self._transition(endpoint, circuit, CircuitState.OPEN)
+        self._emit(transitions)
+
+    def release(self, endpoint: str) -> None:
+        """Free the slot of an admitted call that ended without an outcome"""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is not None and circuit.state is CircuitState.HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+
+    def _advance(
+        self, endpoint: str, circuit: _Circuit, now: float
+    ) -> List[CircuitTransition]:
+        """Turn an open circuit half-open once its reset timeout has passed"""
+        if (
+            circuit.state is CircuitState.OPEN
+            and now - circuit.opened_at >= self.reset_timeout
+        ):
+            return self._transition(endpoint, circuit, CircuitState.HALF_OPEN)
+        return []
+
+    def _transition(
+        self, endpoint: str, circuit: _Circuit, state: CircuitState
+    ) -> List[CircuitTransition]:
+        """Move a circuit to a new state, resetting its counters"""
+        transition = CircuitTransition(endpoint, circuit.state, state)
+        circuit.state = state
+        circuit.failures = 0
+        circuit.successes = 0
+        circuit.probes = 0
+        if state is CircuitState.OPEN:
+            circuit.opened_at = time.monotonic()
+        return [transition]
+
+    def _emit(self, transitions: Iterable[CircuitTransition]) -> None:
+        """Notify listeners outside of the lock"""
+        for transition in transitions:
+            for listener in self._listeners:
+                listener(transition)
+
+
+class HedgingPolicy:
+    """
+    Decides when to send a duplicate of a slow idempotent request.
+
+    The latencies of recent requests are kept per endpoint. Once an attempt
+    has been outstanding longer than the ``percentile`` of those latencies, a
+    duplicate is sent and whichever response arrives first is used, so a
+    single straggler does not set the tail latency. Hedging only applies to
+    the given idempotent ``methods``.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 0.1,
+        min_delay: float = 0.005,
+        max_hedges: int = 1,
+        window: int = 200,
+        min_samples: int = 20,
+        methods: Iterable[str] = ("GET", "HEAD", "OPTIONS"),
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            percentile: Latency percentile after which a duplicate is sent
+            initial_delay: Hedge delay used until ``min_samples`` are recorded
+            min_delay: Lower bound of the hedge delay
+            max_hedges: Maximum number of duplicates per request
+            window: Number of recent latencies kept per endpoint
+            min_samples: Latencies needed before the percentile is used
+            methods: HTTP methods that are safe to send more than once
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be in (0, 100]")
+        if max_hedges < 1:
+            raise ValueError("max_hedges must be at least 1")
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_hedges = max_hedges
+        self.window = window
+        self.min_samples = min_samples
+        self.methods = {method.upper() for method in methods}
+        self.hedged = 0
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def applies(self, method: str) -> bool:
+        """Return True if requests with this method may be hedged"""
+        return method.upper() in self.methods
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Record the latency of a completed request"""
+        with self._lock:
+            samples = self._latencies.get(endpoint)
+            if samples is None:
+                samples = self._latencies[endpoint] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def delay(self, endpoint: str) -> float:
+        """Get how long to wait for a response before sending a duplicate"""
+        with self._lock:
+            samples = sorted(self._latencies.get(endpoint, ()))
+        if len(samples) < self.min_samples:
+            return max(self.min_delay, self.initial_delay)
+        index = max(0, math.ceil(self.percentile / 100 * len(samples)) - 1)
+        return max(self.min_delay, samples[index])
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the current hedge delay per endpoint and the number of hedges sent"""
+        return {
+            "hedged": self.hedged,
+            "delays": {
+                endpoint: self.delay(endpoint) for endpoint in list(self._latencies)
+            },
+        }
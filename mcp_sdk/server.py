@@ -1,12 +1,40 @@
+import asyncio
+import hashlib
+import re
 from contextlib import asynccontextmanager
-from typing import Optional, Dict, Any, List
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Union,
+)
 from fastapi import FastAPI, HTTPException, Depends, Request
+from pydantic import ValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 import logging
 import uuid
-from datetime import datetime
-from .models import MCPRequest, MCPResponse, ClientInfo
+from datetime import datetime, timezone
+from .models import (
+    MCPRequest,
+    MCPResponse,
+    MCPBatchRequest,
+    MCPBatchItem,
+    MCPBatchResponse,
+    MCPStreamChunk,
+    ClientInfo,
+    MediaHandle,
+    UploadCompleteRequest,
+    UploadCreateRequest,
+)
+from .codec import JSONCodec, get_codec
 from .exceptions import MCPError
+from .resources import PaginatedResponse, ResourceResponse
 from .server_config import ServerConfig
 from .messages import (
     MessageType,
@@ -23,12 +51,34 @@ from .messages import (
     TextResponse,
     TextHandler,
 )
+from .server_utils.compression import CompressionMiddleware
+from .server_utils.media import MediaUpload, receive_media
 from .server_utils.runner import ServerRunner
+from .server_utils.uploads import UploadStore
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Media types for streamed responses
+SSE_MEDIA_TYPE = "text/event-stream"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Handles a media upload for one operation
+MediaHandler = Callable[[MediaUpload, ClientInfo], Awaitable[Any]]
+
+# Characters allowed in an entity tag without escaping
+_ETAG_SAFE = re.compile(r"^[!#-~]+$")
+
+
+class CodecJSONResponse(JSONResponse):
+    """JSON response rendered with a pluggable codec instead of stdlib json"""
+
+    codec: JSONCodec = get_codec()
+
+    def render(self, content: Any) -> bytes:
+        return self.codec.dumps(content)
+
 
 class MCPServer:
     """MCP Server implementation with lifespan support"""
@@ -41,6 +91,14 @@ class MCPServer:
             config: Server configuration
         """
         self.config = config or ServerConfig()
+        self.codec = get_codec(self.config.json_codec)
+        self._media_handlers: Dict[str, MediaHandler] = {}
+        self.uploads = UploadStore(
+            directory=self.config.upload_dir,
+            ttl=self.config.upload_ttl,
+            max_part_size=self.config.max_upload_part_size,
+            max_size=self.config.max_upload_size,
+        )
         self.app = self._create_app()
         self._setup_middleware()
         self._setup_routes()
@@ -53,6 +111,17 @@ class MCPServer:
         self.message_processor.register_handler(TextHandler())
         # Register other handlers here
 
+    def register_media_handler(self, operation: str, handler: MediaHandler) -> None:
+        """
+        Register the handler for raw media uploads of an operation.
+
+        Args:
+            operation: Value of the ``operation`` request parameter
+            handler: Coroutine function receiving the upload and client info and
+                returning the response model
+        """
+        self._media_handlers[operation] = handler
+
     def _create_app(self) -> FastAPI:
         """Create the FastAPI application with lifespan support"""
 
@@ -82,6 +151,9 @@ class MCPServer:
             description="Media Control Protocol Server",
             version="1.0.0",
             lifespan=lifespan,
+            default_response_class=type(
+                "MCPJSONResponse", (CodecJSONResponse,), {"codec": self.codec}
+            ),
         )
 
     def _setup_middleware(self):
@@ -93,15 +165,25 @@ class MCPServer:
             allow_headers=self.config.cors_headers,
             allow_credentials=True,
         )
+        if self.config.compression:
+            self.app.add_middleware(
+                CompressionMiddleware,
+                minimum_size=self.config.compression_min_size,
+                max_decompressed_size=self.config.max_decompressed_size,
+            )
 
     def _setup_routes(self):
         """Setup API routes"""
 
+        @self.app.get("/health")
+        async def health() -> Dict[str, str]:
+            """Report that the server is up, for client-side health checks"""
+            return {"status": "ok"}
+
         @self.app.post("/api/v1/process", response_model=MCPResponse)
         async def process_request(
             request_data: MCPRequest,
-            request: Request,
-            client_info: ClientInfo = Depends(lambda: self._get_client_info(request)),
+            client_info: ClientInfo = Depends(self._get_client_info),
         ) -> MCPResponse:
             """
             Process an MCP request.
@@ -114,20 +196,448 @@ class MCPServer:
                 MCPResponse: The processed response
             """
             try:
-                # Convert MCPRequest to typed message
-                message = self._create_message(request_data, client_info)
-
-                # Process the message
-                response = await self.message_processor.process(message)
-
-                # Convert response to MCPResponse
-                return self._create_mcp_response(response)
+                return self.json_response(
+                    await self._process_mcp_request(request_data, client_info)
+                )
             except MCPError as e:
                 raise HTTPException(status_code=400, detail=str(e))
             except Exception as e:
                 logger.error(f"Request processing failed: {str(e)}")
                 raise HTTPException(status_code=500, detail="Internal server error")
 
+        @self.app.post("/api/v1/process:batch", response_model=MCPBatchResponse)
+        async def process_batch(
+            batch: MCPBatchRequest,
+            client_info: ClientInfo = Depends(self._get_client_info),
+        ) -> MCPBatchResponse:
+            """
+            Process a batch of MCP requests concurrently.
+
+            Each request succeeds or fails independently; failures are reported
+            in the matching item rather than failing the whole batch.
+
+            Args:
+                batch: The MCP requests to process
+                client_info: Client information
+
+            Returns:
+                MCPBatchResponse: One result per request, in request order
+            """
+            if len(batch.requests) > self.config.max_batch_size:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Batch size exceeds maximum of {self.config.max_batch_size}",
+                )
+
+            items = await asyncio.gather(
+                *(
+                    self._process_batch_item(index, request_data, client_info)
+                    for index, request_data in enumerate(batch.requests)
+                )
+            )
+            return self.json_response(MCPBatchResponse(responses=list(items)))
+
+        @self.app.post("/api/v1/process:media")
+        async def process_media(
+            request: Request,
+            client_info: ClientInfo = Depends(self._get_client_info),
+        ) -> Response:
+            """
+            Process a media upload sent as a raw request body.
+
+            The body is received into a spooled buffer that moves to disk past
+            ``media_spool_size``; the request parameters are read from the
+            ``X-MCP-Params`` header.
+
+            Args:
+                request: The HTTP request carrying the media
+                client_info: Client information
+
+            Returns:
+                Response: The handler's response
+            """
+            return await self._process_media(request, client_info)
+
+        @self.app.post("/api/v1/uploads")
+        async def create_upload(
+            upload: UploadCreateRequest,
+            client_info: ClientInfo = Depends(self._get_client_info),
+        ) -> Response:
+            """
+            Start a chunked upload.
+
+            The media is then sent as numbered parts of ``part_size`` bytes,
+            in any order and in parallel, and assembled by the complete call.
+
+            Args:
+                upload: Name, media type and size of the upload
+                client_info: Client information
+
+            Returns:
+                Response: The UploadSession
+            """
+            return self.json_response(self.uploads.create(upload), status_code=201)
+
+        @self.app.get("/api/v1/uploads/{upload_id}")
+        async def get_upload(
+            upload_id: str,
+            client_info: ClientInfo = Depends(self._get_client_info),
+        ) -> Response:
+            """
+            Get the state of a chunked upload.
+
+            ``received_parts`` lists the parts stored so far, so an interrupted
+            upload can be resumed by sending only the others.
+
+            Args:
+                upload_id: The upload ID
+                client_info: Client information
+
+            Returns:
+                Response: The UploadSession
+            """
+            return self.json_response(self.uploads.status(upload_id))
+
+        @self.app.put("/api/v1/uploads/{upload_id}/parts/{index}")
+        async def upload_part(
+            upload_id: str,
+            index: int,
+            request: Request,
+            client_info: ClientInfo = Depends(self._get_client_info),
+        ) -> Response:
+            """
+            Store one part of a chunked upload, sent as a raw request body.
+
+            Sending a part again replaces it.
+
+            Args:
+                upload_id: The upload ID
+                index: Zero-based part number
+                request: The HTTP request carrying the part
+                client_info: Client information
+
+            Returns:
+                Response: An empty 204 response
+            """
+            await self.uploads.write_part(upload_id, index, request)
+            return Response(status_code=204)
+
+        @self.app.post("/api/v1/uploads/{upload_id}/complete")
+        async def complete_upload(
+            upload_id: str,
+            complete: UploadCompleteRequest,
+            client_info: ClientInfo = Depends(self._get_client_info),
+        ) -> Response:
+            """
+            Assemble a chunked upload once all its parts are stored.
+
+            Args:
+                upload_id: The upload ID
+                complete: Number of parts and total size
+                client_info: Client information
+
+            Returns:
+                Response: The MediaHandle that later requests reference
+            """
+            return self.json_response(await self.uploads.complete(upload_id, complete))
+
+        @self.app.delete("/api/v1/uploads/{upload_id}")
+        async def delete_upload(
+            upload_id: str,
+            client_info: ClientInfo = Depends(self._get_client_info),
+        ) -> Response:
+            """
+            Abort a chunked upload or discard its media.
+
+            Args:
+                upload_id: The upload ID
+                client_info: Client information
+
+            Returns:
+                Response: An empty 204 response
+            """
+            self.uploads.delete(upload_id)
+            return Response(status_code=204)
+
+        @self.app.post("/api/v1/process:stream")
+        async def process_stream(
+            request_data: MCPRequest,
+            request: Request,
+            client_info: ClientInfo = Depends(self._get_client_info),
+        ) -> StreamingResponse:
+            """
+            Process an MCP request, streaming partial results as they are produced.
+
+            Chunks are sent as Server-Sent Events when the client accepts
+            ``text/event-stream`` and as newline-delimited JSON otherwise. The
+            last chunk has ``done`` set, and carries ``error`` if processing
+            failed after the stream started.
+
+            Args:
+                request_data: The MCP request
+                request: The HTTP request, used for content negotiation
+                client_info: Client information
+
+            Returns:
+                StreamingResponse: The stream of MCPStreamChunk objects
+            """
+            try:
+                message = self._create_message(request_data, client_info)
+            except MCPError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            media_type = (
+                SSE_MEDIA_TYPE
+                if SSE_MEDIA_TYPE in request.headers.get("accept", "")
+                else NDJSON_MEDIA_TYPE
+            )
+            return StreamingResponse(
+                self._stream_chunks(message, media_type), media_type=media_type
+            )
+
+    def json_response(
+        self,
+        model: Any,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """
+        Serialize a model straight to a JSON response.
+
+        Returning the encoded body skips FastAPI's conversion of the model to
+        a dict and back.
+
+        Args:
+            model: The pydantic model to return
+            status_code: HTTP status code
+            headers: Optional response headers
+
+        Returns:
+            Response: The JSON response
+        """
+        return Response(
+            content=self.codec.dump_model(model),
+            status_code=status_code,
+            media_type="application/json",
+            headers=headers,
+        )
+
+    async def _process_media(
+        self, request: Request, client_info: ClientInfo
+    ) -> Response:
+        """
+        Spool a media upload and pass it to its operation's handler.
+
+        When the parameters carry a ``media_id``, the media of that completed
+        chunked upload is used instead of the request body.
+        """
+        upload = await receive_media(
+            request,
+            self.codec,
+            spool_size=self.config.media_spool_size,
+            max_size=self.config.max_media_size,
+        )
+        try:
+            media_id = upload.params.get("media_id")
+            if media_id is not None:
+                self._use_stored_media(upload, str(media_id))
+            handler = self._media_handlers.get(upload.operation)
+            if handler is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Unsupported media operation: {upload.operation}",
+                )
+            try:
+                result = await handler(upload, client_info)
+            except MCPError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return self.json_response(result)
+        finally:
+            upload.close()
+
+    def _use_stored_media(self, upload: MediaUpload, media_id: str) -> None:
+        """Point an upload at the media of a completed chunked upload"""
+        handle: MediaHandle = self.uploads.media_info(media_id)
+        upload.file.close()
+        upload.file = self.uploads.open_media(media_id)
+        upload.size = handle.size
+        upload.content_type = handle.content_type
+        upload.filename = handle.filename
+
+    async def _process_mcp_request(
+        self, request: MCPRequest, client_info: ClientInfo
+    ) -> MCPResponse:
+        """Run an MCPRequest through the message processor"""
+        # Convert MCPRequest to typed message
+        message = self._create_message(request, client_info)
+
+        # Process the message
+        response = await self.message_processor.process(message)
+
+        # Convert response to MCPResponse
+        return self._create_mcp_response(response)
+
+    async def _stream_chunks(
+        self, message: BaseMessage, media_type: str
+    ) -> AsyncIterator[bytes]:
+        """Encode the partial results of a message as stream chunks"""
+        index = 0
+        try:
+            async for result in self.message_processor.stream(message):
+                chunk = MCPStreamChunk(
+                    id=message.id,
+                    model=message.type.value,
+                    index=index,
+                    content=self._get_chunk_content(result),
+                )
+                yield self._encode_chunk(chunk, media_type)
+                index += 1
+            final = MCPStreamChunk(
+                id=message.id,
+                model=message.type.value,
+                index=index,
+                content="",
+                done=True,
+                usage={"tokens": 0},  # Update with actual usage
+                metadata=message.metadata.custom_data,
+            )
+        except Exception as e:
+            logger.error(f"Stream processing failed: {str(e)}")
+            final = MCPStreamChunk(
+                id=message.id,
+                model=message.type.value,
+                index=index,
+                content="",
+                done=True,
+                error=str(e) if isinstance(e, MCPError) else "Internal server error",
+            )
+        yield self._encode_chunk(final, media_type)
+
+    @staticmethod
+    def _get_chunk_content(result: Any) -> str:
+        """Get the text of a partial result"""
+        if isinstance(result, TextResult):
+            return result.processed_text
+        return str(result)
+
+    def _encode_chunk(self, chunk: MCPStreamChunk, media_type: str) -> bytes:
+        """Frame a chunk for the negotiated stream format"""
+        if media_type == SSE_MEDIA_TYPE:
+            return b"data: " + self.codec.dump_model(chunk) + b"\n\n"
+        return self.codec.dump_model(chunk) + b"\n"
+
+    @staticmethod
+    def resource_etag(resource: Union[ResourceResponse, PaginatedResponse]) -> str:
+        """
+        Derive a weak ETag from the metadata versions of a resource.
+
+        Args:
+            resource: A single resource or a page of resources
+
+        Returns:
+            str: The quoted entity tag
+        """
+        if isinstance(resource, PaginatedResponse):
+            digest = hashlib.sha1()
+            for metadata in resource.metadata:
+                digest.update(f"{metadata.id}:{metadata.version}\n".encode("utf-8"))
+            pagination = resource.pagination
+            digest.update(
+                f"{pagination.page}:{pagination.per_page}:{pagination.total}".encode(
+                    "utf-8"
+                )
+            )
+            return f'W/"{digest.hexdigest()}"'
+
+        version = resource.metadata.version
+        if not _ETAG_SAFE.match(version):
+            version = hashlib.sha1(version.encode("utf-8")).hexdigest()
+        return f'W/"{version}"'
+
+    def conditional_response(
+        self, request: Request, resource: Union[ResourceResponse, PaginatedResponse]
+    ) -> Response:
+        """
+        Serialize a resource with validators, honoring conditional requests.
+
+        The response carries an ``ETag`` derived from the resource's metadata
+        version and a ``Last-Modified`` date from its ``updated_at``. If the
+        request's ``If-None-Match`` (or, without it, ``If-Modified-Since``)
+        shows the client already holds this version, an empty
+        ``304 Not Modified`` is returned instead of the body.
+
+        Args:
+            request: The incoming request
+            resource: The resource to return
+
+        Returns:
+            Response: The full JSON response, or a 304 response
+        """
+        etag = self.resource_etag(resource)
+        headers = {"ETag": etag}
+        metadata = (
+            resource.metadata
+            if isinstance(resource, PaginatedResponse)
+            else [resource.metadata]
+        )
+        updated_at = max((m.updated_at for m in metadata), default=None)
+        if updated_at is not None:
+            if updated_at.tzinfo is None:
+                updated_at = updated_at.replace(tzinfo=timezone.utc)
+            headers["Last-Modified"] = format_datetime(updated_at, usegmt=True)
+
+        if self._not_modified(request, etag, updated_at):
+            return Response(status_code=304, headers=headers)
+        return self.json_response(resource, headers=headers)
+
+    @staticmethod
+    def _not_modified(
+        request: Request, etag: str, updated_at: Optional[datetime]
+    ) -> bool:
+        """Check the request's validators against the current version"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            if if_none_match.strip() == "*":
+                return True
+            # Weak comparison, as required for GET and HEAD
+            opaque = etag[2:] if etag.startswith("W/") else etag
+            for tag in if_none_match.split(","):
+                tag = tag.strip()
+                if (tag[2:] if tag.startswith("W/") else tag) == opaque:
+                    return True
+            return False
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or updated_at is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates have a resolution of one second
+        return updated_at.replace(microsecond=0) <= since
+
+    async def _process_batch_item(
+        self, index: int, request_data: Dict[str, Any], client_info: ClientInfo
+    ) -> MCPBatchItem:
+        """Validate and process a single request of a batch, capturing its error if any"""
+        try:
+            request = MCPRequest(**request_data)
+        except ValidationError as e:
+            return MCPBatchItem(index=index, status_code=422, error=str(e))
+        try:
+            response = await self._process_mcp_request(request, client_info)
+            return MCPBatchItem(index=index, response=response)
+        except MCPError as e:
+            return MCPBatchItem(index=index, status_code=400, error=str(e))
+        except Exception as e:
+            logger.error(f"Batch item {index} processing failed: {str(e)}")
+            return MCPBatchItem(
+                index=index, status_code=500, error="Internal server error"
+            )
+
     def _create_message(
         self, request: MCPRequest, client_info: ClientInfo
     ) -> BaseMessage:
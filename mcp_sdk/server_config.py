@@ -14,3 +14,23 @@ class ServerConfig(BaseModel):
     cors_origins: List[str] = ["*"]
     cors_methods: List[str] = ["*"]
     cors_headers: List[str] = ["*"]
+    max_batch_size: int = 100
+    # JSON backend for responses ("orjson", "msgspec" or "json"); None picks
+    # the fastest one installed
+    json_codec: Optional[str] = None
+    # Negotiate gzip/zstd for responses of at least compression_min_size bytes
+    compression: bool = True
+    compression_min_size: int = 1024
+    # Compressed request bodies are rejected with 413 once they decompress
+    # past this many bytes
+    max_decompressed_size: Optional[int] = 64 * 1024 * 1024
+    # Raw media uploads are buffered in memory up to media_spool_size bytes and
+    # on disk beyond that
+    media_spool_size: int = 1024 * 1024
+    max_media_size: Optional[int] = 512 * 1024 * 1024
+    # Chunked uploads are kept under upload_dir (a temporary directory if
+    # unset) for upload_ttl seconds
+    upload_dir: Optional[str] = None
+    upload_ttl: int = 24 * 3600
+    max_upload_part_size: int = 64 * 1024 * 1024
+    max_upload_size: Optional[int] = None
@@ -0,0 +1,242 @@
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from mcp_sdk.compression import (
+    Compressor,
+    Decompressor,
+    available_encodings,
+    is_compressible,
+    negotiate,
+)
+from mcp_sdk.exceptions import MCPConfigurationError, MCPPayloadTooLargeError
+
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware that negotiates gzip/zstd compression.
+
+    Responses are compressed with the best coding the client accepts once they
+    reach ``minimum_size`` bytes; streamed responses are flushed chunk by
+    chunk so they keep streaming. Request bodies sent with a
+    ``Content-Encoding`` are decompressed before they reach the application,
+    and answered with 413 once they decompress past ``max_decompressed_size``.
+    """
+
+    def __init__(
+        self,
+        app: Callable[[Message, Receive, Send], Awaitable[None]],
+        minimum_size: int = 1024,
+        encodings: Optional[Sequence[str]] = None,
+        level: Optional[int] = None,
+        max_decompressed_size: Optional[int] = None,
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            minimum_size: Smallest response body, in bytes, that is compressed
+            encodings: Codings to offer, best first; defaults to all supported
+            level: Compression level passed to the compressor
+            max_decompressed_size: Largest decompressed request body in
+                bytes; unlimited if omitted
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = list(encodings or available_encodings())
+        self.level = level
+        self.max_decompressed_size = max_decompressed_size
+
+    async def __call__(self, scope: Message, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        content_encoding = headers.get("content-encoding", "identity").lower()
+        limit: Optional[_BodyLimit] = None
+        if content_encoding != "identity":
+            try:
+                decompressor = Decompressor(
+                    content_encoding, self.max_decompressed_size
+                )
+            except MCPConfigurationError:
+                await _send_error(send, 415, "Unsupported Content-Encoding")
+                return
+            limit = _BodyLimit(send)
+            scope = self._strip_body_headers(scope)
+            receive = limit.receive(receive, decompressor)
+            send = limit.send
+
+        encoding = negotiate(headers.get("accept-encoding"), self.encodings)
+        if encoding is not None:
+            responder = _CompressingResponder(
+                send, encoding, self.minimum_size, self.level
+            )
+            send = responder.send
+        try:
+            await self.app(scope, receive, send)
+        except MCPPayloadTooLargeError:
+            if limit is None or not await limit.reject():
+                raise
+
+    @staticmethod
+    def _strip_body_headers(scope: Message) -> Message:
+        """Drop headers that describe the compressed request body"""
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        return scope
+
+
+class _BodyLimit:
+    """
+    Decompresses one request body and answers 413 if it grows too large.
+
+    The application sees the overflow as an error while reading the body and
+    may answer it with its own error response, e.g. a 400 from a framework
+    parsing the body; that response is replaced with the 413.
+    """
+
+    def __init__(self, send: Send):
+        self._send = send
+        self._exceeded = False
+        self._started = False
+        self._rejected = False
+
+    def receive(self, receive: Receive, decompressor: Decompressor) -> Receive:
+        """Wrap ``receive`` so request body chunks arrive decompressed"""
+
+        async def wrapped() -> Message:
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+            try:
+                body = decompressor.decompress(message.get("body", b""))
+                if not message.get("more_body", False):
+                    body += decompressor.flush()
+            except MCPPayloadTooLargeError:
+                self._exceeded = True
+                raise
+            return {**message, "body": body}
+
+        return wrapped
+
+    async def send(self, message: Message) -> None:
+        if self._exceeded:
+            if message["type"] == "http.response.start":
+                await self.reject()
+            return
+        if message["type"] == "http.response.start":
+            self._started = True
+        await self._send(message)
+
+    async def reject(self) -> bool:
+        """
+        Send the 413 response unless a response has already started.
+
+        Returns:
+            bool: True if the 413 was sent, now or before
+        """
+        if self._rejected:
+            return True
+        if self._started:
+            return False
+        self._started = self._rejected = True
+        await _send_error(self._send, 413, "Decompressed request body is too large")
+        return True
+
+
+async def _send_error(send: Send, status: int, detail: str) -> None:
+    """Answer a request with a JSON error body"""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send(
+        {
+            "type": "http.response.body",
+            "body": json.dumps({"detail": detail}).encode(),
+        }
+    )
+
+
+class _CompressingResponder:
+    """Compresses the response of one request as it is sent"""
+
+    def __init__(
+        self, send: Send, encoding: str, minimum_size: int, level: Optional[int]
+    ):
+        self._send = send
+        self._encoding = encoding
+        self._minimum_size = minimum_size
+        self._level = level
+        self._start: Optional[Message] = None
+        self._compressor: Optional[Compressor] = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Headers depend on the body, so hold them until it starts
+            self._start = message
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._start is not None:
+            start, self._start = self._start, None
+            headers = MutableHeaders(raw=start["headers"])
+            if not self._should_compress(start, headers, body, more_body):
+                self._passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+
+            self._compressor = Compressor(self._encoding, self._level)
+            headers["Content-Encoding"] = self._encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                body = self._compressor.compress(body) + self._compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._send(start)
+                await self._send({**message, "body": body})
+                return
+            await self._send(start)
+
+        compressor = self._compressor
+        if compressor is None:
+            # A body without a response start is not ours to compress
+            await self._send(message)
+            return
+        if more_body:
+            body = compressor.compress(body) + compressor.flush()
+        else:
+            body = compressor.compress(body) + compressor.finish()
+        await self._send({**message, "body": body})
+
+    def _should_compress(
+        self, start: Message, headers: MutableHeaders, body: bytes, more_body: bool
+    ) -> bool:
+        """Decide from the first body chunk whether to compress the response"""
+        if start["status"] in (204, 304) or "content-encoding" in headers:
+            return False
+        if not is_compressible(headers.get("content-type")):
+            return False
+        return more_body or len(body) >= self._minimum_size
@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+from tempfile import SpooledTemporaryFile
+from typing import Any, BinaryIO, Dict, Optional
+from urllib.parse import unquote
+
+from fastapi import HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+
+from mcp_sdk.codec import JSONCodec
+from mcp_sdk.media import (
+    DEFAULT_CONTENT_TYPE,
+    MEDIA_FILENAME_HEADER,
+    MEDIA_PARAMS_HEADER,
+)
+
+
+@dataclass
+class MediaUpload:
+    """
+    A raw media upload, received into a buffer that spills to disk or opened
+    from a completed chunked upload
+    """
+
+    params: Dict[str, Any]
+    file: BinaryIO
+    content_type: str
+    size: int
+    filename: Optional[str] = None
+
+    @property
+    def operation(self) -> Optional[str]:
+        """Get the requested operation"""
+        return self.params.get("operation")
+
+    def close(self) -> None:
+        """Release the upload's file"""
+        self.file.close()
+
+
+async def spool_request_body(
+    request: Request, spool_size: int, max_size: Optional[int] = None
+) -> SpooledTemporaryFile:
+    """
+    Read a request body into a spooled temporary file.
+
+    The body is kept in memory up to ``spool_size`` bytes and moved to disk
+    beyond that, so memory per request stays bounded whatever the body size.
+
+    Args:
+        request: The incoming request
+        spool_size: Bytes kept in memory before spilling to disk
+        max_size: Largest accepted body, or None for no limit
+
+    Returns:
+        SpooledTemporaryFile: The body, rewound to the start
+
+    Raises:
+        HTTPException: 413 if the body exceeds ``max_size``
+    """
+    declared = request.headers.get("content-length")
+    if max_size is not None and declared and declared.isdigit():
+        if int(declared) > max_size:
+            raise _too_large(max_size)
+
+    buffer = SpooledTemporaryFile(max_size=spool_size)
+    size = 0
+    try:
+        async for chunk in request.stream():
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                raise _too_large(max_size)
+            if getattr(buffer, "_rolled", False):
+                # Writing to disk blocks, keep it off the event loop
+                await run_in_threadpool(buffer.write, chunk)
+            else:
+                buffer.write(chunk)
+        buffer.seek(0)
+    except BaseException:
+        buffer.close()
+        raise
+    return buffer
+
+
+async def receive_media(
+    request: Request,
+    codec: JSONCodec,
+    spool_size: int,
+    max_size: Optional[int] = None,
+) -> MediaUpload:
+    """
+    Receive a raw media upload with its parameters.
+
+    Raises:
+        HTTPException: 400 if the parameters are malformed, 413 if the body is
+            too large
+    """
+    try:
+        params = codec.loads(unquote(request.headers.get(MEDIA_PARAMS_HEADER, "{}")))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid media parameters: {e}")
+    if not isinstance(params, dict):
+        raise HTTPException(
+            status_code=400, detail="Media parameters must be an object"
+        )
+
+    buffer = await spool_request_body(request, spool_size, max_size)
+    filename = request.headers.get(MEDIA_FILENAME_HEADER)
+    buffer.seek(0, 2)
+    size = buffer.tell()
+    buffer.seek(0)
+    return MediaUpload(
+        params=params,
+        file=buffer,
+        content_type=request.headers.get("content-type", DEFAULT_CONTENT_TYPE),
+        size=size,
+        filename=unquote(filename) if filename else None,
+    )
+
+
+def _too_large(max_size: int) -> HTTPException:
+    return HTTPException(
+        status_code=413, detail=f"Media exceeds maximum size of {max_size} bytes"
+    )
@@ -0,0 +1,284 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import BinaryIO, Dict, List, Optional
+
+from fastapi import HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+
+from mcp_sdk.models import (
+    MediaHandle,
+    UploadCompleteRequest,
+    UploadCreateRequest,
+    UploadSession,
+)
+
+# Upload ids are generated here; anything else is rejected before touching disk
+_UPLOAD_ID = re.compile(r"^[0-9a-f]{32}$")
+
+_META = "upload.json"
+_MEDIA = "media"
+
+
+class UploadStore:
+    """
+    Disk-backed store for chunked, resumable media uploads.
+
+    Each upload lives in its own directory. Parts are written to a temporary
+    file and renamed into place once complete, so a part whose transfer broke
+    off is simply missing and can be sent again. The parts on disk are the
+    source of truth for resuming, which also survives a server restart.
+    Completing an upload concatenates its parts into one media file that later
+    requests reference by id. Uploads expire ``ttl`` seconds after they were
+    started.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        ttl: float = 24 * 3600,
+        max_part_size: int = 64 * 1024 * 1024,
+        max_size: Optional[int] = None,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Where uploads are kept; a temporary directory if omitted
+            ttl: Seconds an upload and its media are kept
+            max_part_size: Largest accepted part
+            max_size: Largest accepted upload, or None for no limit
+        """
+        self._directory = directory
+        self.ttl = ttl
+        self.max_part_size = max_part_size
+        self.max_size = max_size
+
+    @property
+    def directory(self) -> str:
+        """Get the upload directory, creating it on first use"""
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix="mcp-uploads-")
+        else:
+            os.makedirs(self._directory, exist_ok=True)
+        return self._directory
+
+    def _path(self, upload_id: str, *parts: str) -> str:
+        if not _UPLOAD_ID.match(upload_id):
+            raise HTTPException(status_code=404, detail="Upload not found")
+        return os.path.join(self.directory, upload_id, *parts)
+
+    def _load(self, upload_id: str) -> Dict:
+        """Read an upload's metadata, dropping it if it has expired"""
+        try:
+            with open(self._path(upload_id, _META)) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            raise HTTPException(status_code=404, detail="Upload not found")
+        if meta["expires_at"] <= time.time():
+            self.delete(upload_id)
+            raise HTTPException(status_code=404, detail="Upload has expired")
+        return meta
+
+    def _save(self, upload_id: str, meta: Dict) -> None:
+        path = self._path(upload_id, _META)
+        with open(path + ".tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(path + ".tmp", path)
+
+    def _received_parts(self, upload_id: str) -> List[int]:
+        return sorted(
+            int(name[5:])
+            for name in os.listdir(self._path(upload_id))
+            if name.startswith("part-") and name[5:].isdigit()
+        )
+
+    @staticmethod
+    def _expires_at(meta: Dict) -> datetime:
+        return datetime.fromtimestamp(meta["expires_at"], tz=timezone.utc)
+
+    def create(self, request: UploadCreateRequest) -> UploadSession:
+        """
+        Start an upload.
+
+        Raises:
+            HTTPException: 413 if the upload or its parts are too large
+        """
+        if request.part_size > self.max_part_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Part size exceeds maximum of {self.max_part_size} bytes",
+            )
+        self._check_size(request.size)
+        self.purge_expired()
+
+        upload_id = uuid.uuid4().hex
+        os.makedirs(os.path.join(self.directory, upload_id))
+        meta = {
+            "filename": request.filename,
+            "content_type": request.content_type,
+            "size": request.size,
+            "part_size": request.part_size,
+            "expires_at": time.time() + self.ttl,
+            "complete": False,
+        }
+        self._save(upload_id, meta)
+        return self._session(upload_id, meta)
+
+    def _check_size(self, size: Optional[int]) -> None:
+        if self.max_size is not None and size is not None and size > self.max_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Upload exceeds maximum size of {self.max_size} bytes",
+            )
+
+    def _session(self, upload_id: str, meta: Dict) -> UploadSession:
+        return UploadSession(
+            id=upload_id,
+            filename=meta["filename"],
+            content_type=meta["content_type"],
+            size=meta["size"],
+            part_size=meta["part_size"],
+            received_parts=self._received_parts(upload_id),
+            expires_at=self._expires_at(meta),
+        )
+
+    def status(self, upload_id: str) -> UploadSession:
+        """Get an upload's state, including the parts received so far"""
+        return self._session(upload_id, self._load(upload_id))
+
+    async def write_part(self, upload_id: str, index: int, request: Request) -> None:
+        """
+        Store one part of an upload from the request body.
+
+        Raises:
+            HTTPException: 404 for unknown uploads, 409 if the upload was
+                completed, 400 for a bad index, 413 for oversized parts
+        """
+        meta = self._load(upload_id)
+        if meta["complete"]:
+            raise HTTPException(status_code=409, detail="Upload is already complete")
+        if index < 0 or (
+            meta["size"] is not None
+            and index * meta["part_size"] >= max(meta["size"], 1)
+        ):
+            raise HTTPException(status_code=400, detail=f"Invalid part index: {index}")
+
+        path = self._path(upload_id, f"part-{index}")
+        temporary = f"{path}.{uuid.uuid4().hex}.tmp"
+        size = 0
+        try:
+            with open(temporary, "wb") as f:
+                async for chunk in request.stream():
+                    size += len(chunk)
+                    if size > meta["part_size"]:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"Part exceeds part size of {meta['part_size']} bytes",
+                        )
+                    await run_in_threadpool(f.write, chunk)
+            os.replace(temporary, path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    async def complete(
+        self, upload_id: str, request: UploadCompleteRequest
+    ) -> MediaHandle:
+        """
+        Assemble an upload's parts into its media file.
+
+        Raises:
+            HTTPException: 404 for unknown uploads, 400 if parts are missing or
+                the size does not match
+        """
+        meta = self._load(upload_id)
+        if meta["complete"]:
+            return self._handle(upload_id, meta)
+
+        self._check_size(request.size)
+        if meta["size"] is not None and meta["size"] != request.size:
+            raise HTTPException(status_code=400, detail="Upload size does not match")
+        missing = sorted(
+            set(range(request.parts)) - set(self._received_parts(upload_id))
+        )
+        if missing:
+            raise HTTPException(
+                status_code=400, detail=f"Missing parts: {missing[:20]}"
+            )
+
+        media = self._path(upload_id, _MEDIA)
+        size = await run_in_threadpool(self._assemble, upload_id, request.parts, media)
+        if size != request.size:
+            os.remove(media)
+            raise HTTPException(
+                status_code=400,
+                detail=f"Upload size does not match: received {size} bytes",
+            )
+
+        for index in range(request.parts):
+            os.remove(self._path(upload_id, f"part-{index}"))
+        meta.update(size=size, complete=True)
+        self._save(upload_id, meta)
+        return self._handle(upload_id, meta)
+
+    def _assemble(self, upload_id: str, parts: int, media: str) -> int:
+        """Concatenate the parts in order; runs in a worker thread"""
+        with open(media + ".tmp", "wb") as out:
+            for index in range(parts):
+                with open(self._path(upload_id, f"part-{index}"), "rb") as part:
+                    shutil.copyfileobj(part, out, 1024 * 1024)
+            size = out.tell()
+        os.replace(media + ".tmp", media)
+        return size
+
+    def _handle(self, upload_id: str, meta: Dict) -> MediaHandle:
+        return MediaHandle(
+            id=upload_id,
+            filename=meta["filename"],
+            content_type=meta["content_type"],
+            size=meta["size"],
+            expires_at=self._expires_at(meta),
+        )
+
+    def open_media(self, upload_id: str) -> BinaryIO:
+        """
+        Open the media of a completed upload for reading.
+
+        Raises:
+            HTTPException: 404 if there is no completed upload with this id
+        """
+        meta = self._load(upload_id)
+        if not meta["complete"]:
+            raise HTTPException(status_code=404, detail="Upload is not complete")
+        return open(self._path(upload_id, _MEDIA), "rb")
+
+    def media_info(self, upload_id: str) -> MediaHandle:
+        """Get the handle of a completed upload"""
+        meta = self._load(upload_id)
+        if not meta["complete"]:
+            raise HTTPException(status_code=404, detail="Upload is not complete")
+        return self._handle(upload_id, meta)
+
+    def delete(self, upload_id: str) -> None:
+        """Abort an upload or discard its media"""
+        shutil.rmtree(self._path(upload_id), ignore_errors=True)
+
+    def purge_expired(self) -> None:
+        """Remove every upload whose time to live has passed"""
+        now = time.time()
+        for upload_id in os.listdir(self.directory):
+            if not _UPLOAD_ID.match(upload_id):
+                continue
+            try:
+                with open(self._path(upload_id, _META)) as f:
+                    expired = json.load(f)["expires_at"] <= now
+            except (OSError, ValueError, KeyError):
+                expired = True
+            if expired:
+                self.delete(upload_id)
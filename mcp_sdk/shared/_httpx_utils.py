@@ -10,17 +10,26 @@ __all__ = ["create_mcp_http_client"]
 def create_mcp_http_client(
     headers: dict[str, str] | None = None,
     timeout: httpx.Timeout | None = None,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
+    verify: bool = True,
 ) -> httpx.AsyncClient:
     """Create a standardized httpx AsyncClient with MCP defaults.
 
     This function provides common defaults used throughout the MCP codebase:
     - follow_redirects=True (always enabled)
     - Default timeout of 30 seconds if not specified
+    - Connection pooling with keep-alive, using httpx defaults if not specified
 
     Args:
         headers: Optional headers to include with all requests.
         timeout: Request timeout as httpx.Timeout object.
             Defaults to 30 seconds if not specified.
+        limits: Connection pool limits as httpx.Limits object.
+            Defaults to httpx's own pool limits if not specified.
+        http2: Whether to enable HTTP/2. Requires the optional ``h2`` package
+            (``pip install httpx[http2]``).
+        verify: Whether to verify TLS certificates.
 
     Returns:
         Configured httpx.AsyncClient instance with MCP defaults.
@@ -43,10 +52,17 @@ def create_mcp_http_client(
         timeout = httpx.Timeout(60.0, read=300.0)
         async with create_mcp_http_client(headers, timeout) as client:
             response = await client.get("/long-request")
+
+        # With a larger keep-alive pool over HTTP/2
+        limits = httpx.Limits(max_connections=200, max_keepalive_connections=50)
+        async with create_mcp_http_client(limits=limits, http2=True) as client:
+            response = await client.get("/endpoint")
     """
     # Set MCP defaults
     kwargs: dict[str, Any] = {
         "follow_redirects": True,
+        "http2": http2,
+        "verify": verify,
     }
 
     # Handle timeout
@@ -55,6 +71,10 @@ def create_mcp_http_client(
     else:
         kwargs["timeout"] = timeout
 
+    # Handle connection pool limits
+    if limits is not None:
+        kwargs["limits"] = limits
+
     # Handle headers
     if headers is not None:
         kwargs["headers"] = headers
@@ -0,0 +1,64 @@
+"""Helpers that work on both pydantic 1 and pydantic 2 models."""
+
+from typing import Any, Dict, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+__all__ = [
+    "field_annotation",
+    "model_copy",
+    "model_dump",
+    "model_dump_json",
+    "model_fields",
+    "model_validate_json",
+]
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def model_fields(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Get the fields a model declares, by name."""
+    fields: Optional[Dict[str, Any]] = getattr(model, "model_fields", None)
+    if fields is not None:
+        return fields
+    return getattr(model, "__fields__")
+
+
+def field_annotation(field: Any) -> Any:
+    """Get the declared type of a field returned by ``model_fields``.
+
+    Pydantic releases before 1.10 only keep the type with ``Optional``
+    stripped; callers that need it should add it back.
+    """
+    annotation = getattr(field, "annotation", None)
+    if annotation is not None:
+        return annotation
+    return field.outer_type_
+
+
+def model_dump(model: BaseModel) -> Dict[str, Any]:
+    """Convert a model to a dictionary of plain Python data."""
+    if hasattr(model, "model_dump"):
+        return model.model_dump()
+    return model.dict()
+
+
+def model_dump_json(model: BaseModel) -> bytes:
+    """Encode a model as JSON bytes."""
+    if hasattr(model, "model_dump_json"):
+        return model.model_dump_json().encode("utf-8")
+    return model.json().encode("utf-8")
+
+
+def model_validate_json(model: Type[M], data: Union[str, bytes]) -> M:
+    """Parse and validate JSON into a model."""
+    if hasattr(model, "model_validate_json"):
+        return model.model_validate_json(data)
+    return model.parse_raw(data)
+
+
+def model_copy(model: M, update: Optional[Dict[str, Any]] = None) -> M:
+    """Get a deep copy of a model, with the fields in ``update`` replaced."""
+    if hasattr(model, "model_copy"):
+        return model.model_copy(update=update, deep=True)
+    return model.copy(update=update, deep=True)
@@ -0,0 +1,163 @@
+"""
+Admission control for MCP sessions.
+
+This module provides a queue that bounds how many requests a session has
+outstanding, making callers wait for a slot instead of failing once the
+limit is reached.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+
+class AdmissionQueue:
+    """
+    Bounded set of slots handed out in priority order.
+
+    Callers above the limit wait in a queue ordered by priority, then by
+    arrival, so equal-priority callers are admitted first come, first served.
+    A released slot is handed straight to the next waiter, which keeps new
+    arrivals from overtaking callers already queued. A caller may take
+    several slots at once; it is admitted only when all of them are free,
+    and callers queued behind it wait their turn.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            limit: Number of slots
+
+        Raises:
+            ValueError: If the limit is not positive
+        """
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        self.limit = limit
+        self._active = 0
+        # Heap of (-priority, arrival, slots, future); abandoned entries are
+        # skipped
+        self._waiters: List[Tuple[int, int, int, "asyncio.Future[None]"]] = []
+        self._waiting = 0
+        self._arrivals = itertools.count()
+
+        # Statistics
+        self._admitted = 0
+        self._queued = 0
+        self._timeouts = 0
+        self._max_depth = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def active(self) -> int:
+        """Get the number of slots in use"""
+        return self._active
+
+    @property
+    def depth(self) -> int:
+        """Get the number of callers waiting for a slot"""
+        return self._waiting
+
+    async def acquire(
+        self, priority: int = 0, timeout: Optional[float] = None, count: int = 1
+    ) -> None:
+        """
+        Wait for a slot, or for ``count`` slots taken together.
+
+        Args:
+            priority: Callers with a higher priority are admitted first
+            timeout: Seconds to wait at most; waits indefinitely if omitted
+            count: Number of slots to take at once
+
+        Raises:
+            ValueError: If count is not between 1 and the limit
+            TimeoutError: If the slots did not become free in time
+        """
+        if not 0 < count <= self.limit:
+            raise ValueError(f"count must be between 1 and {self.limit}")
+        if self._active + count <= self.limit and not self._waiting:
+            self._active += count
+            self._admitted += 1
+            return
+
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._arrivals), count, future))
+        self._waiting += 1
+        self._queued += 1
+        self._max_depth = max(self._max_depth, self._waiting)
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except BaseException as e:
+            if future.done() and not future.cancelled():
+                # Admitted just as the wait ended; pass the slots on
+                self.release(count)
+            else:
+                future.cancel()
+                self._waiting -= 1
+                # Callers queued behind this one may fit now
+                self._wake()
+            if isinstance(e, asyncio.TimeoutError):
+                self._timeouts += 1
+                raise TimeoutError(
+                    f"No slot became free within {timeout} seconds"
+                ) from None
+            raise
+        finally:
+            waited = time.monotonic() - started
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        self._admitted += 1
+
+    def release(self, count: int = 1) -> None:
+        """Free ``count`` slots, handing them to the next waiters that fit"""
+        self._active -= count
+        self._wake()
+
+    def _wake(self) -> None:
+        """Admit waiters in order for as long as the first one fits"""
+        while self._waiters:
+            _, _, count, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._active + count > self.limit:
+                return
+            heapq.heappop(self._waiters)
+            self._active += count
+            self._waiting -= 1
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: int = 0, timeout: Optional[float] = None
+    ) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block; see ``acquire``"""
+        await self.acquire(priority, timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get queue depth and wait-time statistics"""
+        return {
+            "limit": self.limit,
+            "active": self._active,
+            "depth": self._waiting,
+            "max_depth": self._max_depth,
+            "admitted": self._admitted,
+            "queued": self._queued,
+            "timeouts": self._timeouts,
+            "total_wait_seconds": self._total_wait,
+            "max_wait_seconds": self._max_wait,
+            "mean_wait_seconds": (
+                self._total_wait / self._queued if self._queued else 0.0
+            ),
+        }
@@ -0,0 +1,170 @@
+"""
+Deadline tracking for MCP sessions.
+
+This module provides a hashed timer wheel that tracks the deadlines of many
+in-flight requests at once, so a session needs a single timer task rather
+than one timeout scope per request.
+"""
+
+import logging
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+# Resolution and size of a session's wheel: deadlines fire at most one tick
+# late, and a full turn of the wheel covers the default request timeout
+DEFAULT_TICK = 0.1  # seconds
+DEFAULT_SLOTS = 512
+
+
+class Deadline:
+    """A callback scheduled on a TimerWheel; cancel it once it is no longer needed"""
+
+    __slots__ = ("when", "callback", "_tick", "_wheel")
+
+    def __init__(
+        self, when: float, callback: Callable[[], Any], tick: int, wheel: "TimerWheel"
+    ) -> None:
+        self.when = when
+        self.callback = callback
+        self._tick = tick
+        self._wheel: Optional["TimerWheel"] = wheel
+
+    @property
+    def active(self) -> bool:
+        """Return True if the deadline has neither fired nor been cancelled"""
+        return self._wheel is not None
+
+    def cancel(self) -> bool:
+        """
+        Cancel the deadline.
+
+        Returns:
+            bool: True if it was still active
+        """
+        wheel = self._wheel
+        if wheel is None:
+            return False
+        wheel._remove(self)
+        return True
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel for session deadlines.
+
+    Deadlines are hashed into a ring of slots by the tick they expire in, so
+    scheduling and cancelling are O(1) and each tick only visits one slot.
+    Deadlines further away than a turn of the wheel stay in their slot and
+    are skipped until their turn comes, which keeps expiry O(1) amortized.
+
+    Callbacks are plain functions run by ``advance``; work that must await
+    should be handed to a task group from the callback.
+    """
+
+    def __init__(
+        self,
+        tick: float = DEFAULT_TICK,
+        slots: int = DEFAULT_SLOTS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the wheel.
+
+        Args:
+            tick: Resolution in seconds
+            slots: Number of slots in the ring
+            clock: Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If the resolution or the number of slots is not positive
+        """
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+        if slots <= 0:
+            raise ValueError("slots must be positive")
+        self.tick = tick
+        self._clock = clock
+        self._origin = clock()
+        # Deadlines keyed by identity, so removal from a slot is O(1)
+        self._slots: List[Dict[int, Deadline]] = [{} for _ in range(slots)]
+        self._current = 0  # last tick processed
+        self._count = 0
+        self._wakeup: Optional[anyio.Event] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def schedule(self, delay: float, callback: Callable[[], Any]) -> Deadline:
+        """
+        Run ``callback`` once ``delay`` seconds have passed.
+
+        Args:
+            delay: Seconds from now
+            callback: Function called without arguments when the deadline expires
+
+        Returns:
+            Deadline: Handle used to cancel the callback
+        """
+        when = self._clock() + max(delay, 0.0)
+        # Round up so a deadline never fires early; at least the next tick
+        tick = max(math.ceil((when - self._origin) / self.tick), self._current + 1)
+        deadline = Deadline(when, callback, tick, self)
+        self._slots[tick % len(self._slots)][id(deadline)] = deadline
+        self._count += 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return deadline
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """
+        Fire every deadline that has expired by ``now``.
+
+        Args:
+            now: Time to advance to; defaults to the clock's current time
+
+        Returns:
+            int: Number of callbacks run
+        """
+        if now is None:
+            now = self._clock()
+        target = math.floor((now - self._origin) / self.tick)
+        if target <= self._current:
+            return 0
+
+        # After a long stall, one pass over the ring visits every slot
+        ticks = range(max(self._current + 1, target - len(self._slots) + 1), target + 1)
+        self._current = target
+        fired = 0
+        for tick in ticks:
+            slot = self._slots[tick % len(self._slots)]
+            if not slot:
+                continue
+            expired = [d for d in slot.values() if d._tick <= target]
+            for deadline in expired:
+                self._remove(deadline)
+                try:
+                    deadline.callback()
+                except Exception:
+                    logger.error("Error in deadline callback", exc_info=True)
+                fired += 1
+        return fired
+
+    async def run(self) -> None:
+        """Advance the wheel every tick until cancelled, idling while it is empty"""
+        while True:
+            if not self._count:
+                self._wakeup = anyio.Event()
+                await self._wakeup.wait()
+                self._wakeup = None
+            await anyio.sleep(self.tick)
+            self.advance()
+
+    def _remove(self, deadline: Deadline) -> None:
+        del self._slots[deadline._tick % len(self._slots)][id(deadline)]
+        deadline._wheel = None
+        self._count -= 1
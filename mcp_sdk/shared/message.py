@@ -22,6 +22,7 @@ __all__ = [
     "ServerMessageMetadata",
     "MessageMetadata",
     "SessionMessage",
+    "SessionBatch",
 ]
 
 # Type aliases
@@ -90,6 +91,10 @@ class SessionMessage(Generic[T]):
 
     def __post_init__(self) -> None:
         """Validate the message and metadata after initialization."""
+        if isinstance(self.message, BaseModel):
+            # Parsed messages were already validated against the schema
+            return
+
         if not isinstance(self.message, dict):
             raise MessageValidationError("Message must be a dictionary")
 
@@ -127,3 +132,39 @@ class SessionMessage(Generic[T]):
             Dictionary representation of the message
         """
         return {"message": self.message, "metadata": self.metadata}
+
+
+@dataclass
+class SessionBatch:
+    """Several JSON-RPC messages framed together as a JSON-RPC 2.0 batch.
+
+    Transports write a batch as a single JSON array, so its messages share
+    one frame and one write. Responses in a batch may arrive in any order
+    and are correlated by ID like any other response.
+
+    Attributes:
+        messages: The JSON-RPC messages, in the order they were added
+        metadata: Optional metadata applying to every message in the batch
+    """
+
+    messages: list[JSONRPCMessage]
+    metadata: MessageMetadata = field(default_factory=lambda: None)
+
+    def __post_init__(self) -> None:
+        """Validate the batch after initialization."""
+        if not self.messages:
+            raise MessageValidationError("A batch must contain at least one message")
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def split(self) -> list[SessionMessage]:
+        """Unpack the batch into individual messages sharing its metadata.
+
+        Returns:
+            One SessionMessage per message in the batch
+        """
+        return [
+            SessionMessage(message=message, metadata=self.metadata)
+            for message in self.messages
+        ]
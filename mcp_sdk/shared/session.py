@@ -17,10 +17,14 @@ from typing import (
     Any,
     AsyncGenerator,
     Awaitable,
+    Collection,
     Dict,
     Generic,
     List,
     Optional,
+    Sequence,
+    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -32,14 +36,20 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from mcp_sdk.codec import JSONCodec, get_codec
+from mcp_sdk.exceptions import MCPConnectionError, MCPTimeoutError, MCPValidationError
+from mcp_sdk.shared.admission import AdmissionQueue
+from mcp_sdk.shared.deadlines import DEFAULT_TICK, Deadline, TimerWheel
 from mcp_sdk.shared.exceptions import McpError
 from mcp_sdk.shared.message import (
     MessageMetadata,
     ServerMessageMetadata,
+    SessionBatch,
     SessionMessage,
 )
 from mcp_sdk.types import (
     CancelledNotification,
+    CancelledNotificationParams,
     ClientNotification,
     ClientRequest,
     ClientResult,
@@ -49,6 +59,8 @@ from mcp_sdk.types import (
     JSONRPCNotification,
     JSONRPCRequest,
     JSONRPCResponse,
+    ProgressNotification,
+    ProgressParams,
     RequestParams,
     ServerNotification,
     ServerRequest,
@@ -78,6 +90,15 @@ class ConnectionState(Enum):
     ERROR = auto()
 
 
+class DispatchMode(Enum):
+    """How incoming requests are dispatched to their handlers."""
+
+    # Each request is handled before the next message is read
+    INLINE = auto()
+    # Each request is handled in its own task of the session's task group
+    CONCURRENT = auto()
+
+
 @dataclass
 class SessionMetrics:
     """Tracks metrics for the session."""
@@ -88,6 +109,10 @@ class SessionMetrics:
     request_errors: int = 0
     notifications_sent: int = 0
     notifications_received: int = 0
+    requests_received: int = 0
+    requests_active: int = 0
+    requests_timed_out: int = 0
+    requests_expired: int = 0
     bytes_sent: int = 0
     bytes_received: int = 0
     reconnection_attempts: int = 0
@@ -104,6 +129,10 @@ class SessionMetrics:
             "request_errors": self.request_errors,
             "notifications_sent": self.notifications_sent,
             "notifications_received": self.notifications_received,
+            "requests_received": self.requests_received,
+            "requests_active": self.requests_active,
+            "requests_timed_out": self.requests_timed_out,
+            "requests_expired": self.requests_expired,
             "bytes_sent": self.bytes_sent,
             "bytes_received": self.bytes_received,
             "reconnection_attempts": self.reconnection_attempts,
@@ -112,6 +141,15 @@ class SessionMetrics:
         }
 
 
+@dataclass
+class _BatchReply:
+    """Responses to an incoming batch, collected until every request is answered."""
+
+    waiting: Set[RequestId]
+    metadata: MessageMetadata = None
+    responses: List[JSONRPCMessage] = field(default_factory=list)
+
+
 class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
     """Handles responding to MCP requests and manages request lifecycle.
 
@@ -177,16 +215,18 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
         exc_type: type[BaseException] | None,
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
-    ) -> None:
+    ) -> Optional[bool]:
         """Exit the context manager, performing cleanup and notifying completion."""
+        self._entered = False
+        if not self._cancel_scope:
+            raise RuntimeError("No active cancel scope")
         try:
             if self._completed:
                 self._on_complete(self)
         finally:
-            self._entered = False
-            if not self._cancel_scope:
-                raise RuntimeError("No active cancel scope")
-            self._cancel_scope.__exit__(exc_type, exc_val, exc_tb)
+            # True when the scope swallowed the cancellation raised by cancel()
+            suppressed = self._cancel_scope.__exit__(exc_type, exc_val, exc_tb)
+        return suppressed
 
     async def respond(self, response: Union[SendResultT, ErrorData]) -> None:
         """
@@ -259,6 +299,16 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
             },
         )
 
+    @property
+    def completed(self) -> bool:
+        """
+        Return True once this request was responded to or cancelled.
+
+        Returns:
+            bool: True if no response may be sent for the request anymore
+        """
+        return self._completed
+
     @property
     def in_flight(self) -> bool:
         """
@@ -303,6 +353,8 @@ class BaseSession(
     - Automatic reconnection
     - Request/response tracking
     - Timeout handling
+    - Concurrent request dispatch
+    - JSON-RPC batches
     - Metrics collection
     - Thread-safe operations
     """
@@ -313,11 +365,14 @@ class BaseSession(
     DEFAULT_RECONNECT_DELAY = 1.0  # seconds
     DEFAULT_REQUEST_TIMEOUT = 30.0  # seconds
     DEFAULT_HEARTBEAT_INTERVAL = 30.0  # seconds
+    DEFAULT_MAX_CONCURRENT_REQUESTS = 32
 
     def __init__(
         self,
-        read_stream: MemoryObjectReceiveStream[Union[SessionMessage, Exception]],
-        write_stream: MemoryObjectSendStream[SessionMessage],
+        read_stream: MemoryObjectReceiveStream[
+            Union[SessionMessage, SessionBatch, Exception]
+        ],
+        write_stream: MemoryObjectSendStream[Union[SessionMessage, SessionBatch]],
         receive_request_type: Type[ReceiveRequestT],
         receive_notification_type: Type[ReceiveNotificationT],
         read_timeout_seconds: Optional[timedelta] = None,
@@ -326,6 +381,12 @@ class BaseSession(
         reconnect_delay: float = DEFAULT_RECONNECT_DELAY,
         request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
         heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+        codec: Optional[JSONCodec] = None,
+        dispatch_mode: DispatchMode = DispatchMode.CONCURRENT,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        method_concurrency: Optional[Dict[str, int]] = None,
+        ordered_methods: Collection[str] = (),
+        deadline_resolution: float = DEFAULT_TICK,
     ) -> None:
         """Initialize the session.
 
@@ -335,11 +396,24 @@ class BaseSession(
             receive_request_type: Type of requests this session can receive
             receive_notification_type: Type of notifications this session can receive
             read_timeout_seconds: Timeout for read operations
-            max_in_flight: Maximum number of in-flight requests
+            max_in_flight: Maximum number of outgoing requests awaiting a
+                response; further requests wait for a slot
             reconnect_attempts: Number of reconnection attempts before giving up
             reconnect_delay: Delay between reconnection attempts in seconds
             request_timeout: Default timeout for requests in seconds
             heartbeat_interval: Interval for heartbeat messages in seconds
+            codec: JSON codec used to encode messages; defaults to the fastest
+                installed backend
+            dispatch_mode: Whether incoming requests are handled inline, one
+                at a time, or concurrently in the session's task group
+            max_concurrent_requests: Maximum number of incoming requests
+                handled at once in concurrent mode
+            method_concurrency: Optional lower limits for specific methods,
+                keyed by method name
+            ordered_methods: Methods whose requests are handled one at a
+                time, in the order they arrive
+            deadline_resolution: Granularity in seconds of request deadlines;
+                expired requests are reaped at most this late
         """
         # Streams
         self._read_stream = read_stream
@@ -354,10 +428,27 @@ class BaseSession(
             read_timeout_seconds.total_seconds() if read_timeout_seconds else None
         )
         self._max_in_flight = max_in_flight
+        # Slots of outgoing requests; incoming ones are bounded by the
+        # dispatch limits below
+        self._outbound = AdmissionQueue(max_in_flight)
         self._reconnect_attempts = reconnect_attempts
         self._reconnect_delay = reconnect_delay
         self._default_request_timeout = request_timeout
         self._heartbeat_interval = heartbeat_interval
+        self._codec = codec or get_codec()
+
+        # Dispatch of incoming requests
+        if max_concurrent_requests <= 0:
+            raise ValueError("max_concurrent_requests must be positive")
+        self._dispatch_mode = dispatch_mode
+        self._request_limiter = anyio.Semaphore(max_concurrent_requests)
+        self._method_limiters: Dict[str, anyio.Semaphore] = {
+            method: anyio.Semaphore(limit)
+            for method, limit in (method_concurrency or {}).items()
+        }
+        self._ordered_methods = frozenset(ordered_methods)
+        # Completion event of the last request of each ordered method
+        self._ordered_tails: Dict[str, anyio.Event] = {}
 
         # State
         self._state = ConnectionState.DISCONNECTED
@@ -370,13 +461,22 @@ class BaseSession(
 
         # Request tracking
         self._request_id = 0
-        self._response_streams: Dict[
-            RequestId, MemoryObjectSendStream[Union[JSONRPCResponse, JSONRPCError]]
+        # Futures of the requests awaiting a response, completed directly by
+        # _handle_response
+        self._pending: Dict[
+            RequestId, "asyncio.Future[Union[JSONRPCResponse, JSONRPCError]]"
         ] = {}
         self._in_flight: Dict[
             RequestId, RequestResponder[ReceiveRequestT, SendResultT]
         ] = {}
 
+        # Deadlines of outgoing and incoming requests, fired by one task
+        self._deadlines = TimerWheel(tick=deadline_resolution)
+        self._inbound_deadlines: Dict[RequestId, Deadline] = {}
+
+        # Replies being collected for incoming batches, by request ID
+        self._batch_replies: Dict[RequestId, _BatchReply] = {}
+
         # Metrics
         self._metrics = SessionMetrics()
         self._metrics_lock = asyncio.Lock()
@@ -402,35 +502,41 @@ class BaseSession(
     @property
     def metrics(self) -> Dict[str, Any]:
         """Get a dictionary of current metrics."""
-        return self._metrics.to_dict()
+        metrics = self._metrics.to_dict()
+        metrics["outbound_queue"] = self._outbound.stats()
+        return metrics
 
     def _get_next_request_id(self) -> int:
-        """Generate the next request ID in a thread-safe manner."""
-        with anyio.Lock():
-            self._request_id += 1
-            return self._request_id
+        """Generate the next request ID; the event loop serializes callers."""
+        self._request_id += 1
+        return self._request_id
 
     async def _update_state(self, new_state: ConnectionState) -> None:
-        """Update the connection state and log the transition."""
-        async with self._state_lock:
-            if self._state == new_state:
-                return
+        """
+        Update the connection state and log the transition.
 
-            old_state = self._state
-            self._state = new_state
+        Callers that must check and change the state atomically hold
+        ``_state_lock`` around the call; it is not re-entrant, so it is not
+        taken here.
+        """
+        if self._state == new_state:
+            return
 
-            # Log state transition
-            self._logger.info(
-                f"Connection state changed: {old_state.name} -> {new_state.name}",
-                extra={"old_state": old_state.name, "new_state": new_state.name},
-            )
+        old_state = self._state
+        self._state = new_state
 
-            # Update metrics
-            if new_state == ConnectionState.CONNECTED:
-                async with self._metrics_lock:
-                    self._metrics.last_activity = datetime.utcnow()
-                    if old_state == ConnectionState.RECONNECTING:
-                        self._metrics.reconnection_attempts += 1
+        # Log state transition
+        self._logger.info(
+            f"Connection state changed: {old_state.name} -> {new_state.name}",
+            extra={"old_state": old_state.name, "new_state": new_state.name},
+        )
+
+        # Update metrics
+        if new_state == ConnectionState.CONNECTED:
+            async with self._metrics_lock:
+                self._metrics.last_activity = datetime.utcnow()
+                if old_state == ConnectionState.RECONNECTING:
+                    self._metrics.reconnection_attempts += 1
 
     async def _check_connection(self) -> bool:
         """Check if the connection is still alive."""
@@ -476,14 +582,8 @@ class BaseSession(
                         exc_info=True,
                     )
 
-            # Clear response streams
-            for stream in self._response_streams.values():
-                try:
-                    await stream.aclose()
-                except Exception as e:
-                    self._logger.warning("Error closing response stream", exc_info=True)
-
-            self._response_streams.clear()
+            # Fail requests still awaiting a response
+            self._fail_pending(error)
 
             # Start reconnection if needed
             if self._reconnect_attempts > 0:
@@ -534,15 +634,11 @@ class BaseSession(
         """Reset connection state."""
         # Clear any existing state
         self._in_flight.clear()
+        self._cancel_inbound_deadlines()
+        self._batch_replies.clear()
 
-        # Close any existing streams
-        for stream in self._response_streams.values():
-            try:
-                await stream.aclose()
-            except Exception as e:
-                self._logger.warning("Error closing stream during reset", exc_info=True)
-
-        self._response_streams.clear()
+        # Fail any requests still awaiting a response
+        self._fail_pending(ConnectionError("Connection was reset"))
 
     async def _initialize_connection(self) -> None:
         """Initialize a new connection."""
@@ -598,8 +694,9 @@ class BaseSession(
             await self._task_group.__aenter__()
 
             try:
-                # Start the receive loop
+                # Start the receive loop and the deadline timer
                 self._task_group.start_soon(self._receive_loop)
+                self._task_group.start_soon(self._deadlines.run)
 
                 # Start heartbeat if enabled
                 if self._heartbeat_interval > 0:
@@ -653,16 +750,13 @@ class BaseSession(
             self._task_group.cancel_scope.cancel()
             await self._task_group.__aexit__(exc_type, exc_val, exc_tb)
 
-        # Close all response streams
-        for stream in self._response_streams.values():
-            try:
-                await stream.aclose()
-            except Exception as e:
-                self._logger.warning("Error closing response stream", exc_info=True)
+        # Fail requests still awaiting a response
+        self._fail_pending(ConnectionError("Session was closed"))
 
         # Clean up state
-        self._response_streams.clear()
         self._in_flight.clear()
+        self._cancel_inbound_deadlines()
+        self._batch_replies.clear()
 
         # Update metrics
         async with self._metrics_lock:
@@ -680,22 +774,32 @@ class BaseSession(
         request_read_timeout_seconds: Optional[timedelta] = None,
         metadata: Optional[MessageMetadata] = None,
         timeout: Optional[float] = None,
+        priority: int = 0,
+        admission_timeout: Optional[float] = None,
     ) -> ReceiveResultT:
         """
         Sends a request and wait for a response.
 
+        Once ``max_in_flight`` requests await a response, further requests
+        wait for one of them to finish, higher priorities first and in
+        arrival order within a priority.
+
         Args:
             request: The request to send
             result_type: Expected result type for validation
             request_read_timeout_seconds: Timeout for this specific request
             metadata: Optional metadata for the request
             timeout: Timeout in seconds (overrides request_read_timeout_seconds)
+            priority: Admission priority while waiting for a free slot
+            admission_timeout: Seconds to wait for a free slot at most; waits
+                indefinitely if omitted
 
         Returns:
             The parsed response of type result_type
 
         Raises:
-            MCPTimeoutError: If the request times out
+            MCPTimeoutError: If the request times out or no slot became free
+                within admission_timeout
             MCPValidationError: If the request is invalid
             MCPConnectionError: If there's a connection issue
             McpError: For other JSON-RPC errors
@@ -706,13 +810,6 @@ class BaseSession(
                 f"Cannot send request: session is {self.state.name}"
             )
 
-        # Check in-flight limit
-        if len(self._in_flight) >= self._max_in_flight:
-            raise MCPConnectionError(
-                f"Too many in-flight requests (max {self._max_in_flight}). "
-                "Please wait for some requests to complete."
-            )
-
         # Determine timeout
         timeout_seconds = (
             timeout
@@ -737,19 +834,30 @@ class BaseSession(
             },
         )
 
-        # Create response stream
-        response_stream, response_stream_reader = anyio.create_memory_object_stream[
-            Union[JSONRPCResponse, JSONRPCError]
-        ](1)
+        # Register the future the response will complete
+        response_future: "asyncio.Future[Union[JSONRPCResponse, JSONRPCError]]" = (
+            asyncio.get_running_loop().create_future()
+        )
 
-        # Update metrics
-        async with self._metrics_lock:
-            self._metrics.requests_sent += 1
-            self._metrics.last_activity = datetime.utcnow()
+        # Wait for a free slot among the outgoing requests
+        try:
+            await self._outbound.acquire(priority, admission_timeout)
+        except TimeoutError:
+            async with self._metrics_lock:
+                self._metrics.request_errors += 1
+            raise MCPTimeoutError(
+                f"No request slot became free within {admission_timeout} seconds "
+                f"({self._max_in_flight} requests in flight)"
+            )
 
         try:
-            # Store response stream before sending request
-            self._response_streams[request_id] = response_stream
+            # Update metrics
+            async with self._metrics_lock:
+                self._metrics.requests_sent += 1
+                self._metrics.last_activity = datetime.utcnow()
+
+            # Store the future before sending the request
+            self._pending[request_id] = response_future
 
             # Prepare and send JSON-RPC request
             jsonrpc_request = JSONRPCRequest(
@@ -766,43 +874,21 @@ class BaseSession(
                 )
             )
 
-            # Wait for response with timeout
+            # Wait for the response; the session's timer wheel fails the
+            # future with TimeoutError once the deadline passes
+            deadline = self._deadlines.schedule(
+                timeout_seconds,
+                lambda: self._expire_outbound(request_id, response_future),
+            )
             try:
-                with anyio.fail_after(timeout_seconds):
-                    response_or_error = await response_stream_reader.receive()
+                response_or_error = await response_future
 
-                    # Update metrics
-                    async with self._metrics_lock:
-                        self._metrics.requests_completed += 1
-                        self._metrics.last_activity = datetime.utcnow()
-
-                    if isinstance(response_or_error, JSONRPCError):
-                        self._logger.warning(
-                            "Received error response",
-                            extra={
-                                "request_id": request_id,
-                                "error_code": response_or_error.error.code,
-                                "error_message": response_or_error.error.message,
-                            },
-                        )
-                        raise McpError(response_or_error.error)
+                # Update metrics
+                async with self._metrics_lock:
+                    self._metrics.requests_completed += 1
+                    self._metrics.last_activity = datetime.utcnow()
 
-                    # Validate response type
-                    try:
-                        return result_type.model_validate(response_or_error.result)
-                    except Exception as e:
-                        self._logger.error(
-                            "Response validation failed",
-                            extra={
-                                "request_id": request_id,
-                                "error": str(e),
-                                "expected_type": result_type.__name__,
-                            },
-                            exc_info=True,
-                        )
-                        raise MCPValidationError(
-                            f"Invalid response format: {str(e)}"
-                        ) from e
+                return self._parse_response(request_id, response_or_error, result_type)
 
             except TimeoutError:
                 self._logger.warning(
@@ -818,6 +904,8 @@ class BaseSession(
                 raise MCPTimeoutError(
                     f"Request {request_id} timed out after {timeout_seconds} seconds"
                 )
+            finally:
+                deadline.cancel()
 
         except Exception as e:
             # Handle connection errors
@@ -840,9 +928,47 @@ class BaseSession(
 
         finally:
             # Clean up resources
-            self._response_streams.pop(request_id, None)
-            await response_stream.aclose()
-            await response_stream_reader.aclose()
+            self._pending.pop(request_id, None)
+            self._outbound.release()
+
+    def _parse_response(
+        self,
+        request_id: RequestId,
+        response_or_error: Union[JSONRPCResponse, JSONRPCError],
+        result_type: Type[ReceiveResultT],
+    ) -> ReceiveResultT:
+        """
+        Turn the response to a request into its result.
+
+        Raises:
+            McpError: If the peer answered with an error
+            MCPValidationError: If the result is not of the expected type
+        """
+        if isinstance(response_or_error, JSONRPCError):
+            self._logger.warning(
+                "Received error response",
+                extra={
+                    "request_id": request_id,
+                    "error_code": response_or_error.error.code,
+                    "error_message": response_or_error.error.message,
+                },
+            )
+            raise McpError(response_or_error.error)
+
+        # Validate response type
+        try:
+            return result_type.model_validate(response_or_error.result)
+        except Exception as e:
+            self._logger.error(
+                "Response validation failed",
+                extra={
+                    "request_id": request_id,
+                    "error": str(e),
+                    "expected_type": result_type.__name__,
+                },
+                exc_info=True,
+            )
+            raise MCPValidationError(f"Invalid response format: {str(e)}") from e
 
     async def send_notification(
         self,
@@ -914,12 +1040,211 @@ class BaseSession(
 
             raise MCPConnectionError(f"Failed to send notification: {str(e)}") from e
 
-    async def _send_message(self, message: SessionMessage) -> None:
+    async def send_batch(
+        self,
+        requests: Sequence[Tuple[SendRequestT, Type[BaseModel]]],
+        notifications: Sequence[SendNotificationT] = (),
+        metadata: Optional[MessageMetadata] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Union[BaseModel, Exception]]:
         """
-        Send a message through the write stream.
+        Send several requests and notifications as one JSON-RPC batch.
+
+        The batch is framed and written once. Each response is correlated on
+        its own, so one failed or late request does not affect the others.
+
+        Every request holds one of the ``max_in_flight`` slots until it is
+        answered, and a batch waits until all of its slots are free at once,
+        so concurrent batches never hold part of their slots while waiting
+        for the rest. A batch with more requests than ``max_in_flight`` is
+        sent as consecutive batches of at most that many requests, each once
+        the previous one is answered; the notifications go with the first.
 
         Args:
-            message: The message to send
+            requests: Requests to send, each with its expected result type
+            notifications: Notifications to send along with the requests
+            metadata: Optional metadata for the batch
+            timeout: Timeout in seconds for each request
+
+        Returns:
+            The result of each request in order, or the exception it failed
+            with: McpError, MCPTimeoutError, MCPValidationError or
+            MCPConnectionError
+
+        Raises:
+            ValueError: If the batch is empty
+            MCPConnectionError: If the session is not connected or the batch
+                could not be sent
+        """
+        if self.state != ConnectionState.CONNECTED:
+            raise MCPConnectionError(f"Cannot send batch: session is {self.state.name}")
+        if not requests and not notifications:
+            raise ValueError("A batch must contain at least one message")
+
+        timeout_seconds = timeout or self._default_request_timeout
+        if not requests:
+            return await self._send_batch_frame(
+                (), notifications, metadata, timeout_seconds
+            )
+
+        results: List[Union[BaseModel, Exception]] = []
+        for start in range(0, len(requests), self._max_in_flight):
+            results.extend(
+                await self._send_batch_frame(
+                    requests[start : start + self._max_in_flight],
+                    notifications if not start else (),
+                    metadata,
+                    timeout_seconds,
+                )
+            )
+        return results
+
+    async def _send_batch_frame(
+        self,
+        requests: Sequence[Tuple[SendRequestT, Type[BaseModel]]],
+        notifications: Sequence[SendNotificationT],
+        metadata: Optional[MessageMetadata],
+        timeout_seconds: float,
+    ) -> List[Union[BaseModel, Exception]]:
+        """Send one batch of at most max_in_flight requests; see send_batch"""
+        loop = asyncio.get_running_loop()
+        entries: List[
+            Tuple[
+                RequestId,
+                "asyncio.Future[Union[JSONRPCResponse, JSONRPCError]]",
+                Type[BaseModel],
+            ]
+        ] = []
+        deadlines: List[Deadline] = []
+        admitted = 0
+        try:
+            # Every request in the batch holds a slot until it is answered;
+            # all of them are taken together
+            if requests:
+                await self._outbound.acquire(count=len(requests))
+                admitted = len(requests)
+
+            messages: List[JSONRPCMessage] = []
+            for request, result_type in requests:
+                request_id = self._get_next_request_id()
+                future: "asyncio.Future[Union[JSONRPCResponse, JSONRPCError]]" = (
+                    loop.create_future()
+                )
+                self._pending[request_id] = future
+                entries.append((request_id, future, result_type))
+                messages.append(
+                    JSONRPCMessage(
+                        JSONRPCRequest(
+                            jsonrpc="2.0",
+                            id=request_id,
+                            **request.model_dump(
+                                by_alias=True, mode="json", exclude_none=True
+                            ),
+                        )
+                    )
+                )
+            for notification in notifications:
+                messages.append(
+                    JSONRPCMessage(
+                        JSONRPCNotification(
+                            jsonrpc="2.0",
+                            **notification.model_dump(
+                                by_alias=True, mode="json", exclude_none=True
+                            ),
+                        )
+                    )
+                )
+
+            async with self._metrics_lock:
+                self._metrics.requests_sent += len(requests)
+                self._metrics.notifications_sent += len(notifications)
+                self._metrics.last_activity = datetime.utcnow()
+
+            self._logger.debug(
+                "Sending batch",
+                extra={
+                    "requests": len(requests),
+                    "notifications": len(notifications),
+                    "timeout": timeout_seconds,
+                },
+            )
+            await self._send_message(
+                SessionBatch(messages=messages, metadata=metadata or {})
+            )
+
+            for request_id, future, _ in entries:
+                deadlines.append(
+                    self._deadlines.schedule(
+                        timeout_seconds,
+                        lambda request_id=request_id, future=future: (
+                            self._expire_outbound(request_id, future)
+                        ),
+                    )
+                )
+
+            results: List[Union[BaseModel, Exception]] = []
+            for request_id, future, result_type in entries:
+                try:
+                    response_or_error = await future
+                    async with self._metrics_lock:
+                        self._metrics.requests_completed += 1
+                    results.append(
+                        self._parse_response(request_id, response_or_error, result_type)
+                    )
+                except TimeoutError:
+                    results.append(
+                        MCPTimeoutError(
+                            f"Request {request_id} timed out after "
+                            f"{timeout_seconds} seconds"
+                        )
+                    )
+                except (McpError, MCPValidationError) as e:
+                    results.append(e)
+                except Exception as e:
+                    # The connection failed while the request was pending
+                    results.append(
+                        MCPConnectionError(f"Failed to send request: {str(e)}")
+                    )
+            return results
+
+        finally:
+            for deadline in deadlines:
+                deadline.cancel()
+            for request_id, _, _ in entries:
+                self._pending.pop(request_id, None)
+            if admitted:
+                self._outbound.release(admitted)
+
+    def encode_message(self, message: Union[SessionMessage, SessionBatch]) -> bytes:
+        """
+        Encode a message's JSON-RPC payload for the wire.
+
+        The payload is serialized straight to bytes, without building an
+        intermediate dict. A batch is encoded as one JSON array.
+
+        Args:
+            message: The message or batch to encode
+
+        Returns:
+            bytes: The JSON-encoded message
+        """
+        if isinstance(message, SessionBatch):
+            return (
+                b"["
+                + b",".join(
+                    self._codec.dump_model(item, by_alias=True, exclude_none=True)
+                    for item in message.messages
+                )
+                + b"]"
+            )
+        return self._codec.dump_model(message.message, by_alias=True, exclude_none=True)
+
+    async def _send_message(self, message: Union[SessionMessage, SessionBatch]) -> None:
+        """
+        Send a message or batch through the write stream.
+
+        Args:
+            message: The message or batch to send
 
         Raises:
             MCPConnectionError: If there's an error sending the message
@@ -976,7 +1301,19 @@ class BaseSession(
                     message=JSONRPCMessage(jsonrpc_response)
                 )
 
-            await self._send_message(session_message)
+            # Responses to an incoming batch are sent together once all of
+            # its requests are answered
+            reply = self._batch_replies.pop(request_id, None)
+            if reply is not None:
+                reply.responses.append(session_message.message)
+                reply.waiting.discard(request_id)
+                if reply.waiting:
+                    return
+                await self._send_message(
+                    SessionBatch(messages=reply.responses, metadata=reply.metadata)
+                )
+            else:
+                await self._send_message(session_message)
 
             self._logger.debug(
                 "Sent response",
@@ -1000,7 +1337,7 @@ class BaseSession(
 
         while self.state != ConnectionState.DISCONNECTED:
             try:
-                async with anyio.fail_after(
+                with anyio.fail_after(
                     self._session_read_timeout_seconds
                     if self._session_read_timeout_seconds
                     else None
@@ -1019,22 +1356,15 @@ class BaseSession(
                         await self._handle_connection_error(message)
                         continue
 
+                    if isinstance(message, SessionBatch):
+                        await self._handle_batch(message)
+                        continue
+
                     if not isinstance(message, SessionMessage) or not message.message:
                         self._logger.warning("Received invalid message format")
                         continue
 
-                    # Update metrics
-                    if isinstance(message.message.root, JSONRPCNotification):
-                        async with self._metrics_lock:
-                            self._metrics.notifications_received += 1
-
-                    # Handle different message types
-                    if isinstance(message.message.root, JSONRPCRequest):
-                        await self._handle_incoming_request(message)
-                    elif isinstance(message.message.root, JSONRPCNotification):
-                        await self._handle_notification(message)
-                    else:  # Response or error
-                        await self._handle_response(message)
+                    await self._route_message(message)
 
             except TimeoutError:
                 # Handle read timeout
@@ -1050,6 +1380,134 @@ class BaseSession(
 
         self._logger.info("Receive loop exiting")
 
+    async def _route_message(self, message: SessionMessage) -> None:
+        """Hand an incoming message to the handler for its type."""
+        # Update metrics
+        if isinstance(message.message.root, JSONRPCNotification):
+            async with self._metrics_lock:
+                self._metrics.notifications_received += 1
+
+        # Handle different message types
+        if isinstance(message.message.root, JSONRPCRequest):
+            await self._dispatch_request(message)
+        elif isinstance(message.message.root, JSONRPCNotification):
+            await self._handle_notification(message)
+        else:  # Response or error
+            await self._handle_response(message)
+
+    async def _handle_batch(self, batch: SessionBatch) -> None:
+        """
+        Handle an incoming JSON-RPC batch.
+
+        Each message is routed like a message received on its own, so the
+        requests are dispatched concurrently. Their responses are collected
+        and sent back as a single batch; a batch without requests gets no
+        reply.
+        """
+        messages = batch.split()
+        request_ids = {
+            message.message.root.id
+            for message in messages
+            if isinstance(message.message.root, JSONRPCRequest)
+        }
+        if request_ids:
+            reply = _BatchReply(waiting=set(request_ids), metadata=batch.metadata)
+            for request_id in request_ids:
+                self._batch_replies[request_id] = reply
+
+        for message in messages:
+            await self._route_message(message)
+
+    async def _drop_batch_response(self, request_id: RequestId) -> None:
+        """Stop waiting for a batch request that ended without a response."""
+        reply = self._batch_replies.pop(request_id, None)
+        if reply is None:
+            return
+        reply.waiting.discard(request_id)
+        if not reply.waiting and reply.responses:
+            try:
+                await self._send_message(
+                    SessionBatch(messages=reply.responses, metadata=reply.metadata)
+                )
+            except Exception:
+                self._logger.warning(
+                    "Failed to send batch response",
+                    extra={"request_id": request_id},
+                    exc_info=True,
+                )
+
+    async def _dispatch_request(self, message: SessionMessage) -> None:
+        """
+        Hand an incoming request to its handler according to the dispatch mode.
+
+        In concurrent mode the request is spawned into the session's task
+        group and the receive loop goes straight back to reading, so a slow
+        handler neither delays other requests nor the delivery of responses.
+        """
+        async with self._metrics_lock:
+            self._metrics.requests_received += 1
+
+        if self._dispatch_mode == DispatchMode.INLINE:
+            await self._handle_incoming_request(message)
+            return
+
+        method = message.message.root.method
+        previous: Optional[anyio.Event] = None
+        done: Optional[anyio.Event] = None
+        if method in self._ordered_methods:
+            # Chain the request behind the last one of its method
+            previous = self._ordered_tails.get(method)
+            done = anyio.Event()
+            self._ordered_tails[method] = done
+
+        self._task_group.start_soon(self._run_request, message, previous, done)
+
+    async def _run_request(
+        self,
+        message: SessionMessage,
+        previous: Optional[anyio.Event],
+        done: Optional[anyio.Event],
+    ) -> None:
+        """
+        Handle a dispatched request once its limits and ordering allow.
+
+        Args:
+            message: The request message
+            previous: Completion event of the request it must follow, if any
+            done: Event to set when this request is finished, if it is ordered
+        """
+        method = message.message.root.method
+        try:
+            if previous is not None:
+                await previous.wait()
+
+            async with AsyncExitStack() as limits:
+                method_limiter = self._method_limiters.get(method)
+                if method_limiter is not None:
+                    await limits.enter_async_context(method_limiter)
+                await limits.enter_async_context(self._request_limiter)
+
+                self._metrics.requests_active += 1
+                try:
+                    await self._handle_incoming_request(message)
+                finally:
+                    self._metrics.requests_active -= 1
+        except Exception as e:
+            # Escaping the task group would tear down the whole session
+            self._logger.error(
+                "Error handling request",
+                extra={"request_id": message.message.root.id},
+                exc_info=True,
+            )
+            async with self._metrics_lock:
+                self._metrics.request_errors += 1
+                self._metrics.last_error = e
+        finally:
+            if done is not None:
+                done.set()
+                if self._ordered_tails.get(method) is done:
+                    del self._ordered_tails[method]
+
     async def _handle_incoming_request(self, message: SessionMessage) -> None:
         """Handle an incoming request message."""
         try:
@@ -1069,17 +1527,26 @@ class BaseSession(
                 ),
                 request=validated_request,
                 session=self,
-                on_complete=lambda r: self._in_flight.pop(r.request_id, None),
+                on_complete=self._request_completed,
                 timeout=self._default_request_timeout,
             )
 
-            # Track in-flight request
+            # Track in-flight request and reap it once its deadline passes
             self._in_flight[responder.request_id] = responder
+            if self._default_request_timeout:
+                self._inbound_deadlines[responder.request_id] = (
+                    self._deadlines.schedule(
+                        self._default_request_timeout,
+                        lambda: self._task_group.start_soon(
+                            self._expire_inbound, responder
+                        ),
+                    )
+                )
 
             # Process the request
             await self._received_request(responder)
 
-            if not responder._completed:  # type: ignore[reportPrivateUsage]
+            if not responder.completed:
                 await self._handle_incoming(responder)
 
         except Exception as e:
@@ -1098,6 +1565,94 @@ class BaseSession(
                     ),
                 )
 
+    def _request_completed(
+        self, responder: RequestResponder[ReceiveRequestT, SendResultT]
+    ) -> None:
+        """Stop tracking a finished incoming request and drop its deadline."""
+        self._in_flight.pop(responder.request_id, None)
+        deadline = self._inbound_deadlines.pop(responder.request_id, None)
+        if deadline is not None:
+            deadline.cancel()
+        if responder.request_id in self._batch_replies:
+            # Cancelled without a response; don't hold up the rest of its batch
+            self._task_group.start_soon(self._drop_batch_response, responder.request_id)
+
+    async def _expire_inbound(
+        self, responder: RequestResponder[ReceiveRequestT, SendResultT]
+    ) -> None:
+        """
+        Cancel an incoming request that outlived its deadline.
+
+        The handler is cancelled and the peer receives a timeout error, so
+        the request's resources are freed even if the handler never returns.
+        """
+        self._inbound_deadlines.pop(responder.request_id, None)
+        if responder.completed:
+            return
+
+        self._logger.warning(
+            "Incoming request expired",
+            extra={
+                "request_id": responder.request_id,
+                "timeout_seconds": self._default_request_timeout,
+            },
+        )
+        await responder.cancel()
+        self._metrics.requests_expired += 1
+        try:
+            await self._send_response(
+                responder.request_id,
+                ErrorData(
+                    code=httpx.codes.REQUEST_TIMEOUT,
+                    message=(
+                        f"Request {responder.request_id} timed out after "
+                        f"{self._default_request_timeout} seconds"
+                    ),
+                ),
+            )
+        except Exception:
+            # Already logged by _send_response
+            pass
+
+    def _expire_outbound(
+        self,
+        request_id: RequestId,
+        future: "asyncio.Future[Union[JSONRPCResponse, JSONRPCError]]",
+    ) -> None:
+        """Fail a request whose response is overdue and tell the peer to drop it."""
+        self._pending.pop(request_id, None)
+        if future.done():
+            return
+        future.set_exception(TimeoutError())
+        self._metrics.requests_timed_out += 1
+        self._task_group.start_soon(
+            self._send_cancellation, request_id, "Request timed out"
+        )
+
+    async def _send_cancellation(self, request_id: RequestId, reason: str) -> None:
+        """Notify the peer that a request it received is no longer wanted."""
+        try:
+            await self.send_notification(
+                CancelledNotification(  # type: ignore[arg-type]
+                    method="notifications/cancelled",
+                    params=CancelledNotificationParams(
+                        requestId=request_id, reason=reason
+                    ),
+                )
+            )
+        except Exception:
+            self._logger.warning(
+                "Failed to send cancellation",
+                extra={"request_id": request_id},
+                exc_info=True,
+            )
+
+    def _cancel_inbound_deadlines(self) -> None:
+        """Drop the deadlines of all incoming requests."""
+        for deadline in self._inbound_deadlines.values():
+            deadline.cancel()
+        self._inbound_deadlines.clear()
+
     async def _handle_notification(self, message: SessionMessage) -> None:
         """Handle an incoming notification message."""
         try:
@@ -1125,16 +1680,11 @@ class BaseSession(
 
     async def _handle_response(self, message: SessionMessage) -> None:
         """Handle an incoming response or error message."""
-        stream = self._response_streams.pop(message.message.root.id, None)
-        if stream:
-            try:
-                await stream.send(message.message.root)
-            except Exception as e:
-                self._logger.error(
-                    "Error sending response to stream",
-                    extra={"request_id": message.message.root.id},
-                    exc_info=True,
-                )
+        future = self._pending.pop(message.message.root.id, None)
+        if future is not None:
+            # The request may have timed out or been cancelled meanwhile
+            if not future.done():
+                future.set_result(message.message.root)
         else:
             self._logger.warning(
                 "Received response for unknown request",
@@ -1146,6 +1696,14 @@ class BaseSession(
                 )
             )
 
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every request awaiting a response with the given error."""
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
+
     async def _received_request(
         self, responder: RequestResponder[ReceiveRequestT, SendResultT]
     ) -> None:
@@ -1197,12 +1755,13 @@ class BaseSession(
             )
 
         try:
-            notification = ProgressNotification(
+            notification = ProgressNotification(  # type: ignore[arg-type]
+                method="notifications/progress",
                 params=ProgressParams(
-                    token=progress_token,
-                    value=progress,
+                    progressToken=progress_token,
+                    progress=progress,
                     total=total,
-                )
+                ),
             )
 
             await self.send_notification(notification)
@@ -6,10 +6,16 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.25.1",
+        "httpx>=0.23.0",
         "pydantic>=1.8.2",
         "rich>=10.0.0",
         "pyyaml>=5.4.1",
     ],
+    extras_require={
+        "http2": ["httpx[http2]>=0.23.0"],
+        "fast-json": ["orjson>=3.6.0"],
+        "zstd": ["zstandard>=0.18.0"],
+    },
     entry_points={
         "console_scripts": [
             "mcp=mcp_sdk.cli:main",
@@ -10,6 +10,10 @@ from mcp_sdk.models import ClientInfo, ClientConfig
 from mcp_sdk.server import MCPServer, ServerConfig
 from mcp_sdk.config import MCPConfig
 
+def pytest_configure(config):
+    """Register the markers used by the test suite."""
+    config.addinivalue_line("markers", "performance: load and throughput benchmarks")
+
 @pytest.fixture
 def mock_response():
     """Create a mock HTTP response."""
@@ -80,3 +84,33 @@ def test_client(test_server):
     """Create a test client for FastAPI."""
     with TestClient(test_server.app) as client:
         yield client
+
+@pytest.fixture
+def make_commit_data():
+    """Create a factory for raw commit payloads."""
+    def _make(sha="a" * 40, patch="@@ -1 +1 @@\n-old\n+new"):
+        author = {
+            "name": "Test Author",
+            "email": "author@example.com",
+            "date": "2024-01-01T00:00:00"
+        }
+        commit_file = {
+            "filename": "README.md",
+            "status": "modified",
+            "additions": 1,
+            "deletions": 1,
+            "changes": 2,
+            "patch": patch
+        }
+        return {
+            "sha": sha,
+            "message": f"Commit {sha[:7]}",
+            "author": author,
+            "committer": author,
+            "url": f"https://api.example.com/commits/{sha}",
+            "html_url": f"https://example.com/commits/{sha}",
+            "stats": {"total": 2, "additions": 1, "deletions": 1, "files": [commit_file]},
+            "files": [commit_file],
+            "parents": []
+        }
+    return _make
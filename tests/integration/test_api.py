@@ -193,3 +193,98 @@ class TestAPI:
         assert response.status_code == 200
         # Verify the server echoes back the request ID or provides its own
         assert "x-request-id" in [h.lower() for h in response.headers.keys()]
+
+    def test_batch_endpoint(self, api_client):
+        """Test the /api/v1/process:batch endpoint."""
+        valid = {
+            "model": "text:gpt-4",
+            "context": "hello",
+            "settings": {"temperature": 0.7, "max_tokens": 100},
+            "metadata": {"language": "en"}
+        }
+        unsupported = dict(valid, model="unsupported-model")
+
+        response = api_client.post(
+            "/api/v1/process:batch",
+            json={"requests": [valid, unsupported, dict(valid, context="world")]}
+        )
+
+        assert response.status_code == 200
+        items = response.json()["responses"]
+        assert [item["index"] for item in items] == [0, 1, 2]
+        assert items[0]["status_code"] == 200
+        assert "HELLO" in items[0]["response"]["content"]
+        assert items[1]["status_code"] == 400
+        assert items[1]["response"] is None
+        assert "Unsupported model type" in items[1]["error"]
+        assert "WORLD" in items[2]["response"]["content"]
+
+    def test_batch_endpoint_size_limit(self, api_client):
+        """Test that oversized batches are rejected."""
+        request = {
+            "model": "text:gpt-4",
+            "context": "hello",
+            "settings": {"temperature": 0.7, "max_tokens": 100},
+            "metadata": {}
+        }
+        response = api_client.post(
+            "/api/v1/process:batch",
+            json={"requests": [request] * 101}
+        )
+
+        assert response.status_code == 413
+
+    def test_stream_endpoint_ndjson(self, api_client):
+        """Test streaming partial results as newline-delimited JSON."""
+        response = api_client.post(
+            "/api/v1/process:stream",
+            json={
+                "model": "text:gpt-4",
+                "context": "hello streaming world",
+                "settings": {"temperature": 0.7, "max_tokens": 100},
+                "metadata": {"language": "en"}
+            }
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        chunks = [json.loads(line) for line in response.text.splitlines() if line]
+        assert [chunk["index"] for chunk in chunks] == [0, 1, 2, 3]
+        assert "".join(chunk["content"] for chunk in chunks) == "HELLO STREAMING WORLD"
+        assert chunks[-1]["done"] is True
+        assert not any(chunk["done"] for chunk in chunks[:-1])
+
+    def test_stream_endpoint_sse(self, api_client):
+        """Test streaming partial results as Server-Sent Events."""
+        response = api_client.post(
+            "/api/v1/process:stream",
+            headers={"Accept": "text/event-stream"},
+            json={
+                "model": "text:gpt-4",
+                "context": "hi there",
+                "settings": {"temperature": 0.7, "max_tokens": 100},
+                "metadata": {"language": "en"}
+            }
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [block for block in response.text.split("\n\n") if block]
+        assert all(event.startswith("data: ") for event in events)
+        chunks = [json.loads(event[len("data: "):]) for event in events]
+        assert "".join(chunk["content"] for chunk in chunks) == "HI THERE"
+        assert chunks[-1]["done"] is True
+
+    def test_stream_endpoint_unsupported_model(self, api_client):
+        """Test that invalid requests fail before the stream starts."""
+        response = api_client.post(
+            "/api/v1/process:stream",
+            json={
+                "model": "unsupported-model",
+                "context": "hi",
+                "settings": {"temperature": 0.7, "max_tokens": 100},
+                "metadata": {}
+            }
+        )
+
+        assert response.status_code == 400
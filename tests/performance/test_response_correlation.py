@@ -0,0 +1,146 @@
+import time
+
+import anyio
+import pytest
+
+from tests.utils import mcp_types
+
+mcp_types.install()
+
+from mcp_sdk.shared.message import SessionMessage
+from mcp_sdk.shared.session import BaseSession
+from mcp_sdk.types import (
+    CallToolRequest,
+    ClientNotification,
+    ClientRequest,
+    EmptyResult,
+    JSONRPCMessage,
+    JSONRPCRequest,
+    RequestParams,
+    ServerNotification,
+    ServerRequest,
+    ServerResult,
+)
+
+# Compares the two ways BaseSession hands a response to the request waiting
+# for it, over the in-memory transport: the table of futures the session uses
+# now, and a memory object stream pair per request, as it did before. Both
+# run the real session's receive loop against the same echoing peer. The
+# stream variant only keeps the correlation part of send_request and skips
+# admission and metrics, so it is the cheaper of the two everywhere else.
+
+REQUESTS = 2000
+CONCURRENCY = 50
+
+
+class _Echo(BaseSession):
+    """Peer answering every request with an empty result."""
+
+    def __init__(self, read_stream, write_stream):
+        super().__init__(
+            read_stream,
+            write_stream,
+            ClientRequest,
+            ClientNotification,
+            heartbeat_interval=0,
+            reconnect_attempts=0,
+            max_concurrent_requests=CONCURRENCY,
+        )
+
+    async def _received_request(self, responder):
+        with responder:
+            await responder.respond(ServerResult(EmptyResult()))
+
+
+class _Client(BaseSession):
+    """Client correlating responses through the session's futures table."""
+
+    def __init__(self, read_stream, write_stream):
+        super().__init__(
+            read_stream,
+            write_stream,
+            ServerRequest,
+            ServerNotification,
+            heartbeat_interval=0,
+            reconnect_attempts=0,
+            max_in_flight=CONCURRENCY,
+        )
+
+
+class _StreamClient(_Client):
+    """Client correlating responses through a memory stream pair per request."""
+
+    def __init__(self, read_stream, write_stream):
+        super().__init__(read_stream, write_stream)
+        self._response_streams = {}
+
+    async def send_request(self, request, result_type, metadata=None):
+        request_id = self._get_next_request_id()
+        writer, reader = anyio.create_memory_object_stream(1)
+        self._response_streams[request_id] = writer
+        try:
+            await self._send_message(
+                SessionMessage(
+                    message=JSONRPCMessage(
+                        JSONRPCRequest(
+                            jsonrpc="2.0",
+                            id=request_id,
+                            **request.model_dump(
+                                by_alias=True, mode="json", exclude_none=True
+                            ),
+                        )
+                    ),
+                    metadata=metadata or {},
+                )
+            )
+            response = await reader.receive()
+            return self._parse_response(request_id, response, result_type)
+        finally:
+            self._response_streams.pop(request_id, None)
+            await writer.aclose()
+            await reader.aclose()
+
+    async def _handle_response(self, message):
+        stream = self._response_streams.pop(message.message.root.id, None)
+        if stream is not None:
+            await stream.send(message.message.root)
+
+
+async def _run(client_type):
+    """Send REQUESTS requests to an echoing peer, CONCURRENCY at a time."""
+    client_send, peer_read = anyio.create_memory_object_stream(CONCURRENCY)
+    peer_send, client_read = anyio.create_memory_object_stream(CONCURRENCY)
+    results = []
+
+    async def worker(client, start):
+        for n in range(start, REQUESTS, CONCURRENCY):
+            request = ClientRequest(
+                CallToolRequest(method="tools/call", params=RequestParams(n=n))
+            )
+            results.append(await client.send_request(request, EmptyResult))
+
+    async with _Echo(peer_read, peer_send), client_type(
+        client_read, client_send
+    ) as client:
+        started = time.perf_counter()
+        with anyio.fail_after(60):
+            async with anyio.create_task_group() as tg:
+                for start in range(CONCURRENCY):
+                    tg.start_soon(worker, client, start)
+        elapsed = time.perf_counter() - started
+
+    assert len(results) == REQUESTS
+    return elapsed
+
+
+class TestResponseCorrelation:
+    """Benchmark of response correlation in BaseSession.send_request."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_correlation_throughput(self, record_property):
+        """Measure requests per second with a futures table and with a stream per request."""
+        # Warm up both paths, then keep the best of a few runs
+        for name, client_type in (("futures", _Client), ("streams", _StreamClient)):
+            elapsed = min([await _run(client_type) for _ in range(3)])
+            record_property(f"{name}_requests_per_second", round(REQUESTS / elapsed))
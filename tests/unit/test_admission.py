@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from mcp_sdk.shared.admission import AdmissionQueue
+
+class TestAdmissionQueue:
+    """Tests for the session admission queue."""
+
+    @pytest.mark.asyncio
+    async def test_waits_instead_of_failing(self):
+        """Test that callers over the limit wait until a slot is released."""
+        queue = AdmissionQueue(2)
+        await queue.acquire()
+        await queue.acquire()
+
+        waiter = asyncio.ensure_future(queue.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done() and queue.depth == 1
+
+        queue.release()
+        await waiter
+        assert (queue.active, queue.depth) == (2, 0)
+
+    @pytest.mark.asyncio
+    async def test_priority_then_fifo(self):
+        """Test that waiters are admitted by priority, then in arrival order."""
+        queue = AdmissionQueue(1)
+        await queue.acquire()
+        admitted = []
+
+        async def wait(name, priority):
+            async with queue.slot(priority=priority):
+                admitted.append(name)
+
+        tasks = []
+        for name, priority in [("a", 0), ("b", 0), ("urgent", 5), ("c", 0)]:
+            tasks.append(asyncio.ensure_future(wait(name, priority)))
+            await asyncio.sleep(0)
+
+        queue.release()
+        await asyncio.gather(*tasks)
+        assert admitted == ["urgent", "a", "b", "c"]
+        assert queue.active == 0
+
+    @pytest.mark.asyncio
+    async def test_no_barging(self):
+        """Test that a newcomer does not overtake queued callers."""
+        queue = AdmissionQueue(1)
+        await queue.acquire()
+        first = asyncio.ensure_future(queue.acquire())
+        await asyncio.sleep(0)
+
+        queue.release()
+        late = asyncio.ensure_future(queue.acquire())
+        await first
+        await asyncio.sleep(0)
+        assert not late.done()
+        queue.release()
+        await late
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Test that a timed-out waiter leaves the queue."""
+        queue = AdmissionQueue(1)
+        await queue.acquire()
+
+        with pytest.raises(TimeoutError):
+            await queue.acquire(timeout=0.01)
+
+        assert queue.depth == 0
+        queue.release()
+        await queue.acquire(timeout=0.01)
+        stats = queue.stats()
+        assert (stats["timeouts"], stats["queued"], stats["max_depth"]) == (1, 1, 1)
+        assert stats["max_wait_seconds"] >= 0.01
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter(self):
+        """Test that a cancelled waiter does not hold on to a slot."""
+        queue = AdmissionQueue(1)
+        await queue.acquire()
+        waiter = asyncio.ensure_future(queue.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        queue.release()
+        assert (queue.active, queue.depth) == (0, 0)
+
+    def test_invalid(self):
+        """Test that the limit must be positive."""
+        with pytest.raises(ValueError):
+            AdmissionQueue(0)
+
+    @pytest.mark.asyncio
+    async def test_several_slots(self):
+        """Test that a multi-slot caller is admitted only once all its slots are free."""
+        queue = AdmissionQueue(3)
+        await queue.acquire()
+        batch = asyncio.ensure_future(queue.acquire(count=3))
+        single = asyncio.ensure_future(queue.acquire())
+        await asyncio.sleep(0)
+        # The single caller would fit, but does not overtake the batch
+        assert not batch.done() and not single.done()
+
+        queue.release()
+        await batch
+        assert queue.active == 3 and not single.done()
+        queue.release(3)
+        await single
+        assert (queue.active, queue.depth) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_abandoned_multi_slot_waiter(self):
+        """Test that callers queued behind an abandoned multi-slot waiter go ahead."""
+        queue = AdmissionQueue(2)
+        await queue.acquire()
+        batch = asyncio.ensure_future(queue.acquire(count=2))
+        single = asyncio.ensure_future(queue.acquire())
+        await asyncio.sleep(0)
+
+        batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+        await asyncio.wait_for(single, 1)
+        assert (queue.active, queue.depth) == (2, 0)
+
+    @pytest.mark.asyncio
+    async def test_invalid_count(self):
+        """Test that a caller cannot ask for more slots than there are."""
+        with pytest.raises(ValueError):
+            await AdmissionQueue(2).acquire(count=3)
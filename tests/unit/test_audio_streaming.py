@@ -0,0 +1,146 @@
+import asyncio
+import io
+import threading
+import time
+import wave
+
+import pytest
+
+from mcp_sdk.products.audio import (
+    AudioSource,
+    WaveSource,
+    atranscribe_stream,
+    stitch,
+    transcribe,
+    transcribe_stream,
+)
+
+# Words spoken at one word per second in the test recordings
+WORDS = "the quick brown fox jumps over the lazy dog and runs far away".split()
+
+def _wav(seconds, rate=100):
+    """Build a mono 16-bit WAV whose samples encode the second they belong to."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(b"".join(second.to_bytes(2, "little") * rate for second in range(seconds)))
+    return buffer.getvalue()
+
+def _words_in(window):
+    """Transcribe a test window: one word per whole second it contains."""
+    samples = [int.from_bytes(window.data[i:i + 2], "little") for i in range(0, len(window.data), 2)]
+    seconds = sorted(set(samples), key=samples.index)
+    return " ".join(WORDS[second].capitalize() if i == 0 else WORDS[second]
+                    for i, second in enumerate(seconds)) + "."
+
+class TestWindows:
+    """Tests for reading audio in overlapping windows."""
+
+    def test_overlap(self):
+        """Test that windows are fixed-size and repeat the end of the last one."""
+        windows = list(WaveSource(_wav(10)).windows(window=4, overlap=1))
+
+        assert [(w.start, w.end, w.overlap) for w in windows] == [
+            (0.0, 4.0, 0.0), (3.0, 7.0, 1.0), (6.0, 10.0, 1.0)
+        ]
+        assert windows[1].data[:200] == windows[0].data[-200:]
+
+    def test_short_tail(self):
+        """Test that the last window holds whatever audio is left."""
+        windows = list(WaveSource(_wav(5)).windows(window=4, overlap=1))
+        assert [(w.start, w.end) for w in windows] == [(0.0, 4.0), (3.0, 5.0)]
+
+    def test_invalid(self):
+        """Test that invalid windows and inputs are rejected."""
+        with pytest.raises(ValueError):
+            list(WaveSource(_wav(2)).windows(window=1, overlap=1))
+        with pytest.raises(ValueError):
+            WaveSource(b"not a wav file")
+
+class TestStitch:
+    """Tests for removing text repeated across an overlap."""
+
+    def test_repeat_removed(self):
+        """Test that the longest repeated run of words is dropped."""
+        assert stitch("The quick brown fox.", "Brown fox jumps over") == "jumps over"
+
+    def test_no_repeat(self):
+        """Test that text without a repeat is kept."""
+        assert stitch("The quick brown fox.", " Jumps over ") == "Jumps over"
+        assert stitch("", "Hello") == "Hello"
+
+class TestTranscribeStream:
+    """Tests for streaming windowed transcription."""
+
+    def test_stitched_in_order(self):
+        """Test that segments come out in order without repeated words."""
+        def slow_first(window):
+            if window.index == 0:
+                time.sleep(0.05)
+            return _words_in(window)
+
+        segments = list(transcribe_stream(_wav(13), slow_first, window=4, overlap=1, max_workers=3))
+
+        assert [s.index for s in segments] == [0, 1, 2, 3]
+        assert " ".join(s.text for s in segments).lower().replace(".", "") == " ".join(WORDS)
+
+    def test_first_segment_before_the_rest(self):
+        """Test that output starts before later windows are read."""
+        class Counting(AudioSource):
+            sample_rate, channels, sample_width = 100, 1, 2
+
+            def __init__(self):
+                self.reads = 0
+
+            def read_frames(self, count):
+                self.reads += 1
+                return b"\x00\x00" * count
+
+        source = Counting()
+        segments = transcribe_stream(source, lambda window: "hi", window=1, overlap=0, max_workers=2)
+
+        assert next(segments).index == 0
+        assert source.reads <= 3
+        segments.close()
+
+    def test_transcribe_joins_segments(self):
+        """Test that transcribe with a transcriber returns the stitched text."""
+        text = transcribe(_wav(6), _words_in, window=4, overlap=1)
+        assert text.lower().replace(".", "") == " ".join(WORDS[:6])
+
+    @pytest.mark.asyncio
+    async def test_async_transcriber(self):
+        """Test that coroutine transcribers run concurrently, bounded by max_workers."""
+        active = []
+        peak = []
+
+        async def transcriber(window):
+            active.append(window.index)
+            peak.append(len(active))
+            await asyncio.sleep(0.01 * (4 - window.index))
+            active.remove(window.index)
+            return _words_in(window)
+
+        segments = [s async for s in atranscribe_stream(_wav(13), transcriber, window=4, overlap=1,
+                                                        max_workers=2, prefetch=4)]
+
+        assert [s.index for s in segments] == [0, 1, 2, 3]
+        assert " ".join(s.text for s in segments).lower().replace(".", "") == " ".join(WORDS)
+        assert max(peak) == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_transcriber_off_the_loop(self):
+        """Test that plain transcribers run in worker threads."""
+        main = threading.get_ident()
+        threads = set()
+
+        def transcriber(window):
+            threads.add(threading.get_ident())
+            return _words_in(window)
+
+        segments = [s async for s in atranscribe_stream(_wav(7), transcriber, window=4, overlap=1)]
+
+        assert len(segments) == 2
+        assert main not in threads
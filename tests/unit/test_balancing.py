@@ -0,0 +1,126 @@
+import random
+
+import pytest
+import httpx
+
+from mcp_sdk.balancing import EndpointBalancer
+from mcp_sdk.client import MCPClient, RequestOptions
+
+ENDPOINTS = ["https://a.example.com", "https://b.example.com", "https://c.example.com"]
+
+class TestEndpointBalancer:
+    """Tests for the EndpointBalancer class."""
+
+    def test_prefers_fast_endpoint(self):
+        """Test that power-of-two choices steers load to the faster replica."""
+        random.seed(0)
+        balancer = EndpointBalancer(ENDPOINTS[:2])
+        balancer.start(ENDPOINTS[0])
+        balancer.finish(ENDPOINTS[0], 0.5)
+        balancer.start(ENDPOINTS[1])
+        balancer.finish(ENDPOINTS[1], 0.01)
+
+        assert {balancer.choose() for _ in range(20)} == {ENDPOINTS[1]}
+
+    def test_in_flight_spreads_load(self):
+        """Test that busy endpoints are avoided even when they are fast."""
+        balancer = EndpointBalancer(ENDPOINTS[:2], initial_latency=0.1)
+        for _ in range(3):
+            balancer.start(ENDPOINTS[0])
+
+        assert balancer.choose() == ENDPOINTS[1]
+
+    def test_ejection_and_reintroduction(self):
+        """Test that failing endpoints are ejected and later reintroduced."""
+        balancer = EndpointBalancer(ENDPOINTS[:2], failure_threshold=2, ejection_time=60)
+        for _ in range(2):
+            balancer.start(ENDPOINTS[0])
+            balancer.finish(ENDPOINTS[0], 0.01, success=False)
+
+        assert balancer.stats()[ENDPOINTS[0]]["ejected"]
+        assert {balancer.choose() for _ in range(10)} == {ENDPOINTS[1]}
+
+        balancer.mark_health(ENDPOINTS[0], True)
+        assert not balancer.stats()[ENDPOINTS[0]]["ejected"]
+
+    def test_all_ejected_falls_back(self):
+        """Test that requests still go out when every endpoint is ejected."""
+        balancer = EndpointBalancer(ENDPOINTS[:2])
+        for endpoint in ENDPOINTS[:2]:
+            balancer.mark_health(endpoint, False)
+
+        assert balancer.choose() in ENDPOINTS[:2]
+
+    def test_exclude(self):
+        """Test that excluded endpoints are avoided while others remain."""
+        balancer = EndpointBalancer(ENDPOINTS)
+
+        assert balancer.choose(exclude=ENDPOINTS[:2]) == ENDPOINTS[2]
+        assert balancer.choose(exclude=ENDPOINTS) in ENDPOINTS
+
+    def test_unavailable_skipped(self):
+        """Test that endpoints ruled out by the availability check are avoided."""
+        balancer = EndpointBalancer(ENDPOINTS)
+        available = lambda endpoint: endpoint != ENDPOINTS[0]
+
+        assert {balancer.choose(available=available) for _ in range(20)} == set(ENDPOINTS[1:])
+        assert balancer.choose(exclude=ENDPOINTS[1:], available=available) in ENDPOINTS[1:]
+        assert balancer.choose(available=lambda endpoint: False) in ENDPOINTS
+
+    def test_cancelled_request_has_no_outcome(self):
+        """Test that cancelled requests only release their in-flight slot."""
+        balancer = EndpointBalancer(ENDPOINTS[:1])
+        balancer.start(ENDPOINTS[0])
+        balancer.finish(ENDPOINTS[0], 5.0, success=None)
+
+        stats = balancer.stats()[ENDPOINTS[0]]
+        assert stats["in_flight"] == 0
+        assert stats["ewma_latency"] is None
+
+class TestClientBalancing:
+    """Tests for multi-endpoint clients."""
+
+    @staticmethod
+    def _client(handler):
+        return MCPClient(
+            api_key="test-api-key",
+            endpoint=ENDPOINTS[:2],
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            options=RequestOptions(retry_count=1, retry_backoff_factor=0),
+        )
+
+    @pytest.mark.asyncio
+    async def test_retry_uses_other_endpoint(self, make_commit_data):
+        """Test that a failed attempt is retried on another replica."""
+        hosts = []
+
+        def handler(request):
+            hosts.append(request.url.host)
+            if len(hosts) == 1:
+                return httpx.Response(503)
+            commit = make_commit_data("abc")
+            return httpx.Response(200, json={
+                "data": commit,
+                "metadata": {"id": "abc", "version": "1", "status": "success"},
+                "links": {"self": commit["url"]},
+            })
+
+        client = self._client(handler)
+        result = await client.get_commit("abc")
+
+        assert result.data.sha == "abc"
+        assert client.endpoint == ENDPOINTS[0]
+        assert len(set(hosts)) == 2
+
+    @pytest.mark.asyncio
+    async def test_health_check_ejects(self):
+        """Test that endpoints failing the health check are ejected."""
+        def handler(request):
+            assert request.url.path == "/health"
+            return httpx.Response(200 if request.url.host == "a.example.com" else 503)
+
+        client = self._client(handler)
+        health = await client.check_endpoints()
+
+        assert health == {ENDPOINTS[0]: True, ENDPOINTS[1]: False}
+        assert client.balancer.stats()[ENDPOINTS[1]]["ejected"]
@@ -0,0 +1,185 @@
+import pytest
+import asyncio
+import json
+import httpx
+from fastapi.testclient import TestClient
+
+from mcp_sdk.batching import RequestBatcher
+from mcp_sdk.client import MCPClient, BatchOptions
+from mcp_sdk.models import MCPRequest, MCPResponse
+from mcp_sdk.exceptions import MCPError
+from mcp_sdk.server import MCPServer, ServerConfig
+
+class TestRequestBatcher:
+    """Tests for the RequestBatcher class."""
+
+    @pytest.mark.asyncio
+    async def test_submissions_within_window_share_a_batch(self):
+        """Test that concurrent submissions are dispatched together."""
+        batches = []
+
+        async def dispatch(items):
+            batches.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = RequestBatcher(dispatch, max_batch_size=10, max_delay=0.01)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+        assert results == [0, 2, 4, 6, 8]
+        assert batches == [[0, 1, 2, 3, 4]]
+
+    @pytest.mark.asyncio
+    async def test_size_limit_splits_batches(self):
+        """Test that a full batch is dispatched without waiting for the window."""
+        batches = []
+
+        async def dispatch(items):
+            batches.append(list(items))
+            return items
+
+        batcher = RequestBatcher(dispatch, max_batch_size=2, max_delay=10)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(4))), timeout=1
+        )
+
+        assert results == [0, 1, 2, 3]
+        assert batches == [[0, 1], [2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_item_errors_resolve_independently(self):
+        """Test that an error result only fails its own submission."""
+        async def dispatch(items):
+            return [ValueError("bad") if item == 1 else item for item in items]
+
+        batcher = RequestBatcher(dispatch, max_delay=0)
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(3)), return_exceptions=True
+        )
+
+        assert results[0] == 0
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 2
+
+    @pytest.mark.asyncio
+    async def test_dispatch_failure_fails_whole_batch(self):
+        """Test that a failing dispatch propagates to every submission."""
+        async def dispatch(items):
+            raise RuntimeError("down")
+
+        batcher = RequestBatcher(dispatch, max_delay=0)
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(2)), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    def test_invalid_options(self):
+        """Test batcher option validation."""
+        async def dispatch(items):
+            return items
+
+        with pytest.raises(ValueError):
+            RequestBatcher(dispatch, max_batch_size=0)
+        with pytest.raises(ValueError):
+            RequestBatcher(dispatch, max_delay=-1)
+
+
+class TestClientBatching:
+    """Tests for MCPClient batching mode."""
+
+    @staticmethod
+    def _handler(calls):
+        def handler(request):
+            calls.append(request)
+            items = json.loads(request.content)["requests"]
+            responses = []
+            for index, item in enumerate(items):
+                if item["context"] == "fail":
+                    responses.append({"index": index, "status_code": 400, "error": "bad request"})
+                    continue
+                responses.append({
+                    "index": index,
+                    "status_code": 200,
+                    "response": {
+                        "id": f"resp-{index}",
+                        "model": item["model"],
+                        "content": item["context"].upper(),
+                        "created_at": "2024-01-01T00:00:00",
+                        "usage": {"tokens": 1},
+                    },
+                })
+            return httpx.Response(200, json={"responses": responses})
+        return handler
+
+    @staticmethod
+    def _request(context):
+        return MCPRequest(
+            model="text:gpt-4",
+            context=context,
+            settings={"temperature": 0.7, "max_tokens": 100}
+        )
+
+    @pytest.mark.asyncio
+    async def test_send_batch(self):
+        """Test explicit batch sends return per-item results in order."""
+        calls = []
+        client = MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self._handler(calls)))
+        )
+
+        results = await client.send_batch([self._request("a"), self._request("fail"), self._request("b")])
+
+        assert len(calls) == 1
+        assert calls[0].url.path == "/api/v1/process:batch"
+        assert results[0].data.content == "A"
+        assert isinstance(results[1], MCPError)
+        assert results[1].status_code == 400
+        assert results[2].data.content == "B"
+
+    @pytest.mark.asyncio
+    async def test_batching_mode_coalesces_sends(self):
+        """Test that concurrent sends share a single batch call."""
+        calls = []
+        client = MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self._handler(calls))),
+            batch_options=BatchOptions(max_batch_size=16, max_delay=0.01)
+        )
+
+        results = await asyncio.gather(
+            *(client.send(self._request(c)) for c in ["x", "fail", "y"]),
+            return_exceptions=True
+        )
+        await client.aclose()
+
+        assert len(calls) == 1
+        assert results[0].data.content == "X"
+        assert isinstance(results[1], MCPError)
+        assert results[2].data.content == "Y"
+
+class TestBatchRoute:
+    """Tests for the server's batch endpoint."""
+
+    def test_invalid_item_fails_alone(self):
+        """Test that a malformed request fails its own item and not the batch."""
+        server = MCPServer(ServerConfig())
+
+        async def process(request, client_info):
+            return MCPResponse(id="r1", model=request.model, content=request.context.upper(),
+                               created_at="2024-01-01T00:00:00", usage={})
+
+        server._process_mcp_request = process
+        client = TestClient(server.app)
+        valid = {"model": "text:gpt-4", "context": "hi", "settings": {}}
+
+        response = client.post("/api/v1/process:batch", json={"requests": [{"model": "text:gpt-4"}, valid]})
+
+        assert response.status_code == 200
+        invalid_item, valid_item = response.json()["responses"]
+        assert invalid_item["status_code"] == 422
+        assert "context" in invalid_item["error"]
+        assert valid_item["status_code"] == 200
+        assert valid_item["response"]["content"] == "HI"
@@ -0,0 +1,191 @@
+import pytest
+import httpx
+
+from mcp_sdk.cache import CommitCache, ResponseCache
+from mcp_sdk.client import MCPClient
+from mcp_sdk.models import Commit, ServerOptions
+from mcp_sdk.resources import ResourceResponse
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+
+def _response(commit_data):
+    return ResourceResponse[Commit](
+        data=Commit(**commit_data),
+        metadata={"id": commit_data["sha"], "version": "1", "status": "success"},
+        links={"self": commit_data["url"]}
+    )
+
+class TestCommitCache:
+    """Tests for the CommitCache class."""
+
+    def test_hit_returns_copy(self, make_commit_data):
+        """Test that callers cannot modify cached entries through what they stored or got."""
+        cache = CommitCache()
+        value = _response(make_commit_data(SHA))
+        cache.put(SHA, None, value)
+        value.data.message = "stored"
+
+        hit = cache.get(SHA)
+        assert hit is not value
+        assert hit.data.message == f"Commit {SHA[:7]}"
+        hit.data.files[0].mark_patch_pending()
+
+        assert not cache.get(SHA).data.files[0].patch_pending
+        assert cache.stats["hits"] == 2
+
+    def test_miss(self):
+        """Test miss accounting."""
+        cache = CommitCache()
+
+        assert cache.get(SHA) is None
+        assert cache.stats["misses"] == 1
+
+    def test_keyed_by_options(self, make_commit_data):
+        """Test that different server options are cached separately."""
+        cache = CommitCache()
+        cache.put(SHA, ServerOptions(include_files=False), _response(make_commit_data(SHA)))
+
+        assert cache.get(SHA, ServerOptions(include_files=False)) is not None
+        assert cache.get(SHA, ServerOptions()) is None
+        assert cache.get(SHA) is None
+
+    def test_refs_and_short_shas_not_cached(self, make_commit_data):
+        """Test that mutable or ambiguous names are never cached."""
+        cache = CommitCache()
+        for name in ["main", SHA[:7]]:
+            cache.put(name, None, _response(make_commit_data(name)))
+            assert cache.get(name) is None
+        assert cache.stats["entries"] == 0
+
+    def test_lru_eviction_by_bytes(self, make_commit_data):
+        """Test that the least recently used entries are evicted over budget."""
+        cache = CommitCache(max_bytes=250)
+        shas = [str(i) * 40 for i in range(3)]
+        for sha in shas[:2]:
+            cache.put(sha, None, _response(make_commit_data(sha)), size=100)
+        cache.get(shas[0])
+        cache.put(shas[2], None, _response(make_commit_data(shas[2])), size=100)
+
+        assert cache.get(shas[1]) is None
+        assert cache.get(shas[0]) is not None
+        assert cache.get(shas[2]) is not None
+        stats = cache.stats
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        assert stats["bytes_used"] == 200
+
+    def test_oversized_entry_skips_memory(self, make_commit_data):
+        """Test that entries larger than the budget are not kept in memory."""
+        cache = CommitCache(max_bytes=10)
+        cache.put(SHA, None, _response(make_commit_data(SHA)), size=100)
+
+        assert cache.get(SHA) is None
+        assert cache.stats["bytes_used"] == 0
+
+    def test_disk_tier_persists(self, make_commit_data, tmp_path):
+        """Test that the on-disk tier survives a new cache instance."""
+        path = tmp_path / "commits.db"
+        cache = CommitCache(path=path)
+        cache.put(SHA, None, _response(make_commit_data(SHA)))
+        cache.close()
+
+        reopened = CommitCache(path=path)
+        value = reopened.get(SHA)
+
+        assert value.data.sha == SHA
+        assert reopened.stats["disk_hits"] == 1
+        assert reopened.get(SHA) == value
+        assert reopened.stats["hits"] == 1
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_async_disk_tier(self, make_commit_data, tmp_path):
+        """Test that the async methods read and write the on-disk tier."""
+        path = tmp_path / "commits.db"
+        cache = CommitCache(path=path)
+        await cache.aput(SHA, None, _response(make_commit_data(SHA)))
+        cache.close()
+
+        reopened = CommitCache(path=path)
+        assert await reopened.aget("f" * 40) is None
+        value = await reopened.aget(SHA)
+
+        assert value.data.sha == SHA
+        assert await reopened.aget(SHA) == value
+        stats = reopened.stats
+        assert (stats["misses"], stats["disk_hits"], stats["hits"]) == (1, 1, 1)
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_client_get_commit_uses_cache(self, make_commit_data):
+        """Test that cached commits skip the network."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json=_response(make_commit_data(SHA)).model_dump(mode="json"))
+
+        cache = CommitCache()
+        client = MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            commit_cache=cache
+        )
+
+        first = await client.get_commit(SHA)
+        second = await client.get_commit(SHA)
+
+        assert len(calls) == 1
+        assert second == first and second is not first
+        assert cache.stats["misses"] == 1
+        assert cache.stats["hits"] == 1
+
+class TestResponseCache:
+    """Tests for the ResponseCache class."""
+
+    def test_store_requires_validators(self):
+        """Test that responses without validators are not kept."""
+        cache = ResponseCache()
+        key = cache.make_key("GET", "/a", {"x": 1})
+
+        cache.store(key, "plain", {})
+        assert cache.lookup(key) is None
+
+        cache.store(key, "tagged", {"ETag": 'W/"1"'})
+        entry = cache.lookup(key)
+        assert entry.value == "tagged"
+        assert entry.conditional_headers() == {"If-None-Match": 'W/"1"'}
+
+    def test_revalidated_counts_hits(self):
+        """Test hit accounting for 304 responses."""
+        cache = ResponseCache()
+        cache.store("k", "value", {"Last-Modified": "Tue, 02 Jan 2024 12:00:00 GMT"})
+
+        assert cache.revalidated("k", cache.lookup("k")) == "value"
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_hands_out_copies(self):
+        """Test that changes to stored or revalidated responses do not leak into the cache."""
+        cache = ResponseCache()
+        value = {"files": [{"patch": None}]}
+        cache.store("k", value, {"ETag": '"1"'})
+        value["files"][0]["patch"] = "stored"
+
+        first = cache.revalidated("k", cache.lookup("k"))
+        first["files"][0]["patch"] = "changed"
+
+        assert cache.revalidated("k", cache.lookup("k")) == {"files": [{"patch": None}]}
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = ResponseCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.store(key, key, {"ETag": '"1"'})
+        cache.lookup("a")
+        cache.store("c", "c", {"ETag": '"1"'})
+
+        assert cache.lookup("b") is None
+        assert cache.lookup("a") is not None
+        assert cache.stats["evictions"] == 1
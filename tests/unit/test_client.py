@@ -1,10 +1,14 @@
 import pytest
 from unittest.mock import patch, Mock, MagicMock
+import asyncio
 import json
+import time
+import httpx
 import requests
 
-from mcp_sdk.client import MCPClient
-from mcp_sdk.models import MCPRequest, MCPResponse
+from mcp_sdk.client import MCPClient, RequestOptions
+from mcp_sdk.models import MCPRequest, MCPResponse, ServerOptions
+from mcp_sdk.resources import ResourceQuery
 from mcp_sdk.exceptions import (
     MCPError,
     MCPConnectionError,
@@ -14,6 +18,19 @@ from mcp_sdk.exceptions import (
     MCPTimeoutError
 )
 
+def _resource_payload(content="ok"):
+    return {
+        "data": {
+            "id": "resp-1",
+            "model": "gpt-4",
+            "content": content,
+            "created_at": "2024-01-01T00:00:00",
+            "usage": {"tokens": 1},
+        },
+        "metadata": {"id": "resp-1", "version": "1", "status": "success"},
+        "links": {"self": "https://api.example.com/api/v1/process"},
+    }
+
 class TestMCPClient:
     """Tests for the MCPClient class."""
 
@@ -42,48 +59,165 @@ class TestMCPClient:
         with pytest.raises(MCPError):
             MCPClient(api_key="test-api-key", endpoint="")
 
-    @patch('requests.Session.post')
-    async def test_send_success(self, mock_post, mcp_client, mock_response):
-        """Test successful API request."""
-        mock_post.return_value = mock_response
-        
-        request = MCPRequest(
+    @pytest.fixture
+    def make_async_client(self, client_info):
+        """Build a client whose async transport is served by a handler."""
+        def _make(handler):
+            return MCPClient(
+                api_key="test-api-key",
+                endpoint="https://api.example.com",
+                client_info=client_info,
+                http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            )
+        return _make
+
+    @pytest.fixture
+    def sample_request(self):
+        return MCPRequest(
             model="gpt-4",
             context="Test context",
             settings={"temperature": 0.7, "max_tokens": 100}
         )
-        
-        response = await mcp_client.send(request)
+
+    @pytest.mark.asyncio
+    async def test_send_success(self, make_async_client, sample_request):
+        """Test successful API request."""
+        def handler(request):
+            assert request.url.path == "/api/v1/process"
+            assert request.headers["Authorization"] == "Bearer test-api-key"
+            return httpx.Response(200, json=_resource_payload())
+
+        client = make_async_client(handler)
+        response = await client.send(sample_request)
         assert response is not None
-        assert "data" in response
+        assert response.data.content == "ok"
+        await client.aclose()
 
-    @patch('requests.Session.post')
-    async def test_send_connection_error(self, mock_post, mcp_client):
+    @pytest.mark.asyncio
+    async def test_send_connection_error(self, make_async_client, sample_request):
         """Test connection error handling."""
-        mock_post.side_effect = requests.exceptions.ConnectionError("Connection failed")
-        
-        request = MCPRequest(
-            model="gpt-4",
-            context="Test context",
-            settings={"temperature": 0.7, "max_tokens": 100}
-        )
-        
+        def handler(request):
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        client = make_async_client(handler)
+        client.options.retry_count = 0
         with pytest.raises(MCPConnectionError):
-            await mcp_client.send(request)
+            await client.send(sample_request)
 
-    @patch('requests.Session.post')
-    async def test_send_timeout(self, mock_post, mcp_client):
+    @pytest.mark.asyncio
+    async def test_send_timeout(self, make_async_client, sample_request):
         """Test timeout error handling."""
-        mock_post.side_effect = requests.exceptions.Timeout("Request timed out")
-        
-        request = MCPRequest(
-            model="gpt-4",
-            context="Test context",
-            settings={"temperature": 0.7, "max_tokens": 100}
-        )
-        
+        def handler(request):
+            raise httpx.ReadTimeout("Request timed out", request=request)
+
+        client = make_async_client(handler)
+        client.options.retry_count = 0
         with pytest.raises(MCPTimeoutError):
-            await mcp_client.send(request)
+            await client.send(sample_request)
+
+    @pytest.mark.asyncio
+    async def test_send_retries_retryable_status(self, make_async_client, sample_request):
+        """Test that retryable status codes are retried on the async transport."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(503, headers={"Retry-After": "0"})
+            return httpx.Response(200, json=_resource_payload())
+
+        client = make_async_client(handler)
+        response = await client.send(sample_request)
+        assert len(calls) == 2
+        assert response.data.content == "ok"
+
+    @pytest.mark.asyncio
+    async def test_send_maps_error_status(self, make_async_client, sample_request):
+        """Test that error status codes map to MCP exceptions."""
+        client = make_async_client(lambda request: httpx.Response(401, json={}))
+        with pytest.raises(MCPAuthenticationError):
+            await client.send(sample_request)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_overlap(self, make_async_client, sample_request):
+        """Test that concurrent sends do not serialize on the event loop."""
+        async def handler(request):
+            await asyncio.sleep(0.1)
+            return httpx.Response(200, json=_resource_payload())
+
+        client = make_async_client(handler)
+        start = time.monotonic()
+        responses = await asyncio.gather(*(client.send(sample_request) for _ in range(20)))
+        elapsed = time.monotonic() - start
+
+        assert len(responses) == 20
+        assert elapsed < 1.0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stream_format", ["ndjson", "sse"])
+    async def test_stream(self, make_async_client, sample_request, stream_format):
+        """Test incremental consumption of a streamed response."""
+        chunks = [
+            {"id": "msg-1", "model": "text", "index": 0, "content": "HELLO "},
+            {"id": "msg-1", "model": "text", "index": 1, "content": "WORLD"},
+            {"id": "msg-1", "model": "text", "index": 2, "content": "", "done": True},
+        ]
+
+        def handler(request):
+            assert request.url.path == "/api/v1/process:stream"
+            if stream_format == "sse":
+                assert request.headers["Accept"] == "text/event-stream"
+                body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks)
+            else:
+                assert request.headers["Accept"] == "application/x-ndjson"
+                body = "".join(f"{json.dumps(chunk)}\n" for chunk in chunks)
+            return httpx.Response(200, text=body)
+
+        client = make_async_client(handler)
+        received = [chunk async for chunk in client.stream(sample_request, stream_format=stream_format)]
+
+        assert [chunk.content for chunk in received] == ["HELLO ", "WORLD", ""]
+        assert received[-1].done
+
+    @pytest.mark.asyncio
+    async def test_stream_error_chunk(self, make_async_client, sample_request):
+        """Test that an error reported mid-stream is raised."""
+        body = json.dumps({"id": "msg-1", "model": "text", "index": 0, "content": "",
+                           "done": True, "error": "Internal server error"}) + "\n"
+        client = make_async_client(lambda request: httpx.Response(200, text=body))
+
+        with pytest.raises(MCPError):
+            async for _ in client.stream(sample_request):
+                pass
+
+    def test_http_client_uses_pool_options(self):
+        """Test that the owned async client honours the pool options."""
+        client = MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            options=RequestOptions(max_connections=7, max_keepalive_connections=3)
+        )
+        pool = client.http_client._transport._pool
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert client.http_client is client.http_client
+
+    def test_send_sync(self, mcp_client, sample_request):
+        """Test the blocking facade over the requests session."""
+        mock_response = Mock(status_code=200, headers={}, url="https://api.example.com/api/v1/process",
+                             content=json.dumps(_resource_payload()).encode())
+        mcp_client.session.request.return_value = mock_response
+
+        response = mcp_client.send_sync(sample_request)
+        assert response.data.content == "ok"
+        mcp_client.session.request.assert_called_once()
+
+    def test_send_sync_connection_error(self, mcp_client, sample_request):
+        """Test connection error handling on the blocking facade."""
+        mcp_client.session.request.side_effect = requests.exceptions.ConnectionError("Connection failed")
+
+        with pytest.raises(MCPConnectionError):
+            mcp_client.send_sync(sample_request)
 
     def test_prepare_headers(self, mcp_client):
         """Test header preparation."""
@@ -96,3 +230,393 @@ class TestMCPClient:
         assert "X-Client-Name" in headers
         assert headers["X-Client-Name"] == mcp_client.client_info.name
 
+    def test_headers_cached_until_client_info_update(self, mcp_client):
+        """Test that default headers are built once and refreshed on update."""
+        headers = mcp_client._default_headers()
+        assert mcp_client._default_headers() is headers
+        with pytest.raises(TypeError):
+            headers["X-Client-Name"] = "changed"
+
+        mcp_client.update_client_info(name="renamed")
+
+        assert mcp_client._default_headers() is not headers
+        assert mcp_client._default_headers()["X-Client-Name"] == "renamed"
+
+    @pytest.mark.asyncio
+    async def test_send_splices_cached_client_info(self, make_async_client, sample_request):
+        """Test that client info is encoded once and spliced into every body."""
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json=_resource_payload())
+
+        client = make_async_client(handler)
+        dump_model = client.codec.dump_model
+        with patch.object(client.codec, "dump_model", side_effect=dump_model) as encode:
+            await client.send(sample_request)
+            await client.send(sample_request)
+            encoded = [call.args[0] for call in encode.call_args_list]
+            assert encoded.count(client.client_info) == 1
+
+        client.update_client_info(name="renamed")
+        await client.send(sample_request)
+
+        assert bodies[0]["model"] == "gpt-4"
+        assert bodies[0]["client_info"]["platform"] == client.client_info.platform
+        assert bodies[0] == bodies[1]
+        assert bodies[2]["client_info"]["name"] == "renamed"
+
+    def test_encode_request_keeps_own_client_info(self, mcp_client):
+        """Test that a request carrying client info is sent unchanged."""
+        body = mcp_client._encode_request({"model": "gpt-4", "client_info": {"name": "own"}})
+        assert json.loads(body) == {"model": "gpt-4", "client_info": {"name": "own"}}
+
+        assert json.loads(mcp_client._encode_request({}))["client_info"]["name"] == mcp_client.client_info.name
+
+
+
+class TestGetCommits:
+    """Tests for bulk commit retrieval."""
+
+    SHAS = [str(i) * 40 for i in range(5)]
+
+    @staticmethod
+    def _client(handler, **kwargs):
+        return MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            **kwargs
+        )
+
+    @staticmethod
+    def _resource(commit):
+        return {
+            "data": commit,
+            "metadata": {"id": commit["sha"], "version": "1", "status": "success"},
+            "links": {"self": commit["url"]},
+        }
+
+    @pytest.mark.asyncio
+    async def test_multi_get(self, make_commit_data):
+        """Test that commits are fetched through the multi-get endpoint."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            assert request.url.path == "/api/v1/commits:batchGet"
+            shas = json.loads(request.content)["shas"]
+            known = [sha for sha in shas if sha != self.SHAS[2]]
+            return httpx.Response(200, json={
+                "data": [make_commit_data(sha) for sha in reversed(known)],
+                "metadata": [{"id": sha, "version": "1", "status": "success"} for sha in reversed(known)],
+                "links": {"self": str(request.url)},
+                "pagination": {"total": len(known), "page": 1, "per_page": len(shas),
+                               "total_pages": 1, "has_next": False, "has_prev": False},
+            })
+
+        client = self._client(handler)
+        commits = [commit async for commit in client.get_commits(self.SHAS, chunk_size=3)]
+
+        assert len(calls) == 2
+        assert [commit.sha for commit in commits] == [sha for sha in self.SHAS if sha != self.SHAS[2]]
+
+    @pytest.mark.asyncio
+    async def test_fallback_to_concurrent_gets(self, make_commit_data):
+        """Test the bounded concurrent fallback when multi-get is unavailable."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            if request.url.path == "/api/v1/commits:batchGet":
+                return httpx.Response(404)
+            sha = request.url.path.rsplit("/", 1)[-1]
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Finish in reverse order to exercise ordering
+            await asyncio.sleep(0.01 * (len(self.SHAS) - self.SHAS.index(sha)))
+            in_flight -= 1
+            if sha == self.SHAS[1]:
+                return httpx.Response(404)
+            return httpx.Response(200, json=self._resource(make_commit_data(sha)))
+
+        client = self._client(handler)
+        ordered = [c.sha async for c in client.get_commits(self.SHAS, concurrency=2)]
+        unordered = [c.sha async for c in client.get_commits(self.SHAS, ordered=False, concurrency=5)]
+
+        expected = [sha for sha in self.SHAS if sha != self.SHAS[1]]
+        assert ordered == expected
+        assert unordered == list(reversed(expected))
+        assert peak <= 5
+        assert client._multi_get_supported is False
+
+    @pytest.mark.asyncio
+    async def test_duplicates_and_cache(self, make_commit_data):
+        """Test that duplicate and cached SHAs are not fetched again."""
+        from mcp_sdk.cache import CommitCache
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            shas = json.loads(request.content)["shas"]
+            return httpx.Response(200, json={
+                "data": [make_commit_data(sha) for sha in shas],
+                "metadata": [{"id": sha, "version": "1", "status": "success"} for sha in shas],
+                "links": {"self": str(request.url)},
+                "pagination": {"total": len(shas), "page": 1, "per_page": len(shas),
+                               "total_pages": 1, "has_next": False, "has_prev": False},
+            })
+
+        client = self._client(handler, commit_cache=CommitCache())
+        first = [c.sha async for c in client.get_commits(self.SHAS[:2] + self.SHAS[:2])]
+        second = [c.sha async for c in client.get_commits(self.SHAS[:2])]
+
+        assert first == self.SHAS[:2]
+        assert second == self.SHAS[:2]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_fetches(self, make_commit_data):
+        """Test that closing the iterator early lets outstanding fetches unwind."""
+        unwound = []
+
+        async def handler(request):
+            sha = json.loads(request.content)["shas"][0]
+            if sha != self.SHAS[0]:
+                try:
+                    await asyncio.sleep(10)
+                finally:
+                    unwound.append(sha)
+            return httpx.Response(200, json={
+                "data": [make_commit_data(sha)],
+                "metadata": [{"id": sha, "version": "1", "status": "success"}],
+                "links": {"self": str(request.url)},
+                "pagination": {"total": 1, "page": 1, "per_page": 1,
+                               "total_pages": 1, "has_next": False, "has_prev": False},
+            })
+
+        client = self._client(handler)
+        commits = client.get_commits(self.SHAS, chunk_size=1)
+        first = await commits.__anext__()
+        await commits.aclose()
+
+        assert first.sha == self.SHAS[0]
+        assert sorted(unwound) == sorted(self.SHAS[1:])
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self):
+        """Test that a non-positive concurrency limit is rejected."""
+        client = self._client(lambda request: httpx.Response(200))
+        with pytest.raises(MCPError):
+            async for _ in client.get_commits(self.SHAS, concurrency=0):
+                pass
+
+class TestLazyPatches:
+    """Tests for deferred commit file patches."""
+
+    SHA = "0123456789abcdef0123456789abcdef01234567"
+
+    @staticmethod
+    def _client(handler, **kwargs):
+        return MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            **kwargs
+        )
+
+    def _handler(self, make_commit_data, calls):
+        def handler(request):
+            calls.append(request)
+            if request.url.path.endswith("/patches"):
+                filenames = json.loads(request.content)["filenames"]
+                return httpx.Response(200, json={
+                    "data": {"sha": self.SHA, "patches": {name: f"patch of {name}" for name in filenames}},
+                    "metadata": {"id": self.SHA, "version": "1", "status": "success"},
+                    "links": {"self": str(request.url)},
+                })
+            commit = make_commit_data(self.SHA, patch=None)
+            commit["files"].append(dict(commit["files"][0], filename="setup.py"))
+            return httpx.Response(200, json={
+                "data": commit,
+                "metadata": {"id": self.SHA, "version": "1", "status": "success"},
+                "links": {"self": str(request.url)},
+            })
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_patch_left_pending(self, make_commit_data):
+        """Test that reading a pending patch does not fetch it."""
+        calls = []
+        client = self._client(self._handler(make_commit_data, calls))
+        result = await client.get_commit(self.SHA, ServerOptions(include_patches=False))
+        commit_file = result.data.files[0]
+
+        assert commit_file.patch_pending
+        assert commit_file.patch is None
+        assert len(calls) == 1
+
+        await client.load_patches(result.data)
+        assert not commit_file.patch_pending
+        assert commit_file.patch == "patch of README.md"
+
+    @pytest.mark.asyncio
+    async def test_load_subset(self, make_commit_data):
+        """Test that a chosen subset of patches is fetched in one request."""
+        calls = []
+        client = self._client(self._handler(make_commit_data, calls))
+        result = await client.get_commit(self.SHA, ServerOptions(include_patches=False))
+
+        await client.load_patches(result.data, ["setup.py"])
+        await client.load_patches(result.data, ["setup.py"])
+
+        readme, setup = result.data.files
+        assert len(calls) == 2
+        assert json.loads(calls[1].content)["filenames"] == ["setup.py"]
+        assert setup.patch == "patch of setup.py"
+        assert readme.patch_pending
+
+    @pytest.mark.asyncio
+    async def test_cached_bulk_commits_left_pending(self, make_commit_data):
+        """Test that commits get_commits serves from the cache still load their patches."""
+        from mcp_sdk.cache import CommitCache
+
+        calls = []
+        client = self._client(self._handler(make_commit_data, calls), commit_cache=CommitCache())
+        options = ServerOptions(include_patches=False)
+        await client.get_commit(self.SHA, options)
+
+        commits = [commit async for commit in client.get_commits([self.SHA], options=options)]
+
+        assert len(calls) == 1
+        assert commits[0].files[0].patch_pending
+        await client.load_patches(commits[0])
+        assert commits[0].files[0].patch == "patch of README.md"
+
+    @pytest.mark.asyncio
+    async def test_patches_not_deferred_by_default(self, make_commit_data):
+        """Test that commits fetched with patches are left untouched."""
+        client = self._client(self._handler(make_commit_data, []))
+        result = await client.get_commit(self.SHA)
+
+        assert not result.data.files[0].patch_pending
+        assert result.data.files[0].patch is None
+
+class TestIterate:
+    """Tests for paginated iteration."""
+
+    TOTAL_PAGES = 5
+
+    def _client(self, calls, state=None, delay=0.01):
+        state = state if state is not None else {"in_flight": 0, "peak": 0}
+
+        async def handler(request):
+            page = json.loads(request.content)["page"]
+            calls.append(page)
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(delay)
+            state["in_flight"] -= 1
+            if page == 99:
+                return httpx.Response(500, json={"message": "boom"})
+            items = [{"id": f"{page}-{i}", "model": "m", "content": "c",
+                      "created_at": "2024-01-01T00:00:00", "usage": {}} for i in range(2)]
+            return httpx.Response(200, json={
+                "data": items,
+                "metadata": [{"id": item["id"], "version": "1", "status": "success"} for item in items],
+                "links": {"self": str(request.url)},
+                "pagination": {"total": 2 * self.TOTAL_PAGES, "page": page, "per_page": 2,
+                               "total_pages": self.TOTAL_PAGES, "has_next": page < self.TOTAL_PAGES,
+                               "has_prev": page > 1},
+            })
+
+        return MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            options=RequestOptions(retry_count=0),
+        )
+
+    @pytest.mark.asyncio
+    async def test_iterates_all_pages_in_order(self):
+        """Test that items of all pages are yielded in order with read-ahead."""
+        calls = []
+        state = {"in_flight": 0, "peak": 0}
+        client = self._client(calls, state)
+
+        items = [item.id async for item in client.iterate("/api/v1/responses", MCPResponse, prefetch=3)]
+
+        assert items == [f"{page}-{i}" for page in range(1, 6) for i in range(2)]
+        assert sorted(calls) == [1, 2, 3, 4, 5]
+        assert state["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_no_prefetch_is_sequential(self):
+        """Test that prefetch=0 fetches one page at a time."""
+        calls = []
+        state = {"in_flight": 0, "peak": 0}
+        client = self._client(calls, state)
+
+        items = [item async for item in client.iterate("/api/v1/responses", MCPResponse, prefetch=0)]
+
+        assert len(items) == 10
+        assert state["peak"] == 1
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_read_ahead(self):
+        """Test that leaving the loop stops fetching further pages."""
+        calls = []
+        client = self._client(calls)
+
+        iterator = client.iterate("/api/v1/responses", MCPResponse, ResourceQuery(page=2), prefetch=1)
+        first = await iterator.__anext__()
+        await iterator.aclose()
+
+        assert first.id == "2-0"
+        assert calls[0] == 2
+        assert set(calls) <= {2, 3}
+
+    @pytest.mark.asyncio
+    async def test_page_error_raised(self):
+        """Test that a failing page request is raised to the caller."""
+        client = self._client([])
+
+        with pytest.raises(MCPError):
+            async for _ in client.iterate("/api/v1/responses", MCPResponse, ResourceQuery(page=99)):
+                pass
+
+class TestConditionalRequests:
+    """Tests for ETag revalidation in the client."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_served_from_cache(self, make_commit_data):
+        """Test that a 304 answer returns the cached parsed response."""
+        from mcp_sdk.cache import ResponseCache
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            if request.headers.get("If-None-Match") == 'W/"1"':
+                return httpx.Response(304, headers={"ETag": 'W/"1"'})
+            commit = make_commit_data("abc")
+            return httpx.Response(200, headers={"ETag": 'W/"1"'}, json={
+                "data": commit,
+                "metadata": {"id": "abc", "version": "1", "status": "success"},
+                "links": {"self": commit["url"]},
+            })
+
+        client = MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            response_cache=ResponseCache(),
+        )
+        first = await client.get_commit("abc")
+        second = await client.get_commit("abc")
+
+        assert second == first and second is not first
+        assert "If-None-Match" not in sent[0].headers
+        assert sent[1].headers["If-None-Match"] == 'W/"1"'
+        assert client.response_cache.stats["hits"] == 1
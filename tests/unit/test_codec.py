@@ -0,0 +1,79 @@
+import json
+import sys
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from mcp_sdk.codec import JSONCodec, get_codec
+from mcp_sdk.exceptions import MCPConfigurationError
+from mcp_sdk.models import MCPStreamChunk
+
+def _available_codecs():
+    names = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            get_codec(name)
+        except MCPConfigurationError:
+            continue
+        names.append(name)
+    return names
+
+@pytest.mark.parametrize("name", _available_codecs())
+class TestCodecs:
+    """Tests that every installed backend behaves the same."""
+
+    def test_round_trip(self, name):
+        """Test that values survive encoding and decoding."""
+        codec = get_codec(name)
+        value = {"text": "héllo", "items": [1, 2.5, None, True], "nested": {"a": "b"}}
+
+        encoded = codec.dumps(value)
+
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == value
+        assert json.loads(encoded) == value
+
+    def test_extra_types(self, name):
+        """Test that datetimes, UUIDs and models are encoded."""
+        codec = get_codec(name)
+        chunk = MCPStreamChunk(id="c1", model="text", index=0, content="x")
+
+        decoded = codec.loads(codec.dumps({
+            "when": datetime(2024, 1, 2, 3, 4, 5),
+            "id": UUID(int=1),
+            "chunk": chunk,
+        }))
+
+        assert decoded["when"] == "2024-01-02T03:04:05"
+        assert decoded["id"] == str(UUID(int=1))
+        assert decoded["chunk"]["content"] == "x"
+
+    def test_dump_model(self, name):
+        """Test that models are encoded straight to compact JSON bytes."""
+        codec = get_codec(name)
+        chunk = MCPStreamChunk(id="c1", model="text", index=0, content="x")
+
+        encoded = codec.dump_model(chunk, exclude_none=True)
+
+        assert encoded.startswith(b'{"id":"c1"')
+        assert codec.loads(encoded) == {"id": "c1", "model": "text", "index": 0, "content": "x", "done": False}
+
+class TestGetCodec:
+    """Tests for backend selection."""
+
+    def test_default_is_shared(self):
+        """Test that the default codec is created once."""
+        assert get_codec() is get_codec()
+        assert isinstance(get_codec(), JSONCodec)
+
+    def test_unknown_codec(self):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(MCPConfigurationError):
+            get_codec("yaml")
+
+    def test_missing_backend(self, monkeypatch):
+        """Test that a backend that is not installed raises a configuration error."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        with pytest.raises(MCPConfigurationError):
+            get_codec("orjson")
@@ -0,0 +1,221 @@
+import gzip
+import json
+
+import pytest
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from mcp_sdk.client import MCPClient, RequestOptions
+from mcp_sdk import compression
+from mcp_sdk.compression import (
+    Decompressor,
+    accept_encoding,
+    available_encodings,
+    compress,
+    decompress,
+    negotiate,
+)
+from mcp_sdk.exceptions import MCPConfigurationError, MCPPayloadTooLargeError
+from mcp_sdk.models import MCPRequest
+from mcp_sdk.server_utils.compression import CompressionMiddleware
+
+class TestNegotiation:
+    """Tests for content coding helpers."""
+
+    def test_negotiate(self):
+        """Test that the best acceptable coding is picked."""
+        assert negotiate("gzip, deflate", ["zstd", "gzip"]) == "gzip"
+        assert negotiate("gzip;q=0.5, zstd", ["zstd", "gzip"]) == "zstd"
+        assert negotiate("gzip;q=0", ["gzip"]) is None
+        assert negotiate("*", ["gzip"]) == "gzip"
+        assert negotiate("", ["gzip"]) is None
+        assert negotiate("br", ["gzip"]) is None
+
+    @pytest.mark.parametrize("encoding", available_encodings())
+    def test_round_trip(self, encoding):
+        """Test that compressed bodies decompress to the original."""
+        data = b"x" * 10000
+        compressed = compress(data, encoding)
+
+        assert len(compressed) < len(data)
+        assert decompress(compressed, encoding) == data
+
+    @pytest.mark.parametrize("urllib3_codings, offered", [
+        ("gzip,deflate", "gzip"),
+        ("gzip,deflate,zstd", "zstd, gzip"),
+    ])
+    def test_accept_encoding_follows_transports(self, monkeypatch, urllib3_codings, offered):
+        """Test that zstd is only offered when both transports decode it."""
+        monkeypatch.setattr("urllib3.util.request.ACCEPT_ENCODING", urllib3_codings)
+        monkeypatch.setattr("httpx._decoders.SUPPORTED_DECODERS", {"gzip": None, "zstd": None})
+        compression._transports_decode_zstd.cache_clear()
+        try:
+            assert accept_encoding() == offered
+        finally:
+            compression._transports_decode_zstd.cache_clear()
+
+    def test_unsupported(self):
+        """Test that unknown codings are rejected."""
+        with pytest.raises(MCPConfigurationError):
+            compress(b"data", "br")
+
+    @pytest.mark.parametrize("encoding", available_encodings())
+    def test_size_limit(self, encoding):
+        """Test that output past the limit is refused, and output up to it is not."""
+        bomb = compress(b"\0" * 10_000_000, encoding)
+        decompressor = Decompressor(encoding, max_size=1000)
+        with pytest.raises(MCPPayloadTooLargeError):
+            decompressor.decompress(bomb)
+        # Output stops within a couple of zstd blocks of the limit
+        assert decompressor._size <= 1000 + 256 * 1024
+
+        decompressor = Decompressor(encoding, max_size=1000)
+        body = compress(b"x" * 1000, encoding)
+        assert decompressor.decompress(body) + decompressor.flush() == b"x" * 1000
+
+class TestCompressionMiddleware:
+    """Tests for the server-side compression middleware."""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, minimum_size=100, encodings=["gzip"])
+
+        @app.get("/text")
+        async def text(size: int):
+            return PlainTextResponse("a" * size)
+
+        @app.get("/stream")
+        async def stream():
+            async def chunks():
+                for index in range(3):
+                    yield f"{index}\n" * 50
+            return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+        @app.post("/echo")
+        async def echo(request: Request):
+            return {"body": (await request.body()).decode()}
+
+        return TestClient(app)
+
+    def test_compresses_large_response(self, client):
+        """Test that responses above the minimum size are compressed."""
+        response = client.get("/text", params={"size": 1000}, headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < 1000
+        assert response.text == "a" * 1000
+
+    def test_skips_small_response(self, client):
+        """Test that responses below the minimum size are sent as is."""
+        response = client.get("/text", params={"size": 10}, headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text == "a" * 10
+
+    def test_skips_without_accept_encoding(self, client):
+        """Test that clients that do not accept a coding get plain responses."""
+        response = client.get("/text", params={"size": 1000}, headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_compresses_stream(self, client):
+        """Test that streamed responses are compressed chunk by chunk."""
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == "".join(f"{index}\n" * 50 for index in range(3))
+
+    def test_decompresses_request(self, client):
+        """Test that compressed request bodies reach the app decompressed."""
+        response = client.post("/echo", content=gzip.compress(b"hello"),
+                               headers={"Content-Encoding": "gzip"})
+
+        assert response.json() == {"body": "hello"}
+
+    def test_rejects_oversized_request(self):
+        """Test that request bodies decompressing past the limit are answered with 413."""
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, encodings=["gzip"], max_decompressed_size=1000)
+
+        @app.post("/echo")
+        async def echo(request: Request):
+            return {"size": len(await request.body())}
+
+        @app.post("/process")
+        async def process(request: MCPRequest):
+            return {"model": request.model}
+
+        client = TestClient(app)
+        bomb = gzip.compress(json.dumps({"model": "text", "padding": " " * 10_000_000}).encode())
+        headers = {"Content-Encoding": "gzip", "Content-Type": "application/json"}
+
+        for path in ("/echo", "/process"):
+            response = client.post(path, content=bomb, headers=headers)
+            assert response.status_code == 413
+        response = client.post("/echo", content=gzip.compress(b"x" * 1000), headers=headers)
+        assert response.json() == {"size": 1000}
+
+    @pytest.mark.skipif("zstd" not in available_encodings(), reason="zstandard not installed")
+    def test_rejects_oversized_zstd_request(self):
+        """Test that zstd request bodies are cut off at the limit instead of fully inflated."""
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware, encodings=["zstd"], max_decompressed_size=1000)
+
+        @app.post("/echo")
+        async def echo(request: Request):
+            return {"size": len(await request.body())}
+
+        client = TestClient(app)
+        bomb = compress(b"\0" * 100_000_000, "zstd")
+        headers = {"Content-Encoding": "zstd"}
+
+        response = client.post("/echo", content=bomb, headers=headers)
+        assert response.status_code == 413
+        response = client.post("/echo", content=compress(b"x" * 1000, "zstd"), headers=headers)
+        assert response.json() == {"size": 1000}
+
+    def test_rejects_unknown_request_encoding(self, client):
+        """Test that unsupported request codings are answered with 415."""
+        response = client.post("/echo", content=b"hello", headers={"Content-Encoding": "br"})
+
+        assert response.status_code == 415
+
+class TestClientCompression:
+    """Tests for request compression in the client."""
+
+    @staticmethod
+    def _client(handler, **options):
+        return MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            options=RequestOptions(**options),
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+    @pytest.mark.asyncio
+    async def test_compresses_large_bodies(self):
+        """Test that bodies above the threshold are compressed and labelled."""
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            return httpx.Response(200, json={"id": "r", "model": "m", "content": "ok",
+                                             "created_at": "2024-01-01T00:00:00", "usage": {}})
+
+        client = self._client(handler, compression="gzip", compression_min_size=500)
+        await client.send(MCPRequest(model="m", context="x" * 1000, settings={}))
+        await client.send(MCPRequest(model="m", context="small", settings={}))
+
+        assert sent[0].headers["content-encoding"] == "gzip"
+        assert json.loads(gzip.decompress(sent[0].content))["context"] == "x" * 1000
+        assert "content-encoding" not in sent[1].headers
+        assert "gzip" in sent[1].headers["accept-encoding"]
+
+    def test_unsupported_compression(self):
+        """Test that an unknown request coding is rejected up front."""
+        with pytest.raises(MCPConfigurationError):
+            self._client(lambda request: httpx.Response(200), compression="br")
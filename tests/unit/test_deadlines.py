@@ -0,0 +1,109 @@
+import anyio
+import pytest
+
+from mcp_sdk.shared.deadlines import TimerWheel
+
+class _Clock:
+    """A clock the test moves by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class TestTimerWheel:
+    """Tests for the session deadline wheel."""
+
+    def test_fires_when_due(self):
+        """Test that deadlines fire once expired, never early, in one pass."""
+        clock = _Clock()
+        wheel = TimerWheel(tick=0.1, slots=8, clock=clock)
+        fired = []
+        wheel.schedule(0.25, lambda: fired.append("a"))
+        wheel.schedule(0.5, lambda: fired.append("b"))
+
+        clock.now += 0.2
+        assert wheel.advance() == 0
+        clock.now += 0.1
+        assert wheel.advance() == 1
+        assert fired == ["a"]
+        clock.now += 1.0
+        wheel.advance()
+        assert fired == ["a", "b"]
+        assert len(wheel) == 0
+
+    def test_cancel(self):
+        """Test that cancelled deadlines never fire."""
+        clock = _Clock()
+        wheel = TimerWheel(tick=0.1, slots=8, clock=clock)
+        fired = []
+        deadline = wheel.schedule(0.1, lambda: fired.append(1))
+
+        assert deadline.cancel() is True
+        assert deadline.cancel() is False
+        clock.now += 1.0
+        assert wheel.advance() == 0
+        assert fired == [] and not deadline.active
+
+    def test_beyond_one_turn(self):
+        """Test that deadlines further away than the ring wait for their turn."""
+        clock = _Clock()
+        wheel = TimerWheel(tick=0.1, slots=4, clock=clock)
+        fired = []
+        wheel.schedule(0.1, lambda: fired.append("near"))
+        wheel.schedule(0.9, lambda: fired.append("far"))
+
+        for _ in range(8):
+            clock.now += 0.1
+            wheel.advance()
+        assert fired == ["near"]
+        clock.now += 0.1
+        wheel.advance()
+        assert fired == ["near", "far"]
+
+    def test_stalled_clock(self):
+        """Test that a long gap between advances fires everything overdue."""
+        clock = _Clock()
+        wheel = TimerWheel(tick=0.1, slots=4, clock=clock)
+        fired = []
+        for delay in (0.1, 0.3, 0.7, 5.0, 60.0):
+            wheel.schedule(delay, lambda delay=delay: fired.append(delay))
+
+        clock.now += 10.0
+        assert wheel.advance() == 4
+        assert sorted(fired) == [0.1, 0.3, 0.7, 5.0]
+        assert len(wheel) == 1
+
+    def test_callback_errors(self):
+        """Test that a failing callback does not stop the others."""
+        clock = _Clock()
+        wheel = TimerWheel(tick=0.1, clock=clock)
+        fired = []
+        wheel.schedule(0.1, lambda: 1 / 0)
+        wheel.schedule(0.1, lambda: fired.append(1))
+
+        clock.now += 0.2
+        assert wheel.advance() == 2
+        assert fired == [1]
+
+    def test_invalid(self):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            TimerWheel(tick=0)
+        with pytest.raises(ValueError):
+            TimerWheel(slots=0)
+
+    @pytest.mark.asyncio
+    async def test_run(self):
+        """Test that the wheel task fires deadlines scheduled while it idles."""
+        wheel = TimerWheel(tick=0.01)
+        fired = anyio.Event()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(wheel.run)
+            await anyio.sleep(0.05)
+            wheel.schedule(0.02, fired.set)
+            with anyio.fail_after(1):
+                await fired.wait()
+            tg.cancel_scope.cancel()
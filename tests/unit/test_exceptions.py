@@ -9,7 +9,8 @@ from mcp_sdk.exceptions import (
     MCPTimeoutError,
     MCPResourceNotFoundError,
     MCPPermissionError,
-    MCPConfigurationError
+    MCPConfigurationError,
+    MCPCircuitOpenError
 )
 
 class TestExceptions:
@@ -111,3 +112,10 @@ class TestExceptions:
         assert "api_key" in str(error)
         assert error.setting == "api_key"
 
+
+    def test_circuit_open_error(self):
+        """Test MCPCircuitOpenError with endpoint."""
+        error = MCPCircuitOpenError(endpoint="https://api.example.com", retry_after=1.5)
+        assert "Circuit breaker is open" in str(error)
+        assert "https://api.example.com" in str(error)
+        assert error.retry_after == 1.5
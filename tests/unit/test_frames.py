@@ -0,0 +1,160 @@
+import io
+import threading
+
+import pytest
+
+from mcp_sdk.products.video import (
+    FrameInfo,
+    FramePacket,
+    FrameSource,
+    Frame,
+    Y4MSource,
+    aiter_frames,
+    extract_frames,
+    iter_frames,
+)
+
+def _y4m(frames, width=4, height=2, rate="10:1", colorspace="420jpeg"):
+    """Build a YUV4MPEG2 stream whose frames are filled with their index."""
+    header = f"YUV4MPEG2 W{width} H{height} F{rate} Ip A1:1 C{colorspace}\n".encode()
+    frame_size = width * height + 2 * ((width + 1) // 2) * ((height + 1) // 2)
+    return header + b"".join(b"FRAME\n" + bytes([i]) * frame_size for i in range(frames))
+
+class _Unseekable(io.RawIOBase):
+    """A stream that can only be read forward."""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self._data.readinto(buffer)
+
+class _GOPSource(FrameSource):
+    """A source with a keyframe every third frame that records what it decodes."""
+
+    width, height, fps, pixel_format = 1, 1, 30.0, "mono"
+
+    def __init__(self, count):
+        self.count = count
+        self.decoded = []
+        self.read = 0
+
+    def packets(self, select=None):
+        for index in range(self.count):
+            info = FrameInfo(index, index / self.fps, index % 3 == 0)
+            if select is None or select(info):
+                self.read += 1
+                yield FramePacket(info, bytes([index]))
+
+    def decode(self, packet):
+        self.decoded.append(packet.info.index)
+        return Frame(packet.info.index, packet.info.timestamp, packet.info.keyframe,
+                     1, 1, "mono", (packet.data,))
+
+class TestY4MSource:
+    """Tests for the raw YUV4MPEG2 reference source."""
+
+    def test_header_and_planes(self):
+        """Test that the header is parsed and frames are split into planes."""
+        source = Y4MSource(_y4m(2, width=5, height=3))
+
+        assert (source.width, source.height, source.fps) == (5, 3, 10.0)
+        assert source.plane_sizes == [15, 6, 6]
+        frames = [source.decode(packet) for packet in source.packets()]
+        assert [frame.planes for frame in frames][1] == (b"\x01" * 15, b"\x01" * 6, b"\x01" * 6)
+        assert frames[1].timestamp == pytest.approx(0.1)
+
+    def test_invalid(self):
+        """Test that streams that are not YUV4MPEG2 are rejected."""
+        with pytest.raises(ValueError):
+            Y4MSource(b"RIFF....WAVE")
+        with pytest.raises(ValueError):
+            list(Y4MSource(_y4m(2)[:-3]).packets())
+
+class TestIterFrames:
+    """Tests for streaming frame extraction."""
+
+    def test_all_frames(self, tmp_path):
+        """Test that every frame is yielded in order from a file."""
+        path = tmp_path / "clip.y4m"
+        path.write_bytes(_y4m(5))
+
+        frames = list(iter_frames(str(path), max_workers=3, prefetch=2))
+        assert [frame.index for frame in frames] == [0, 1, 2, 3, 4]
+        assert [frame.data[0] for frame in frames] == [0, 1, 2, 3, 4]
+
+    def test_subsampling_skips_unread_frames(self):
+        """Test that frames are subsampled to the requested rate without reading the rest."""
+        frames = list(iter_frames(_Unseekable(_y4m(10)), fps=2.5))
+        assert [frame.index for frame in frames] == [0, 4, 8]
+
+    def test_keyframes_only(self):
+        """Test that only keyframes are read and decoded."""
+        source = _GOPSource(10)
+        frames = list(iter_frames(source, keyframes_only=True))
+
+        assert [frame.index for frame in frames] == [0, 3, 6, 9]
+        assert sorted(source.decoded) == [0, 3, 6, 9]
+        assert source.read == 4
+
+    def test_backpressure(self):
+        """Test that at most prefetch frames are decoded ahead of the consumer."""
+        source = _GOPSource(100)
+        frames = iter_frames(source, prefetch=3)
+
+        next(frames)
+        assert source.read <= 4
+        frames.close()
+        assert source.read <= 4
+
+    def test_decode_error(self):
+        """Test that a decoding error is raised to the consumer."""
+        class Broken(_GOPSource):
+            def decode(self, packet):
+                if packet.info.index == 2:
+                    raise ValueError("corrupt frame")
+                return super().decode(packet)
+
+        with pytest.raises(ValueError):
+            list(iter_frames(Broken(5)))
+
+    def test_extract_frames_list(self):
+        """Test that extract_frames still returns a list."""
+        assert len(extract_frames(_y4m(3))) == 3
+
+    def test_invalid_settings(self):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            list(iter_frames(_y4m(1), fps=0))
+        with pytest.raises(ValueError):
+            list(iter_frames(_y4m(1), prefetch=0))
+
+class TestAiterFrames:
+    """Tests for async streaming frame extraction."""
+
+    @pytest.mark.asyncio
+    async def test_frames_off_the_event_loop(self):
+        """Test that frames are read and decoded in worker threads."""
+        main = threading.get_ident()
+        threads = set()
+
+        class Recording(_GOPSource):
+            def decode(self, packet):
+                threads.add(threading.get_ident())
+                return super().decode(packet)
+
+        indexes = [frame.index async for frame in aiter_frames(Recording(30), fps=10)]
+
+        assert indexes == [0, 3, 6, 9, 12, 15, 18, 21, 24, 27]
+        assert main not in threads
+
+    @pytest.mark.asyncio
+    async def test_early_exit(self):
+        """Test that stopping early leaves the rest of the stream unread."""
+        source = _GOPSource(100)
+        async for frame in aiter_frames(source, prefetch=2):
+            break
+        assert source.read <= 3
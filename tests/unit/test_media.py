@@ -0,0 +1,231 @@
+import base64
+import io
+import json
+from unittest.mock import Mock
+from urllib.parse import unquote
+
+import pytest
+import httpx
+from fastapi.testclient import TestClient
+
+from mcp_sdk.client import MCPClient
+from mcp_sdk.exceptions import MCPError, MCPValidationError
+from mcp_sdk.media import MediaBody
+from mcp_sdk.models import MCPResponse
+from mcp_sdk.products.image import ImageClient
+from mcp_sdk.server import MCPServer, ServerConfig
+
+def _response(content):
+    return {"id": "m1", "model": "image", "content": content,
+            "created_at": "2024-01-01T00:00:00", "usage": {}}
+
+class _Stream:
+    """A file object that can only be read once."""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._data.read(size)
+
+class TestMediaBody:
+    """Tests for streaming media sources."""
+
+    def test_bytes(self):
+        """Test that bytes are sliced without copying."""
+        data = bytearray(b"abcdefgh")
+        body = MediaBody(data, chunk_size=3)
+        chunks = list(body.chunks())
+
+        assert [bytes(chunk) for chunk in chunks] == [b"abc", b"def", b"gh"]
+        assert all(isinstance(chunk, memoryview) for chunk in chunks)
+        assert body.size == 8
+        assert body.content_type == "application/octet-stream"
+
+    def test_path_is_memory_mapped(self, tmp_path):
+        """Test that files are memory-mapped and typed from their name."""
+        path = tmp_path / "photo.png"
+        path.write_bytes(b"\x89PNG" + b"x" * 100)
+
+        with MediaBody(path, chunk_size=64) as body:
+            assert body.size == 104
+            assert body.filename == "photo.png"
+            assert body.content_type == "image/png"
+            assert b"".join(body.chunks()) == path.read_bytes()
+
+    def test_file_object_from_position(self, tmp_path):
+        """Test that an open file is sent from its current position."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"0123456789")
+
+        with open(path, "rb") as f:
+            f.seek(4)
+            with MediaBody(f) as body:
+                assert body.size == 6
+                assert b"".join(body.chunks()) == b"456789"
+
+    def test_bytes_io(self):
+        """Test that in-memory buffers are read through their buffer."""
+        buffer = io.BytesIO(b"hello")
+        with MediaBody(buffer) as body:
+            assert body.replayable
+            assert b"".join(body.chunks()) == b"hello"
+        buffer.write(b"!")
+
+    def test_plain_stream(self):
+        """Test that plain streams are read in chunks and sent once."""
+        body = MediaBody(_Stream(b"stream"), chunk_size=4)
+
+        assert body.size is None
+        assert not body.replayable
+        assert list(body.chunks()) == [b"stre", b"am"]
+
+    def test_unsupported_source(self):
+        """Test that unsupported sources are rejected."""
+        with pytest.raises(TypeError):
+            MediaBody(12345)
+
+class TestSendMedia:
+    """Tests for raw media uploads from the client."""
+
+    @staticmethod
+    def _client(handler):
+        return MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+    @pytest.mark.asyncio
+    async def test_raw_upload(self, tmp_path):
+        """Test that media is sent as a raw body with its parameters in a header."""
+        path = tmp_path / "cat.jpg"
+        path.write_bytes(b"j" * 5000)
+        sent = []
+
+        def handler(request):
+            sent.append((request, request.read()))
+            return httpx.Response(200, json=_response("ok"))
+
+        client = self._client(handler)
+        result = await client.send_media(path, params={"operation": "analyze", "prompt": "héllo"})
+
+        request, content = sent[0]
+        assert result.data.content == "ok"
+        assert request.url.path == "/api/v1/process:media"
+        assert content == b"j" * 5000
+        assert request.headers["content-type"] == "image/jpeg"
+        assert request.headers["content-length"] == "5000"
+        assert unquote(request.headers["x-mcp-filename"]) == "cat.jpg"
+        assert json.loads(unquote(request.headers["x-mcp-params"])) == {"operation": "analyze", "prompt": "héllo"}
+
+    @pytest.mark.asyncio
+    async def test_one_shot_stream_not_retried(self):
+        """Test that a stream that cannot be rewound is sent only once."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.read())
+            return httpx.Response(503, headers={"Retry-After": "0"})
+
+        client = self._client(handler)
+        with pytest.raises(MCPError):
+            await client.send_media(_Stream(b"data"))
+        assert calls == [b"data"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_media(self, tmp_path):
+        """Test that a missing file is reported as a validation error."""
+        client = self._client(lambda request: httpx.Response(200))
+        with pytest.raises(MCPValidationError):
+            await client.send_media(tmp_path / "missing.png")
+
+class TestMediaRoute:
+    """Tests for receiving raw media uploads on the server."""
+
+    @staticmethod
+    def _server(**config):
+        server = MCPServer(ServerConfig(media_spool_size=16, **config))
+        received = {}
+
+        async def analyze(upload, client_info):
+            received["rolled"] = upload.file._rolled
+            received["data"] = upload.file.read()
+            received["params"] = upload.params
+            received["filename"] = upload.filename
+            return MCPResponse(**_response(f"{upload.size} bytes of {upload.content_type}"))
+
+        server.register_media_handler("analyze", analyze)
+        return server, received
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        """Test that a client upload reaches the handler through a spooled buffer."""
+        server, received = self._server()
+        client = MCPClient(
+            api_key="test-api-key",
+            endpoint="http://testserver",
+            http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app)),
+        )
+
+        result = await client.send_media(b"p" * 100, params={"operation": "analyze"},
+                                         content_type="image/png")
+
+        assert result.data.content == "100 bytes of image/png"
+        assert received["data"] == b"p" * 100
+        assert received["rolled"]
+        assert received["params"] == {"operation": "analyze"}
+
+    def test_unsupported_operation(self):
+        """Test that uploads for operations without a handler are rejected."""
+        server, _ = self._server()
+        response = TestClient(server.app).post(
+            "/api/v1/process:media", content=b"x", headers={"X-MCP-Params": "%7B%22operation%22%3A%22edit%22%7D"}
+        )
+        assert response.status_code == 400
+
+    def test_too_large(self):
+        """Test that uploads above the maximum size are rejected."""
+        server, received = self._server(max_media_size=10)
+        response = TestClient(server.app).post(
+            "/api/v1/process:media", content=b"x" * 11, headers={"X-MCP-Params": "%7B%22operation%22%3A%22analyze%22%7D"}
+        )
+        assert response.status_code == 413
+        assert not received
+
+class TestImageClient:
+    """Tests for image uploads from the image product client."""
+
+    def _client(self):
+        base = MCPClient(api_key="test-api-key", endpoint="https://api.example.com")
+        base.send_media_sync = Mock(return_value=Mock(data="result"))
+        return ImageClient(base), base.send_media_sync
+
+    def test_base64_uploaded_as_bytes(self):
+        """Test that base64 strings are decoded and sent through the upload path."""
+        images, send = self._client()
+
+        assert images.analyze(base64.b64encode(b"png").decode()) == "result"
+        assert send.call_args.args[0] == b"png"
+        assert send.call_args.kwargs["params"]["operation"] == "analyze"
+        assert "image" not in send.call_args.kwargs["params"]
+
+    def test_path(self, tmp_path):
+        """Test that Path objects are uploaded from the file."""
+        images, send = self._client()
+        path = tmp_path / "image.png"
+        path.write_bytes(b"png")
+
+        images.resize(path, size="512x512")
+        assert send.call_args.args[0] is path
+        assert send.call_args.kwargs["params"]["size"] == "512x512"
+
+    def test_str_path_not_guessed(self, tmp_path):
+        """Test that a str naming a file is not mistaken for a path."""
+        images, send = self._client()
+        path = tmp_path / "image.png"
+        path.write_bytes(b"png")
+
+        with pytest.raises(MCPValidationError):
+            images.analyze(str(path))
+        assert not send.called
@@ -109,6 +109,30 @@ class TestMessages:
         assert response.result.language == "en"
         assert response.result.confidence > 0
 
+    @pytest.mark.asyncio
+    async def test_text_handler_stream(self, text_message):
+        """Test TextHandler streaming partial results."""
+        handler = TextHandler()
+        chunks = [result async for result in handler.stream(text_message)]
+
+        assert len(chunks) == 2
+        assert all(isinstance(chunk, TextResult) for chunk in chunks)
+        assert "".join(chunk.processed_text for chunk in chunks) == "HELLO, WORLD!"
+
+    @pytest.mark.asyncio
+    async def test_message_processor_stream_default(self, text_message):
+        """Test that handlers without incremental output stream a single result."""
+        class WholeTextHandler(TextHandler):
+            stream = MessageHandler.stream
+
+        processor = MessageProcessor()
+        processor.register_handler(WholeTextHandler())
+
+        chunks = [result async for result in processor.stream(text_message)]
+
+        assert len(chunks) == 1
+        assert chunks[0].processed_text == "HELLO, WORLD!"
+
     def test_message_processor_registration(self):
         """Test registering handlers with MessageProcessor."""
         processor = MessageProcessor()
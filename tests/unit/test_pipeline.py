@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mcp_sdk.products._pipeline import aordered_map, check_pool, ordered_map
+
+class TestOrderedMap:
+    """Tests for the ordered parallel map behind frames and transcripts."""
+
+    def test_input_order(self):
+        """Test that results come back in input order whatever finishes first."""
+        def work(n):
+            time.sleep(0.01 * (4 - n))
+            return n * n
+
+        results = list(ordered_map(iter(range(5)), work, max_workers=3, prefetch=3))
+        assert results == [(n, n * n) for n in range(5)]
+
+    def test_bounded_prefetch(self):
+        """Test that at most prefetch items are drawn ahead of the consumer."""
+        drawn = []
+
+        def items():
+            for n in range(10):
+                drawn.append(n)
+                yield n
+
+        results = ordered_map(items(), lambda n: n, max_workers=2, prefetch=3)
+        assert next(results) == (0, 0)
+        assert len(drawn) == 3
+        results.close()
+
+    def test_check_pool(self):
+        """Test that prefetch defaults to the number of workers."""
+        assert check_pool(3) == 3
+        assert check_pool(3, 5) == 5
+        with pytest.raises(ValueError):
+            check_pool(0)
+        with pytest.raises(ValueError):
+            check_pool(2, 0)
+
+    @pytest.mark.asyncio
+    async def test_async_threads(self):
+        """Test that a plain function runs off the event loop."""
+        loop_thread = threading.get_ident()
+        threads = set()
+
+        def work(n):
+            threads.add(threading.get_ident())
+            return -n
+
+        results = [pair async for pair in aordered_map(iter(range(4)), work, 2, 2)]
+        assert results == [(n, -n) for n in range(4)]
+        assert loop_thread not in threads
+
+    @pytest.mark.asyncio
+    async def test_async_coroutine(self):
+        """Test that a coroutine function runs at most max_workers calls at once."""
+        active = peak = 0
+
+        async def work(n):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01 * (3 - n % 3))
+            active -= 1
+            return n
+
+        results = [n async for n, _ in aordered_map(iter(range(6)), work, 2, 4)]
+        assert results == list(range(6))
+        assert peak == 2
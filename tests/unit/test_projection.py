@@ -0,0 +1,113 @@
+import json
+
+import pytest
+import httpx
+
+from mcp_sdk.client import MCPClient
+from mcp_sdk.models import Commit, ServerOptions
+from mcp_sdk.projection import build_field_tree, partial_model, project, resolve_model
+from mcp_sdk.shared._pydantic_utils import model_fields
+
+SHA = "0123456789abcdef0123456789abcdef01234567"
+
+class TestFieldTree:
+    """Tests for parsing field paths."""
+
+    def test_nested_paths(self):
+        """Test that dotted paths are merged into one tree."""
+        tree = build_field_tree(["sha", "author.name", "author.email", "files.filename"])
+
+        assert tree == {
+            "sha": None,
+            "author": {"name": None, "email": None},
+            "files": {"filename": None},
+        }
+
+    def test_whole_field_wins(self):
+        """Test that selecting a parent selects all of its subfields."""
+        assert build_field_tree(["author", "author.name"]) == {"author": None}
+        assert build_field_tree(["author.name", "author"]) == {"author": None}
+
+    def test_invalid_path(self):
+        """Test that empty path segments are rejected."""
+        with pytest.raises(ValueError):
+            build_field_tree(["author..name"])
+
+class TestProject:
+    """Tests for trimming payloads."""
+
+    def test_project_model(self, make_commit_data):
+        """Test that a model is trimmed to the selected fields."""
+        commit = Commit(**make_commit_data(SHA))
+
+        result = project(commit, ["sha", "author.name", "files.filename"])
+
+        assert result == {
+            "sha": SHA,
+            "author": {"name": "Test Author"},
+            "files": [{"filename": "README.md"}],
+        }
+
+    def test_project_dict(self, make_commit_data):
+        """Test that plain dicts are trimmed and unknown fields ignored."""
+        result = project(make_commit_data(SHA), ["sha", "stats", "missing"])
+
+        assert set(result) == {"sha", "stats"}
+        assert result["stats"] == make_commit_data(SHA)["stats"]
+
+class TestPartialModel:
+    """Tests for partial model generation."""
+
+    def test_validates_projected_payload(self, make_commit_data):
+        """Test that a projected payload validates and skips other fields."""
+        model = partial_model(Commit, ["sha", "author.name", "files.filename"])
+        payload = project(make_commit_data(SHA), ["sha", "author.name", "files.filename"])
+
+        commit = model(**payload)
+
+        assert commit.sha == SHA
+        assert commit.author.name == "Test Author"
+        assert commit.files[0].filename == "README.md"
+        assert not hasattr(commit, "message")
+        assert set(model_fields(model)) == {"sha", "author", "files"}
+
+    def test_cached_per_selection(self):
+        """Test that equivalent selections share one model."""
+        assert partial_model(Commit, ["sha", "message"]) is partial_model(Commit, ["message", "sha"])
+
+    def test_unknown_field(self):
+        """Test that unknown fields are rejected."""
+        with pytest.raises(ValueError):
+            partial_model(Commit, ["sha", "nope"])
+        with pytest.raises(ValueError):
+            partial_model(Commit, ["sha.length"])
+
+    def test_resolve_without_fields(self):
+        """Test that the full model is used when no fields are selected."""
+        assert resolve_model(Commit) is Commit
+        assert resolve_model(Commit, []) is Commit
+
+    @pytest.mark.asyncio
+    async def test_get_commit_with_fields(self, make_commit_data):
+        """Test that the client parses projected commits into a partial model."""
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            return httpx.Response(200, json={
+                "data": project(make_commit_data(SHA), ["sha", "author.name"]),
+                "metadata": {"id": SHA, "version": "1", "status": "success"},
+                "links": {"self": str(request.url)},
+            })
+
+        client = MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        result = await client.get_commit(SHA, ServerOptions(fields=["sha", "author.name"]))
+
+        assert result.data.sha == SHA
+        assert result.data.author.name == "Test Author"
+        assert not hasattr(result.data, "files")
+        assert json.loads(sent[0].content)["options"]["fields"] == ["sha", "author.name"]
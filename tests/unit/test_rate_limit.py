@@ -0,0 +1,158 @@
+import asyncio
+import time
+
+import pytest
+import httpx
+
+from mcp_sdk.client import MCPClient
+from mcp_sdk.exceptions import MCPRateLimitError
+from mcp_sdk.models import MCPRequest
+from mcp_sdk.rate_limit import AdaptiveRateLimiter, parse_retry_after
+
+class TestParseRetryAfter:
+    """Tests for Retry-After parsing."""
+
+    def test_seconds(self):
+        """Test delta-seconds values."""
+        assert parse_retry_after("2.5") == 2.5
+        assert parse_retry_after("-1") == 0.0
+
+    def test_http_date(self):
+        """Test HTTP-date values."""
+        assert parse_retry_after("Mon, 01 Jan 2024 00:00:00 GMT") == 0.0
+
+    def test_invalid(self):
+        """Test missing and malformed values."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+class TestAdaptiveRateLimiter:
+    """Tests for the AdaptiveRateLimiter class."""
+
+    def test_burst_then_queue(self):
+        """Test that callers beyond the burst reserve successive slots."""
+        limiter = AdaptiveRateLimiter(initial_rate=10.0, burst=2)
+
+        delays = [limiter.reserve("api") for _ in range(4)]
+
+        assert delays[:2] == [0.0, 0.0]
+        assert delays[2] == pytest.approx(0.1, abs=0.01)
+        assert delays[3] == pytest.approx(0.2, abs=0.01)
+
+    def test_aimd(self):
+        """Test additive increase and a single multiplicative decrease per interval."""
+        limiter = AdaptiveRateLimiter(initial_rate=10.0, decrease_interval=60.0)
+        limiter.record_success("api")
+        assert limiter.metrics()["api"]["rate"] == pytest.approx(10.1)
+
+        limiter.record_throttle("api")
+        limiter.record_throttle("api")
+        metrics = limiter.metrics("api")["api"]
+        assert metrics["rate"] == pytest.approx(5.05)
+        assert metrics["throttled"] == 2
+
+    def test_retry_after_pauses_bucket(self):
+        """Test that Retry-After delays the next reservation."""
+        limiter = AdaptiveRateLimiter(burst=5)
+        limiter.record_throttle("api", retry_after=0.5)
+
+        assert limiter.reserve("api") >= 0.45
+        assert limiter.reserve("other") == 0.0
+
+    def test_rate_bounds(self):
+        """Test that the learned rate stays within its bounds."""
+        limiter = AdaptiveRateLimiter(initial_rate=1.0, min_rate=0.5, max_rate=1.2, decrease_interval=0)
+        for _ in range(10):
+            limiter.record_success("api")
+        assert limiter.metrics()["api"]["rate"] == 1.2
+
+        for _ in range(10):
+            limiter.record_throttle("api")
+        assert limiter.metrics()["api"]["rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_queue_depth(self):
+        """Test that waiting callers are reported as queue depth."""
+        limiter = AdaptiveRateLimiter(initial_rate=10.0, burst=1)
+        await limiter.acquire("api")
+
+        waiters = [asyncio.ensure_future(limiter.acquire("api")) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert limiter.metrics()["api"]["queue_depth"] == 3
+
+        await asyncio.gather(*waiters)
+        assert limiter.metrics()["api"]["queue_depth"] == 0
+
+    def test_invalid_configuration(self):
+        """Test that inconsistent settings are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter(initial_rate=0.1, min_rate=1.0)
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter(decrease_factor=1.5)
+
+    @pytest.mark.asyncio
+    async def test_client_queues_on_429(self):
+        """Test that a throttled request waits for Retry-After and succeeds."""
+        calls = []
+
+        def handler(request):
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0.1"})
+            return httpx.Response(200, json={
+                "data": {"id": "r1", "model": "m", "content": "ok",
+                         "created_at": "2024-01-01T00:00:00", "usage": {}},
+                "metadata": {"id": "r1", "version": "1", "status": "success"},
+                "links": {"self": str(request.url)},
+            })
+
+        limiter = AdaptiveRateLimiter()
+        client = MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            rate_limiter=limiter,
+        )
+        response = await client.send(MCPRequest(model="text:gpt-4", context="hi", settings={}))
+
+        assert response.data.content == "ok"
+        assert len(calls) == 2
+        assert calls[1] - calls[0] >= 0.09
+        metrics = limiter.metrics()["https://api.example.com"]
+        assert metrics["throttled"] == 1
+        assert metrics["rate"] < 10.0
+
+    @pytest.mark.parametrize("header, expected", [
+        ("1.5", 2),
+        ("Mon, 01 Jan 2024 00:00:00 GMT", 0),
+        ("soon", None),
+    ])
+    def test_rate_limit_error_parses_retry_after(self, header, expected):
+        """Test that fractional and HTTP-date Retry-After values survive as MCPRateLimitError."""
+        client = MCPClient(api_key="test-api-key", endpoint="https://api.example.com")
+
+        error = client._error_for_status(429, retry_after=header)
+
+        assert isinstance(error, MCPRateLimitError)
+        assert error.retry_after == expected
+
+    @pytest.mark.asyncio
+    async def test_client_stops_after_throttle_budget(self):
+        """Test that a 429 is not retried again once the limiter gives up."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429, headers={"Retry-After": "0"})
+
+        limiter = AdaptiveRateLimiter(max_throttled_attempts=2)
+        client = MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            rate_limiter=limiter,
+        )
+        with pytest.raises(MCPRateLimitError):
+            await client.send(MCPRequest(model="text:gpt-4", context="hi", settings={}))
+
+        assert len(calls) == 3
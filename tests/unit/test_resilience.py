@@ -0,0 +1,260 @@
+import asyncio
+
+import pytest
+import httpx
+
+from mcp_sdk.client import MCPClient, RequestOptions
+from mcp_sdk.exceptions import MCPCircuitOpenError
+from mcp_sdk.resilience import CircuitBreaker, CircuitState, HedgingPolicy
+
+def _commit_payload(make_commit_data, sha="abc"):
+    commit = make_commit_data(sha)
+    return {
+        "data": commit,
+        "metadata": {"id": sha, "version": "1", "status": "success"},
+        "links": {"self": commit["url"]},
+    }
+
+def _client(handler, **kwargs):
+    return MCPClient(
+        api_key="test-api-key",
+        endpoint="https://api.example.com",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        options=RequestOptions(retry_count=0),
+        **kwargs
+    )
+
+class TestCircuitBreaker:
+    """Tests for the CircuitBreaker class."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the circuit opens at the failure threshold."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.before_call("api")
+        breaker.record_failure("api")
+        breaker.before_call("api")
+        breaker.record_success("api")
+        breaker.before_call("api")
+        breaker.record_failure("api")
+        assert breaker.state("api") is CircuitState.CLOSED
+
+        breaker.before_call("api")
+        breaker.record_failure("api")
+        assert breaker.state("api") is CircuitState.OPEN
+        with pytest.raises(MCPCircuitOpenError) as exc_info:
+            breaker.before_call("api")
+        assert exc_info.value.endpoint == "api"
+        assert exc_info.value.retry_after > 0
+
+    def test_half_open_probing(self):
+        """Test that a half-open circuit admits limited probes and closes on success."""
+        transitions = []
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.add_listener(transitions.append)
+        breaker.before_call("api")
+        breaker.record_failure("api")
+
+        breaker.before_call("api")
+        with pytest.raises(MCPCircuitOpenError):
+            breaker.before_call("api")
+        breaker.record_success("api")
+
+        assert breaker.states() == {"api": "closed"}
+        assert [(t.previous, t.state) for t in transitions] == [
+            (CircuitState.CLOSED, CircuitState.OPEN),
+            (CircuitState.OPEN, CircuitState.HALF_OPEN),
+            (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+        ]
+
+    def test_failed_probe_reopens(self):
+        """Test that a failed probe opens the circuit again."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.before_call("api")
+        breaker.record_failure("api")
+        breaker.before_call("api")
+        breaker.reset_timeout = 60
+        breaker.record_failure("api")
+
+        assert breaker.state("api") is CircuitState.OPEN
+
+    def test_release_frees_probe(self):
+        """Test that a cancelled probe does not block the next one."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.before_call("api")
+        breaker.record_failure("api")
+        breaker.before_call("api")
+        breaker.release("api")
+
+        breaker.before_call("api")
+
+    def test_allows(self):
+        """Test that checking a circuit takes no probe slot."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        assert breaker.allows("api")
+        breaker.before_call("api")
+        breaker.record_failure("api")
+
+        assert breaker.allows("api")
+        assert breaker.allows("api")
+        breaker.before_call("api")
+        assert not breaker.allows("api")
+
+    @pytest.mark.asyncio
+    async def test_client_fails_over(self, make_commit_data):
+        """Test that an open circuit sends the request to another replica."""
+        hosts = []
+
+        def handler(request):
+            hosts.append(request.url.host)
+            return httpx.Response(200, json=_commit_payload(make_commit_data))
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.before_call("https://a.example.com")
+        breaker.record_failure("https://a.example.com")
+        client = MCPClient(
+            api_key="test-api-key",
+            endpoint=["https://a.example.com", "https://b.example.com"],
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            options=RequestOptions(retry_count=0),
+            circuit_breaker=breaker,
+        )
+        for _ in range(5):
+            await client.get_commit("abc")
+        assert hosts == ["b.example.com"] * 5
+
+        # Even when picked, the open replica is skipped without using a retry
+        endpoints = ["https://a.example.com", "https://b.example.com"]
+        client._choose_endpoint = lambda exclude=(): next(e for e in endpoints if e not in exclude)
+        await client.get_commit("abc")
+        assert hosts == ["b.example.com"] * 6
+
+    @pytest.mark.asyncio
+    async def test_client_fails_fast(self, make_commit_data):
+        """Test that the client stops calling a failing endpoint."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        client = _client(handler, circuit_breaker=CircuitBreaker(failure_threshold=2))
+        for _ in range(2):
+            with pytest.raises(Exception):
+                await client.get_commit("abc")
+        with pytest.raises(MCPCircuitOpenError):
+            await client.get_commit("abc")
+
+        assert len(calls) == 2
+
+class TestHedgingPolicy:
+    """Tests for the HedgingPolicy class."""
+
+    def test_delay_from_percentile(self):
+        """Test that the hedge delay follows the latency percentile."""
+        policy = HedgingPolicy(percentile=90, min_samples=10, min_delay=0)
+        assert policy.delay("api") == policy.initial_delay
+
+        for i in range(1, 11):
+            policy.record("api", i / 100)
+        assert policy.delay("api") == pytest.approx(0.09)
+
+    def test_applies_to_idempotent_methods(self):
+        """Test the default method filter."""
+        policy = HedgingPolicy()
+        assert policy.applies("get")
+        assert not policy.applies("POST")
+
+    @pytest.mark.asyncio
+    async def test_straggler_is_hedged(self, make_commit_data):
+        """Test that a duplicate is sent and the faster response wins."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                await asyncio.sleep(1)
+            return httpx.Response(200, json=_commit_payload(make_commit_data))
+
+        policy = HedgingPolicy(initial_delay=0.02)
+        client = _client(handler, hedging=policy)
+        result = await asyncio.wait_for(client.get_commit("abc"), timeout=0.5)
+
+        assert result.data.sha == "abc"
+        assert len(calls) == 2
+        assert policy.hedged == 1
+
+    @pytest.mark.asyncio
+    async def test_hedges_go_through_breaker(self, make_commit_data):
+        """Test that duplicates are admitted by the breaker and report their outcome."""
+        calls = []
+        events = []
+
+        class Breaker(CircuitBreaker):
+            def before_call(self, endpoint):
+                events.append(("before_call", endpoint))
+                super().before_call(endpoint)
+
+            def record_success(self, endpoint):
+                events.append(("record_success", endpoint))
+                super().record_success(endpoint)
+
+        async def handler(request):
+            calls.append(request.url.host)
+            if len(calls) == 1:
+                await asyncio.sleep(0.2)
+            return httpx.Response(200, json=_commit_payload(make_commit_data))
+
+        client = MCPClient(
+            api_key="test-api-key",
+            endpoint=["https://a.example.com", "https://b.example.com"],
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            options=RequestOptions(retry_count=0),
+            hedging=HedgingPolicy(initial_delay=0.02),
+            circuit_breaker=Breaker(),
+        )
+        await client.get_commit("abc")
+
+        first, hedge = (f"https://{host}" for host in calls)
+        assert first != hedge
+        assert events == [("before_call", first), ("before_call", hedge), ("record_success", hedge)]
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_to_open_circuit(self, make_commit_data):
+        """Test that duplicates are not sent to replicas whose circuit is open."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request.url.host)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=_commit_payload(make_commit_data))
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.before_call("https://b.example.com")
+        breaker.record_failure("https://b.example.com")
+        client = MCPClient(
+            api_key="test-api-key",
+            endpoint=["https://a.example.com", "https://b.example.com"],
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            options=RequestOptions(retry_count=0),
+            hedging=HedgingPolicy(initial_delay=0.01),
+            circuit_breaker=breaker,
+        )
+        await client.get_commit("abc")
+
+        assert "b.example.com" not in calls
+
+    @pytest.mark.asyncio
+    async def test_fast_response_not_hedged(self, make_commit_data):
+        """Test that responses within the hedge delay are not duplicated."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json=_commit_payload(make_commit_data))
+
+        policy = HedgingPolicy(initial_delay=0.5)
+        client = _client(handler, hedging=policy)
+        await client.get_commit("abc")
+
+        assert len(calls) == 1
+        assert policy.hedged == 0
@@ -3,7 +3,7 @@ from unittest.mock import patch, Mock, AsyncMock
 import uuid
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.testclient import TestClient
 import requests
 
@@ -311,3 +311,78 @@ class TestServer:
                 break
         
         assert middleware_added, "CORS middleware not added to the server"
+
+    def test_health_route(self):
+        """Test the health check route used by client-side load balancing."""
+        client = TestClient(MCPServer().app)
+
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    def test_json_codec_config(self):
+        """Test that responses are rendered with the configured codec."""
+        server = MCPServer(ServerConfig(json_codec="json"))
+        client = TestClient(server.app)
+
+        assert server.codec.name == "json"
+        assert client.get("/health").content == b'{"status":"ok"}'
+
+class TestConditionalResponses:
+    """Tests for ETag support on resource responses."""
+
+    @staticmethod
+    def _client(version="3"):
+        from mcp_sdk.resources import ResourceResponse
+        server = MCPServer()
+        state = {"version": version}
+
+        @server.app.get("/resource")
+        async def get_resource(request: Request):
+            resource = ResourceResponse[MCPResponse](
+                data=MCPResponse(id="r1", model="m", content="c", created_at="2024-01-01T00:00:00", usage={}),
+                metadata={"id": "r1", "version": state["version"], "status": "success",
+                          "updated_at": datetime(2024, 1, 2, 12, 0, 0)},
+                links={"self": "/resource"},
+            )
+            return server.conditional_response(request, resource)
+
+        return TestClient(server.app), state
+
+    def test_etag_from_version(self):
+        """Test that the ETag is derived from the metadata version."""
+        client, _ = self._client()
+        response = client.get("/resource")
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == 'W/"3"'
+        assert response.headers["last-modified"] == "Tue, 02 Jan 2024 12:00:00 GMT"
+        assert response.json()["data"]["id"] == "r1"
+
+    def test_if_none_match(self):
+        """Test that a matching If-None-Match yields 304 until the version changes."""
+        client, state = self._client()
+        etag = client.get("/resource").headers["etag"]
+
+        not_modified = client.get("/resource", headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+
+        state["version"] = "4"
+        changed = client.get("/resource", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] == 'W/"4"'
+
+    def test_if_modified_since(self):
+        """Test Last-Modified based revalidation."""
+        client, _ = self._client()
+
+        assert client.get("/resource", headers={"If-Modified-Since": "Tue, 02 Jan 2024 12:00:00 GMT"}).status_code == 304
+        assert client.get("/resource", headers={"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}).status_code == 200
+
+    def test_unsafe_version_is_hashed(self):
+        """Test that versions that cannot appear in an ETag are hashed."""
+        client, _ = self._client(version='v "2"')
+
+        etag = client.get("/resource").headers["etag"]
+        assert etag.startswith('W/"') and '"2"' not in etag
@@ -0,0 +1,531 @@
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+
+from tests.utils import mcp_types
+
+mcp_types.install()
+
+from mcp_sdk.exceptions import MCPTimeoutError
+from mcp_sdk.shared.exceptions import McpError
+from mcp_sdk.shared.message import SessionMessage
+from mcp_sdk.shared.session import BaseSession, DispatchMode
+from mcp_sdk.types import (
+    CallToolRequest,
+    ClientNotification,
+    ClientRequest,
+    EmptyResult,
+    JSONRPCMessage,
+    JSONRPCResponse,
+    PingRequest,
+    RequestParams,
+    ServerNotification,
+    ServerRequest,
+    ServerResult,
+)
+
+
+class _Server(BaseSession):
+    """Session answering each request with whatever its handler returns."""
+
+    def __init__(self, read_stream, write_stream, handler, **kwargs):
+        super().__init__(
+            read_stream,
+            write_stream,
+            ClientRequest,
+            ClientNotification,
+            heartbeat_interval=0,
+            reconnect_attempts=0,
+            **kwargs,
+        )
+        self.handler = handler
+        self.cancelled = []
+
+    async def _received_request(self, responder):
+        with responder:
+            result = await self.handler(responder.request.root)
+            await responder.respond(ServerResult(EmptyResult(**(result or {}))))
+        if responder.cancelled:
+            self.cancelled.append(responder.request_id)
+
+
+class _Client(BaseSession):
+    """Session recording whatever reaches its generic handler."""
+
+    def __init__(self, read_stream, write_stream, **kwargs):
+        super().__init__(
+            read_stream,
+            write_stream,
+            ServerRequest,
+            ServerNotification,
+            heartbeat_interval=0,
+            reconnect_attempts=0,
+            **kwargs,
+        )
+        self.incoming = []
+
+    async def _handle_incoming(self, req):
+        self.incoming.append(req)
+
+
+@asynccontextmanager
+async def _connected(handler, client_options=None, **server_options):
+    client_send, server_read = anyio.create_memory_object_stream(100)
+    server_send, client_read = anyio.create_memory_object_stream(100)
+    server = _Server(server_read, server_send, handler, **server_options)
+    client = _Client(client_read, client_send, **(client_options or {}))
+    async with server, client:
+        yield client, server
+
+
+def _call(n):
+    return ClientRequest(
+        CallToolRequest(method="tools/call", params=RequestParams(n=n))
+    )
+
+
+def _ping():
+    return ClientRequest(PingRequest(method="ping"))
+
+
+class TestDispatch:
+    """Tests for the dispatch of incoming requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent(self):
+        """Test that a slow handler does not hold up the other requests."""
+        started = []
+        release = anyio.Event()
+
+        async def handler(request):
+            started.append(request.params.n)
+            await release.wait()
+
+        async with _connected(handler) as (client, server):
+            async with anyio.create_task_group() as tg:
+                for n in range(3):
+                    tg.start_soon(client.send_request, _call(n), EmptyResult)
+                with anyio.fail_after(1):
+                    while len(started) < 3:
+                        await anyio.sleep(0.01)
+                assert server.metrics["requests_active"] == 3
+                release.set()
+
+        assert sorted(started) == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_session_limit(self):
+        """Test that at most max_concurrent_requests handlers run at once."""
+        active = peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await anyio.sleep(0.02)
+            active -= 1
+
+        async with _connected(handler, max_concurrent_requests=2) as (client, _):
+            async with anyio.create_task_group() as tg:
+                for n in range(5):
+                    tg.start_soon(client.send_request, _call(n), EmptyResult)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_method_limit(self):
+        """Test that a method limit does not hold up other methods."""
+        calls = 0
+        release = anyio.Event()
+
+        async def handler(request):
+            nonlocal calls
+            if request.method == "tools/call":
+                calls += 1
+                assert calls == 1
+                await release.wait()
+                calls -= 1
+
+        async with _connected(handler, method_concurrency={"tools/call": 1}) as (
+            client,
+            _,
+        ):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(client.send_request, _call(0), EmptyResult)
+                tg.start_soon(client.send_request, _call(1), EmptyResult)
+                with anyio.fail_after(1):
+                    await client.send_request(_ping(), EmptyResult)
+                release.set()
+
+    @pytest.mark.asyncio
+    async def test_ordered_methods(self):
+        """Test that ordered methods run one at a time, in arrival order."""
+        events = []
+
+        async def handler(request):
+            if request.method == "ping":
+                events.append("ping")
+                return
+            n = request.params.n
+            events.append(("start", n))
+            await anyio.sleep(0.03 - n * 0.01)
+            events.append(("end", n))
+
+        async with _connected(handler, ordered_methods={"tools/call"}) as (client, _):
+            async with anyio.create_task_group() as tg:
+                for n in range(3):
+                    tg.start_soon(client.send_request, _call(n), EmptyResult)
+                    await anyio.sleep(0.001)
+                await client.send_request(_ping(), EmptyResult)
+
+        calls = [event for event in events if event != "ping"]
+        assert calls == [(step, n) for n in range(3) for step in ("start", "end")]
+        # Unordered methods are not queued behind them
+        assert events.index("ping") < events.index(("end", 2))
+
+    @pytest.mark.asyncio
+    async def test_inline(self):
+        """Test that inline mode handles requests one at a time."""
+        active = peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await anyio.sleep(0.01)
+            active -= 1
+
+        async with _connected(handler, dispatch_mode=DispatchMode.INLINE) as (
+            client,
+            _,
+        ):
+            async with anyio.create_task_group() as tg:
+                for n in range(3):
+                    tg.start_soon(client.send_request, _call(n), EmptyResult)
+
+        assert peak == 1
+
+
+    @pytest.mark.asyncio
+    async def test_failed_reply_keeps_session(self):
+        """Test that a request whose replies cannot be written does not end the session."""
+
+        async def handler(request):
+            return None
+
+        async with _connected(handler) as (client, server):
+            send_message = server._send_message
+            failures = []
+
+            async def fail_twice(message):
+                # The result and then the error reply are lost
+                if len(failures) < 2:
+                    failures.append(message)
+                    raise ConnectionError("write failed")
+                await send_message(message)
+
+            server._send_message = fail_twice
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(client.send_request, _call(0), EmptyResult)
+                with anyio.fail_after(1):
+                    while len(failures) < 2:
+                        await anyio.sleep(0.01)
+                    await client.send_request(_ping(), EmptyResult)
+                tg.cancel_scope.cancel()
+
+            assert server.metrics["request_errors"] == 1
+
+
+class TestResponseCorrelation:
+    """Tests for matching responses to the requests awaiting them."""
+
+    @pytest.mark.asyncio
+    async def test_out_of_order(self):
+        """Test that each response resolves the request it answers."""
+
+        async def handler(request):
+            n = request.params.n
+            await anyio.sleep(0.03 - n * 0.01)
+            return {"n": n}
+
+        results = {}
+
+        async def call(client, n):
+            results[n] = await client.send_request(_call(n), EmptyResult)
+
+        async with _connected(handler) as (client, _):
+            async with anyio.create_task_group() as tg:
+                for n in range(3):
+                    tg.start_soon(call, client, n)
+
+            assert client._pending == {}
+
+        assert {n: result.n for n, result in results.items()} == {0: 0, 1: 1, 2: 2}
+
+    @pytest.mark.asyncio
+    async def test_unknown_id_ignored(self):
+        """Test that a response nobody waits for leaves pending requests alone."""
+        release = anyio.Event()
+
+        async def handler(request):
+            await release.wait()
+            return {"n": request.params.n}
+
+        async with _connected(handler) as (client, server):
+            async with anyio.create_task_group() as tg:
+                results = []
+
+                async def call():
+                    results.append(await client.send_request(_call(7), EmptyResult))
+
+                tg.start_soon(call)
+                with anyio.fail_after(1):
+                    while not client._pending:
+                        await anyio.sleep(0.01)
+
+                await server._write_stream.send(
+                    SessionMessage(
+                        message=JSONRPCMessage(
+                            JSONRPCResponse(jsonrpc="2.0", id=999, result={"n": -1})
+                        )
+                    )
+                )
+                with anyio.fail_after(1):
+                    while not client.incoming:
+                        await anyio.sleep(0.01)
+                assert len(client._pending) == 1 and not results
+                release.set()
+
+        assert results[0].n == 7
+        assert isinstance(client.incoming[0], RuntimeError)
+
+
+class TestDeadlines:
+    """Tests for request deadlines kept on the session's timer wheel."""
+
+    @pytest.mark.asyncio
+    async def test_inbound_expired(self):
+        """Test that an overdue incoming request is cancelled and answered 408."""
+
+        async def handler(request):
+            await anyio.sleep_forever()
+
+        async with _connected(
+            handler, request_timeout=0.05, deadline_resolution=0.01
+        ) as (client, server):
+            with pytest.raises(McpError) as excinfo:
+                with anyio.fail_after(1):
+                    await client.send_request(_call(0), EmptyResult, timeout=1)
+
+            assert excinfo.value.code == 408
+            assert server.cancelled == [1]
+            assert server._in_flight == {} and server._inbound_deadlines == {}
+            assert server.metrics["requests_expired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_inbound_answered_in_time(self):
+        """Test that a request answered in time leaves no deadline behind."""
+
+        async def handler(request):
+            return {"n": request.params.n}
+
+        async with _connected(
+            handler, request_timeout=0.05, deadline_resolution=0.01
+        ) as (client, server):
+            result = await client.send_request(_call(3), EmptyResult)
+            await anyio.sleep(0.1)
+
+            assert result.n == 3
+            assert server._inbound_deadlines == {}
+            assert server.metrics["requests_expired"] == 0
+
+    @pytest.mark.asyncio
+    async def test_outbound_timeout(self):
+        """Test that an overdue outgoing request fails and the peer is told to drop it."""
+
+        async def handler(request):
+            await anyio.sleep_forever()
+
+        async with _connected(
+            handler, client_options={"deadline_resolution": 0.01}
+        ) as (
+            client,
+            server,
+        ):
+            with pytest.raises(MCPTimeoutError):
+                with anyio.fail_after(1):
+                    await client.send_request(_call(0), EmptyResult, timeout=0.05)
+
+            assert client._pending == {}
+            assert client.metrics["requests_timed_out"] == 1
+            with anyio.fail_after(1):
+                while not server.cancelled:
+                    await anyio.sleep(0.01)
+            assert server.cancelled == [1] and server._in_flight == {}
+
+
+class TestAdmission:
+    """Tests for the queue bounding a session's outgoing requests."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_slot(self):
+        """Test that requests beyond max_in_flight wait instead of failing."""
+        seen = []
+        release = anyio.Event()
+
+        async def handler(request):
+            seen.append(request.params.n)
+            await release.wait()
+
+        async with _connected(handler, client_options={"max_in_flight": 1}) as (
+            client,
+            _,
+        ):
+            async with anyio.create_task_group() as tg:
+                for n in range(2):
+                    tg.start_soon(client.send_request, _call(n), EmptyResult)
+                with anyio.fail_after(1):
+                    while client.metrics["outbound_queue"]["depth"] < 1:
+                        await anyio.sleep(0.01)
+                # The waiting request has not been sent yet
+                assert seen == [0]
+                release.set()
+
+            assert seen == [0, 1]
+            assert client.metrics["outbound_queue"]["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_priority(self):
+        """Test that waiting requests are sent in priority order."""
+        seen = []
+        release = anyio.Event()
+
+        async def handler(request):
+            seen.append(request.params.n)
+            if request.params.n == 0:
+                await release.wait()
+
+        async with _connected(handler, client_options={"max_in_flight": 1}) as (
+            client,
+            _,
+        ):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(client.send_request, _call(0), EmptyResult)
+                await anyio.sleep(0.01)
+                for n, priority in [(1, 0), (2, 0), (3, 5)]:
+                    tg.start_soon(
+                        lambda n=n, priority=priority: client.send_request(
+                            _call(n), EmptyResult, priority=priority
+                        )
+                    )
+                    await anyio.sleep(0.01)
+                release.set()
+
+        assert seen == [0, 3, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_admission_timeout(self):
+        """Test that a request that finds no slot in time is never sent."""
+        seen = []
+        release = anyio.Event()
+
+        async def handler(request):
+            seen.append(request.params.n)
+            await release.wait()
+
+        async with _connected(handler, client_options={"max_in_flight": 1}) as (
+            client,
+            _,
+        ):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(client.send_request, _call(0), EmptyResult)
+                await anyio.sleep(0.01)
+                with pytest.raises(MCPTimeoutError):
+                    await client.send_request(
+                        _call(1), EmptyResult, admission_timeout=0.02
+                    )
+                release.set()
+
+            assert seen == [0]
+            assert client.metrics["outbound_queue"]["timeouts"] == 1
+
+
+class TestBatch:
+    """Tests for JSON-RPC batches."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_order(self):
+        """Test that each request of a batch gets its own result or error."""
+
+        async def handler(request):
+            n = request.params.n
+            if n == 1:
+                raise RuntimeError("boom")
+            await anyio.sleep(0.03 - n * 0.01)
+            return {"n": n}
+
+        async with _connected(handler) as (client, server):
+            with anyio.fail_after(1):
+                results = await client.send_batch(
+                    [(_call(n), EmptyResult) for n in range(3)]
+                )
+
+            assert results[0].n == 0 and results[2].n == 2
+            assert isinstance(results[1], McpError)
+            assert server._batch_replies == {}
+            assert client._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_oversized_batch_split(self):
+        """Test that a batch larger than max_in_flight is sent in parts."""
+        active = peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await anyio.sleep(0.01)
+            active -= 1
+            return {"n": request.params.n}
+
+        async with _connected(handler, client_options={"max_in_flight": 2}) as (
+            client,
+            _,
+        ):
+            with anyio.fail_after(1):
+                results = await client.send_batch(
+                    [(_call(n), EmptyResult) for n in range(5)]
+                )
+
+            assert [result.n for result in results] == list(range(5))
+            assert peak == 2
+            assert client.metrics["outbound_queue"]["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches(self):
+        """Test that batches competing for slots do not deadlock."""
+
+        async def handler(request):
+            await anyio.sleep(0.01)
+            return {"n": request.params.n}
+
+        results = []
+
+        async def batch(client, first):
+            results.extend(
+                await client.send_batch(
+                    [(_call(n), EmptyResult) for n in range(first, first + 2)]
+                )
+            )
+
+        async with _connected(handler, client_options={"max_in_flight": 3}) as (
+            client,
+            _,
+        ):
+            with anyio.fail_after(1):
+                async with anyio.create_task_group() as tg:
+                    for first in (0, 2, 4):
+                        tg.start_soon(batch, client, first)
+
+        assert sorted(result.n for result in results) == list(range(6))
@@ -0,0 +1,127 @@
+import asyncio
+import json
+
+import pytest
+import httpx
+
+from mcp_sdk.client import MCPClient
+from mcp_sdk.exceptions import MCPError
+from mcp_sdk.products.text import TextClient, TextResponse
+from mcp_sdk.server import MCPServer, ServerConfig
+
+def _item(index, request):
+    if "fail" in request["context"]:
+        return {"index": index, "status_code": 400, "error": "bad input"}
+    return {"index": index, "response": {
+        "id": f"r{index}", "model": "text", "content": request["context"].rsplit("\n", 1)[-1].upper(),
+        "created_at": "2024-01-01T00:00:00", "usage": {}}}
+
+class _Progress:
+    """Records the calls a ProgressContext would receive."""
+
+    def __init__(self):
+        self.total = None
+        self.current = 0
+
+    async def set_total(self, total):
+        self.total = total
+
+    async def progress(self, amount=1.0):
+        self.current += amount
+
+class TestTextClientMany:
+    """Tests for the batched TextClient operations."""
+
+    @staticmethod
+    def _client(handler):
+        return TextClient(MCPClient(
+            api_key="test-api-key",
+            endpoint="https://api.example.com",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ))
+
+    @pytest.mark.asyncio
+    async def test_results_in_order(self):
+        """Test that inputs are packed into batches and results come back in order."""
+        batches = []
+
+        def handler(request):
+            requests = json.loads(request.content)["requests"]
+            batches.append(len(requests))
+            return httpx.Response(200, json={"responses": [_item(i, r) for i, r in enumerate(requests)]})
+
+        texts = [f"doc {i}" for i in range(25)]
+        progress = _Progress()
+        results = await self._client(handler).summarize_many(texts, batch_size=10, concurrency=2,
+                                                             progress=progress)
+
+        assert sorted(batches) == [5, 10, 10]
+        assert all(isinstance(result, TextResponse) for result in results)
+        assert [result.content for result in results] == [text.upper() for text in texts]
+        assert (progress.total, progress.current) == (25, 25)
+
+    @pytest.mark.asyncio
+    async def test_item_errors(self):
+        """Test that a failed item is reported without failing its batch."""
+        def handler(request):
+            requests = json.loads(request.content)["requests"]
+            return httpx.Response(200, json={"responses": [_item(i, r) for i, r in enumerate(requests)]})
+
+        results = await self._client(handler).translate_many(["ok", "fail", "ok too"], "fr")
+
+        assert isinstance(results[1], MCPError)
+        assert results[1].status_code == 400
+        assert [results[0].content, results[2].content] == ["OK", "OK TOO"]
+
+    @pytest.mark.asyncio
+    async def test_batch_failure(self):
+        """Test that a failed batch call becomes the error of its items only."""
+        def handler(request):
+            requests = json.loads(request.content)["requests"]
+            if any("doc 0" in r["context"] for r in requests):
+                return httpx.Response(401)
+            return httpx.Response(200, json={"responses": [_item(i, r) for i, r in enumerate(requests)]})
+
+        results = await self._client(handler).extract_keywords_many(
+            ["doc 0", "doc 1", "doc 2", "doc 3"], batch_size=2
+        )
+
+        assert all(isinstance(result, MCPError) for result in results[:2])
+        assert [result.content for result in results[2:]] == ["DOC 2", "DOC 3"]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self):
+        """Test that at most `concurrency` batches are in flight."""
+        active = [0]
+        peak = [0]
+
+        async def handler(request):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            requests = json.loads(request.content)["requests"]
+            return httpx.Response(200, json={"responses": [_item(i, r) for i, r in enumerate(requests)]})
+
+        results = await self._client(handler).analyze_sentiment_many(
+            [str(i) for i in range(20)], batch_size=2, concurrency=3
+        )
+
+        assert len(results) == 20
+        assert peak[0] == 3
+
+    @pytest.mark.asyncio
+    async def test_against_server(self):
+        """Test that batches are accepted by the server's batch route."""
+        server = MCPServer(ServerConfig())
+        client = TextClient(MCPClient(
+            api_key="test-api-key",
+            endpoint="http://testserver",
+            http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app)),
+        ))
+
+        results = await client.summarize_many(["first doc", "second doc"], batch_size=1, temperature=0.2)
+
+        assert all(isinstance(result, TextResponse) for result in results)
+        assert "FIRST DOC" in results[0].content
+        assert "SECOND DOC" in results[1].content
@@ -0,0 +1,215 @@
+import io
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+import httpx
+from fastapi.testclient import TestClient
+
+from mcp_sdk.client import MCPClient
+from mcp_sdk.exceptions import MCPResourceNotFoundError, MCPUploadError, MCPValidationError
+from mcp_sdk.media import MediaBody
+from mcp_sdk.models import MCPResponse, MediaHandle
+from mcp_sdk.products import audio, video
+from mcp_sdk.resources import ResourceLinks, ResourceMetadata, ResourceResponse
+from mcp_sdk.server import MCPServer, ServerConfig
+
+def _response(content):
+    return {"id": "m1", "model": "audio", "content": content,
+            "created_at": "2024-01-01T00:00:00", "usage": {}}
+
+def _setup(tmp_path, fail=None):
+    """Create a server with an upload directory and a client talking to it over ASGI."""
+    server = MCPServer(ServerConfig(upload_dir=str(tmp_path / "uploads")))
+    app = server.app
+    puts = []
+
+    async def asgi(scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "PUT":
+            puts.append(scope["path"])
+            if fail is not None and fail(scope["path"]):
+                await send({"type": "http.response.start", "status": 400, "headers": []})
+                await send({"type": "http.response.body", "body": b""})
+                return
+        await app(scope, receive, send)
+
+    client = MCPClient(
+        api_key="test-api-key",
+        endpoint="http://testserver",
+        http_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=asgi)),
+    )
+    return server, client, puts
+
+class TestMediaParts:
+    """Tests for splitting media into upload parts."""
+
+    def test_views(self):
+        """Test that memory-backed media is split into views."""
+        parts = list(MediaBody(b"abcdefgh").parts(3))
+
+        assert [(index, bytes(data)) for index, data in parts] == [(0, b"abc"), (1, b"def"), (2, b"gh")]
+        assert all(isinstance(data, memoryview) for _, data in parts)
+
+    def test_stream(self):
+        """Test that streams are read one full part at a time."""
+        class Trickle(io.RawIOBase):
+            def __init__(self, data):
+                self._data = io.BytesIO(data)
+
+            def readable(self):
+                return True
+
+            def read(self, size=-1):
+                return self._data.read(min(size, 2))
+
+        parts = list(MediaBody(Trickle(b"abcdefg")).parts(3))
+        assert parts == [(0, b"abc"), (1, b"def"), (2, b"g")]
+
+    def test_empty(self):
+        """Test that empty media is a single empty part."""
+        assert [(index, bytes(data)) for index, data in MediaBody(b"").parts(3)] == [(0, b"")]
+
+class TestUploadMedia:
+    """Tests for chunked, resumable uploads."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_parts(self, tmp_path):
+        """Test that parts are uploaded and assembled into the stored media."""
+        server, client, puts = _setup(tmp_path)
+        path = tmp_path / "talk.wav"
+        data = bytes(range(256)) * 40
+        path.write_bytes(data)
+
+        handle = await client.upload_media(path, part_size=1000, concurrency=3)
+
+        assert handle.size == len(data)
+        assert handle.filename == "talk.wav"
+        assert handle.content_type == "audio/x-wav"
+        assert len(puts) == 11
+        with server.uploads.open_media(handle.id) as f:
+            assert f.read() == data
+
+    @pytest.mark.asyncio
+    async def test_resume(self, tmp_path):
+        """Test that a failed upload can be resumed, sending only the missing parts."""
+        failing = {"on": True}
+        server, client, puts = _setup(
+            tmp_path, fail=lambda path: failing["on"] and path.endswith("/parts/2")
+        )
+        data = b"0123456789" * 50
+
+        with pytest.raises(MCPUploadError) as exc_info:
+            await client.upload_media(data, part_size=100, concurrency=1)
+        upload_id = exc_info.value.upload_id
+        assert server.uploads.status(upload_id).received_parts == [0, 1]
+
+        failing["on"] = False
+        puts.clear()
+        handle = await client.upload_media(data, upload_id=upload_id)
+
+        assert handle.id == upload_id
+        assert [path.rsplit("/", 1)[1] for path in puts] == ["2", "3", "4"]
+        with server.uploads.open_media(upload_id) as f:
+            assert f.read() == data
+
+    @pytest.mark.asyncio
+    async def test_handle_referenced_by_media_request(self, tmp_path):
+        """Test that a media request can reference an uploaded handle instead of bytes."""
+        server, client, _ = _setup(tmp_path)
+        received = {}
+
+        async def transcribe(upload, client_info):
+            received["data"] = upload.file.read()
+            return MCPResponse(**_response(f"{upload.size} bytes of {upload.content_type}"))
+
+        server.register_media_handler("transcribe", transcribe)
+        handle = await client.upload_media(b"a" * 300, content_type="audio/mpeg", part_size=128)
+
+        result = await client.send_media(b"", params={"operation": "transcribe", "media_id": handle.id})
+
+        assert result.data.content == "300 bytes of audio/mpeg"
+        assert received["data"] == b"a" * 300
+
+    @pytest.mark.asyncio
+    async def test_unknown_upload(self, tmp_path):
+        """Test that resuming an unknown upload fails."""
+        _, client, _ = _setup(tmp_path)
+        with pytest.raises(MCPResourceNotFoundError):
+            await client.upload_media(b"data", upload_id="0" * 32)
+
+class TestUploadRoutes:
+    """Tests for the server's upload endpoints."""
+
+    def test_missing_parts(self, tmp_path):
+        """Test that an upload with missing parts cannot be completed."""
+        server = MCPServer(ServerConfig(upload_dir=str(tmp_path)))
+        client = TestClient(server.app)
+        upload = client.post("/api/v1/uploads", json={"size": 10, "part_size": 5}).json()
+
+        assert client.put(f"/api/v1/uploads/{upload['id']}/parts/0", content=b"12345").status_code == 204
+        response = client.post(f"/api/v1/uploads/{upload['id']}/complete", json={"parts": 2, "size": 10})
+        assert response.status_code == 400
+        assert client.get(f"/api/v1/uploads/{upload['id']}").json()["received_parts"] == [0]
+
+    def test_part_too_large(self, tmp_path):
+        """Test that parts larger than the part size are rejected."""
+        server = MCPServer(ServerConfig(upload_dir=str(tmp_path)))
+        client = TestClient(server.app)
+        upload = client.post("/api/v1/uploads", json={"part_size": 4}).json()
+
+        response = client.put(f"/api/v1/uploads/{upload['id']}/parts/0", content=b"12345")
+        assert response.status_code == 413
+        assert client.get(f"/api/v1/uploads/{upload['id']}").json()["received_parts"] == []
+
+    def test_invalid_id(self, tmp_path):
+        """Test that malformed upload IDs are not found."""
+        client = TestClient(MCPServer(ServerConfig(upload_dir=str(tmp_path))).app)
+        assert client.get("/api/v1/uploads/..%2F..").status_code == 404
+
+class TestProductMedia:
+    """Tests for referencing uploaded media from the audio and video products."""
+
+    def _client(self, **response):
+        client = MCPClient(api_key="test-api-key", endpoint="http://testserver")
+        result = ResourceResponse[MCPResponse](
+            data=MCPResponse(**_response("text"), **response),
+            metadata=ResourceMetadata(id="m1", version="1", status="success"),
+            links=ResourceLinks(self="http://testserver/api/v1/media"),
+        )
+        client.send_media_sync = Mock(return_value=result)
+        return client
+
+    def test_handle_sent_as_media_id(self):
+        """Test that a handle is sent by id with an empty body."""
+        client = self._client()
+        handle = MediaHandle(id="u1", content_type="audio/mpeg", size=300, expires_at=datetime(2030, 1, 1))
+
+        assert audio.transcribe(handle, client=client, language="en") == "text"
+        media = client.send_media_sync.call_args.args[0]
+        params = client.send_media_sync.call_args.kwargs["params"]
+        assert media == b""
+        assert params == {"operation": "transcribe", "media_id": "u1", "language": "en"}
+
+    def test_media_id(self):
+        """Test that a media_id can be given without a handle."""
+        client = self._client(metadata={"frames": [{"index": 0}]})
+
+        assert video.extract_frames(media_id="u1", client=client, fps=1) == [{"index": 0}]
+        params = client.send_media_sync.call_args.kwargs["params"]
+        assert params == {"operation": "extract_frames", "media_id": "u1", "fps": 1}
+
+    def test_raw_media(self):
+        """Test that media that was not uploaded is sent as the body."""
+        client = self._client(metadata={"duration": 3})
+
+        assert video.analyze(b"video", client=client) == {"duration": 3}
+        assert client.send_media_sync.call_args.args[0] == b"video"
+        assert "media_id" not in client.send_media_sync.call_args.kwargs["params"]
+
+    def test_invalid(self):
+        """Test that a handle needs a client, and media and media_id exclude each other."""
+        handle = MediaHandle(id="u1", content_type="audio/mpeg", size=300, expires_at=datetime(2030, 1, 1))
+        with pytest.raises(MCPValidationError):
+            audio.transcribe(handle)
+        with pytest.raises(MCPValidationError):
+            audio.analyze(b"audio", client=self._client(), media_id="u1")
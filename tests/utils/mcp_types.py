@@ -0,0 +1,146 @@
+"""
+Minimal stand-in for ``mcp_sdk.types``.
+
+The protocol schema module is not part of this tree, so the session tests
+install these models in its place. They follow the shape of the MCP schema
+closely enough for ``BaseSession`` to parse, send and correlate messages.
+"""
+
+import sys
+import types
+from typing import Any, Dict, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+RequestId = Union[str, int]
+
+
+class RequestParams(BaseModel):
+    class Meta(BaseModel):
+        progressToken: Optional[Union[str, int]] = None
+        model_config = ConfigDict(extra="allow")
+
+    meta: Optional[Meta] = Field(alias="_meta", default=None)
+    model_config = ConfigDict(extra="allow", populate_by_name=True)
+
+
+class ErrorData(BaseModel):
+    code: int
+    message: str
+    data: Optional[Any] = None
+
+
+class JSONRPCRequest(BaseModel):
+    jsonrpc: Literal["2.0"]
+    id: RequestId
+    method: str
+    params: Optional[Dict[str, Any]] = None
+
+
+class JSONRPCNotification(BaseModel):
+    jsonrpc: Literal["2.0"]
+    method: str
+    params: Optional[Dict[str, Any]] = None
+
+
+class JSONRPCResponse(BaseModel):
+    jsonrpc: Literal["2.0"]
+    id: RequestId
+    result: Dict[str, Any]
+
+
+class JSONRPCError(BaseModel):
+    jsonrpc: Literal["2.0"]
+    id: RequestId
+    error: ErrorData
+
+
+class JSONRPCMessage(
+    RootModel[Union[JSONRPCRequest, JSONRPCNotification, JSONRPCResponse, JSONRPCError]]
+):
+    pass
+
+
+class CancelledNotificationParams(BaseModel):
+    requestId: RequestId
+    reason: Optional[str] = None
+
+
+class CancelledNotification(BaseModel):
+    method: Literal["notifications/cancelled"]
+    params: CancelledNotificationParams
+
+
+class ProgressParams(BaseModel):
+    progressToken: Union[str, int]
+    progress: float
+    total: Optional[float] = None
+
+
+class ProgressNotification(BaseModel):
+    method: Literal["notifications/progress"]
+    params: ProgressParams
+
+
+class MessageNotification(BaseModel):
+    method: Literal["notifications/message"]
+    params: Dict[str, Any]
+
+
+class PingRequest(BaseModel):
+    method: Literal["ping"]
+    params: Optional[RequestParams] = None
+
+
+class CallToolRequest(BaseModel):
+    method: Literal["tools/call"]
+    params: RequestParams
+
+
+class EmptyResult(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+
+class ClientRequest(RootModel[Union[PingRequest, CallToolRequest]]):
+    pass
+
+
+class ServerRequest(RootModel[Union[PingRequest, CallToolRequest]]):
+    pass
+
+
+class ClientNotification(
+    RootModel[Union[CancelledNotification, ProgressNotification, MessageNotification]]
+):
+    pass
+
+
+class ServerNotification(
+    RootModel[Union[CancelledNotification, ProgressNotification, MessageNotification]]
+):
+    pass
+
+
+class ClientResult(RootModel[EmptyResult]):
+    pass
+
+
+class ServerResult(RootModel[EmptyResult]):
+    pass
+
+
+class Implementation(BaseModel):
+    name: str
+    version: str
+
+
+def install() -> None:
+    """Register this module as ``mcp_sdk.types`` unless the real one exists"""
+    try:
+        import mcp_sdk.types  # noqa: F401
+    except ImportError:
+        module = types.ModuleType("mcp_sdk.types")
+        module.__dict__.update(
+            {name: value for name, value in globals().items() if not name.startswith("_")}
+        )
+        sys.modules["mcp_sdk.types"] = module